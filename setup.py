@@ -37,6 +37,7 @@ setup(
     ],
     packages=find_packages(where="src"),
     package_dir={"": "src"},
+    package_data={"apsg": ["feature/data/*.npz"]},
     install_requires=["numpy", "matplotlib", "scipy", "sqlalchemy", "pandas"],
     extras_require={
         "docs": ["sphinx", "ipykernel", "nbsphinx"],
@@ -26,6 +26,9 @@ from apsg.feature import (
     EllipsoidSet as ellipsoidset,
     OrientationTensor2Set as ortensor2set,
     OrientationTensor3Set as ortensorset,
+    Matrix3Set as matrixset,
+    DeformationGradient3Set as defgradset,
+    Stress3Set as stressset,
     ClusterSet as cluster,
 )
 from apsg.feature import (
@@ -76,6 +79,9 @@ __all__ = (
     "ellipsoidset",
     "ortensor2set",
     "ortensorset",
+    "matrixset",
+    "defgradset",
+    "stressset",
     "cluster",
     "G",
     "defgrad",
@@ -7,6 +7,8 @@ apsg_conf = dict(
     figsize=(8, 6),  # Default figure size
     dpi=100,  # Default figure dpi
     facecolor="white",  # Default figure facecolor
+    max_memory=2**27,  # Memory budget in bytes for blockwise calculations
+    estimate_k_max_n=1000,  # Max number of features used to estimate density kernel
     stereonet_default_kwargs=dict(
         kind="equal-area",
         overlay_position=(0, 0, 0, 0),
@@ -177,6 +179,7 @@ apsg_conf = dict(
         ls="-",
         lw=1.5,
         n_resamples=9999,
+        seed=None,
     ),
     fabricplot_default_kwargs=dict(
         ticks=True,
@@ -14,6 +14,9 @@ from apsg.feature._container import (
     EllipsoidSet,
     OrientationTensor2Set,
     OrientationTensor3Set,
+    Matrix3Set,
+    DeformationGradient3Set,
+    Stress3Set,
     G,
     ClusterSet,
 )
@@ -32,6 +35,23 @@ from apsg.feature._tensor2 import (
     OrientationTensor2,
 )
 from apsg.feature._paleomag import Core
+from apsg.feature._paleostress import stress_inversion
+from apsg.feature._hypothesis import (
+    rayleigh_test,
+    bingham_test,
+    gine_test,
+    watson_two_sample,
+)
+from apsg.feature._statistics import (
+    OrientationTensor3Accumulator,
+    FisherAccumulator,
+    KentDistribution,
+    kent_log_normalize,
+    WatsonDistribution,
+    watson_log_normalize,
+    BinghamDistribution,
+    bingham_log_normalize,
+)
 
 __all__ = (
     "Lineation",
@@ -61,9 +81,25 @@ __all__ = (
     "EllipsoidSet",
     "OrientationTensor2Set",
     "OrientationTensor3Set",
+    "Matrix3Set",
+    "DeformationGradient3Set",
+    "Stress3Set",
     "G",
     "ClusterSet",
     "Core",
+    "stress_inversion",
+    "rayleigh_test",
+    "bingham_test",
+    "gine_test",
+    "watson_two_sample",
+    "OrientationTensor3Accumulator",
+    "FisherAccumulator",
+    "KentDistribution",
+    "kent_log_normalize",
+    "WatsonDistribution",
+    "watson_log_normalize",
+    "BinghamDistribution",
+    "bingham_log_normalize",
 )
 
 
@@ -1,4 +1,5 @@
 import sys
+import warnings
 from itertools import combinations
 import numpy as np
 import matplotlib.pyplot as plt
@@ -6,12 +7,35 @@ from scipy.stats import vonmises
 from scipy.cluster.hierarchy import linkage, fcluster, dendrogram
 
 from apsg.config import apsg_conf
-from apsg.math._vector import Vector2, Vector3
-from apsg.helpers._math import acosd
+from apsg.math._vector import Vector2, Vector3, Axial2, Axial3
+from apsg.math._matrix import Matrix3
+from apsg.math._rotation import axisangle_matrix
+from apsg.helpers._math import acosd, pdist_angles, _unit_rows
+from apsg.helpers._helper import _random_state
+from apsg.helpers._notation import (
+    geo2vec_planar_array,
+    geo2vec_linear_array,
+    vec2geo_planar_array,
+    vec2geo_linear_array,
+    vec2geo_linear_signed_array,
+)
 from apsg.feature._geodata import Lineation, Foliation, Pair, Fault, Cone
-from apsg.feature._tensor3 import OrientationTensor3, Ellipsoid
+from apsg.feature._tensor3 import (
+    OrientationTensor3,
+    Ellipsoid,
+    DeformationGradient3,
+    Stress3,
+    _stress_components,
+    _slip_tendency,
+    _dilation_tendency,
+)
 from apsg.feature._tensor2 import OrientationTensor2, Ellipse
-from apsg.feature._statistics import KentDistribution, vonMisesFisher
+from apsg.feature._statistics import (
+    KentDistribution,
+    WatsonDistribution,
+    BinghamDistribution,
+    vonMisesFisher,
+)
 
 
 class FeatureSet:
@@ -29,13 +53,40 @@ class FeatureSet:
         # cast to correct instances
         self.data = tuple([dtype_cls(d) for d in data])
         self.name = name
-        self._cache = {}
+        self._cache = _StatsCache()
+
+    @classmethod
+    def _from_array(cls, data, name="Default"):
+        """Create ``FeatureSet`` from trusted data skipping validation and casting.
+
+        Intended for library code only. Data must be a sequence of instances of
+        the feature type of the ``FeatureSet``. Array backed sets accept array
+        of components.
+        """
+        obj = cls.__new__(cls)
+        obj.data = tuple(data)
+        obj.name = name
+        obj._cache = _StatsCache()
+        return obj
 
     def __copy__(self):
-        return type(self)(list(self.data), name=self.name)
+        return type(self)._from_array(self.data, name=self.name)
 
     copy = __copy__
 
+    def cache_info(self):
+        """Return dictionary with hits, misses and number of cached derived statistics.
+
+        Features in ``FeatureSet`` are immutable, so derived statistics like
+        resultant, Fisher's statistics or orientation tensor are calculated
+        only once and shared by all methods which need them.
+        """
+        return {
+            "hits": self._cache.hits,
+            "misses": self._cache.misses,
+            "currsize": len(self._cache),
+        }
+
     def to_json(self):
         """Return as JSON dict"""
         return {
@@ -48,7 +99,7 @@ class FeatureSet:
         """Return label"""
         return self.name
 
-    def __array__(self, dtype=None):
+    def __array__(self, dtype=None, copy=None):
         return np.array([np.array(p) for p in self.data], dtype=dtype)
 
     def __eq__(self, other):
@@ -65,13 +116,15 @@ class FeatureSet:
 
     def __getitem__(self, key):
         if isinstance(key, slice):
-            return type(self)(self.data[key])
+            return type(self)._from_array(self.data[key], name=self.name)
         # elif isinstance(key, int):
         elif np.issubdtype(type(key), np.integer):
             return self.data[key]
         elif isinstance(key, np.ndarray):  # fancy indexing
             idxs = np.arange(len(self.data), dtype=int)[key]
-            return type(self)([self.data[ix] for ix in idxs])
+            return type(self)._from_array(
+                [self.data[ix] for ix in idxs], name=self.name
+            )
         else:
             raise TypeError(
                 "Wrong index. Only slice, int and np.array are allowed for indexing."
@@ -82,20 +135,24 @@ class FeatureSet:
 
     def __add__(self, other):
         if isinstance(other, type(self)):
-            return type(self)(self.data + other.data, name=self.name)
+            return type(self)._from_array(self.data + other.data, name=self.name)
         else:
             raise TypeError("Only {self.__name__} is allowed")
 
     def rotate(self, axis, phi):
         """Rotate ``FeatureSet`` object `phi` degress about `axis`."""
-        return type(self)([e.rotate(axis, phi) for e in self], name=self.name)
+        return type(self)._from_array(
+            [e.rotate(axis, phi) for e in self], name=self.name
+        )
 
-    def bootstrap(self, n=100, size=None):
+    def bootstrap(self, n=100, size=None, seed=None):
         """Return generator of bootstraped samples from ``FeatureSet``.
 
         Args:
           n: number of samples to be generated. Default 100.
           size: number of data in sample. Default is same as ``FeatureSet``.
+          seed: None (global numpy random state), int, ``np.random.SeedSequence``
+            or ``np.random.Generator``. Default None
 
         Example:
           >>> np.random.seed(6034782)
@@ -108,8 +165,9 @@ class FeatureSet:
         """
         if size is None:
             size = len(self)
+        rng = _random_state(seed)
         for i in range(n):
-            yield self[np.random.choice(range(len(self)), size)]
+            yield self[rng.choice(len(self), size)]
 
 
 class Vector2Set(FeatureSet):
@@ -169,16 +227,27 @@ class Vector2Set(FeatureSet):
 
     __pow__ = cross
 
-    def angle(self, other=None):
+    def angle(self, other=None, dtype=np.float64, max_memory=None):
         """Return angles of all data in ``Vector2Set`` object
 
-        Without arguments it returns angles of all pairs in dataset.
-        If argument is ``Vector2Set`` of same length or single data object
-        element-wise angles are calculated.
+        Without arguments it returns angles of all pairs in dataset as condensed
+        distance matrix. If argument is ``Vector2Set`` of same length or single
+        data object element-wise angles are calculated.
+
+        Keyword Args:
+          dtype: dtype of angles of all pairs, e.g. np.float32. Default np.float64
+          max_memory: memory budget in bytes for calculation of angles of all
+            pairs. Default is ``apsg_conf["max_memory"]``
         """
         res = []
         if other is None:
-            res = [e.angle(f) for e, f in combinations(self.data, 2)]
+            dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
+            return pdist_angles(
+                np.asarray(self),
+                axial=issubclass(dtype_cls, Axial2),
+                dtype=dtype,
+                max_memory=max_memory,
+            )
         elif issubclass(type(other), FeatureSet):
             res = [e.angle(f) for e, f in zip(self, other)]
         elif issubclass(type(other), Vector3):
@@ -189,7 +258,7 @@ class Vector2Set(FeatureSet):
 
     def normalized(self):
         """Return ``Vector2Set`` object with normalized (unit length) elements."""
-        return type(self)([e.normalized() for e in self], name=self.name)
+        return type(self)._from_array([e.normalized() for e in self], name=self.name)
 
     uv = normalized
 
@@ -203,7 +272,9 @@ class Vector2Set(FeatureSet):
           norm: normalize transformed features. True or False. Default False
 
         """
-        return type(self)([e.transform(F, **kwargs) for e in self], name=self.name)
+        return type(self)._from_array(
+            [e.transform(F, **kwargs) for e in self], name=self.name
+        )
 
     def R(self, mean=False):
         """Return resultant of data in ``Vector2Set`` object.
@@ -216,11 +287,15 @@ class Vector2Set(FeatureSet):
         Args:
             mean: if True returns mean resultant. Default False
         """
-        R = sum(self)
+        R = self._cache.get_or_compute("R", lambda: sum(self))
         if mean:
             R = R / len(self)
         return R
 
+    @property
+    def _normalized_R(self):
+        return self._cache.get_or_compute("normalized_R", lambda: self.normalized().R())
+
     def fisher_statistics(self):
         """Fisher's statistics
 
@@ -229,9 +304,12 @@ class Vector2Set(FeatureSet):
             `csd`  estimated angular standard deviation
             `a95`  confidence limit
         """
+        return dict(self._cache.get_or_compute("fisher", self._fisher_statistics))
+
+    def _fisher_statistics(self):
         stats = {"k": np.inf, "a95": 0, "csd": 0}
         N = len(self)
-        R = abs(self.normalized().R())
+        R = abs(self._normalized_R)
         if N != R:
             stats["k"] = (N - 1) / (N - R)
             stats["csd"] = 81 / np.sqrt(stats["k"])
@@ -243,7 +321,7 @@ class Vector2Set(FeatureSet):
 
         var = 1 - abs(R) / n
         """
-        return 1 - abs(self.normalized().R(mean=True))
+        return 1 - abs(self._normalized_R / len(self))
 
     def delta(self):
         """Cone angle containing ~63% of the data in degrees.
@@ -259,7 +337,7 @@ class Vector2Set(FeatureSet):
         D = 100 * (2 * abs(R) - n) / n
         """
         N = len(self)
-        return 100 * (2 * abs(self.normalized().R()) - N) / N
+        return 100 * (2 * abs(self._normalized_R) - N) / N
 
     def ortensor(self):
         """Return orientation tensor ``Ortensor`` of ``Group``."""
@@ -268,15 +346,13 @@ class Vector2Set(FeatureSet):
 
     @property
     def _ortensor(self):
-        if "ortensor" not in self._cache:
-            self._cache["ortensor"] = OrientationTensor2.from_features(self)
-        return self._cache["ortensor"]
+        return self._cache.get_or_compute(
+            "ortensor", lambda: OrientationTensor2.from_features(self)
+        )
 
     @property
     def _svd(self):
-        if "svd" not in self._cache:
-            self._cache["svd"] = np.linalg.svd(self._ortensor)
-        return self._cache["svd"]
+        return self._cache.get_or_compute("svd", lambda: np.linalg.svd(self._ortensor))
 
     def halfspace(self):
         """Change orientation of vectors in ``Vector2Set``, so all have angle<=90 with
@@ -284,17 +360,10 @@ class Vector2Set(FeatureSet):
 
         """
         dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
-        v = Vector3Set(self)
-        v_data = list(v)
-        alldone = np.all(v.angle(v.R()) <= 90)
-        while not alldone:
-            ang = v.angle(v.R())
-            for ix, do in enumerate(ang > 90):
-                if do:
-                    v_data[ix] = -v_data[ix]
-                v = Vector3Set(v_data)
-                alldone = np.all(v.angle(v.R()) <= 90)
-        return type(self)([dtype_cls(vec) for vec in v], name=self.name)
+        a = _halfspace(np.asarray(self, dtype=float).reshape(-1, 2))
+        return type(self)._from_array(
+            [dtype_cls(x, y) for x, y in a.tolist()], name=self.name
+        )
 
     @classmethod
     def from_direction(cls, angles, name="Default"):
@@ -310,7 +379,7 @@ class Vector2Set(FeatureSet):
           >>> f = vec2set.from_angles([120,130,140,125, 132. 131])
         """
         dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
-        return cls([dtype_cls(a) for a in angles], name=name)
+        return cls._from_array([dtype_cls(a) for a in angles], name=name)
 
     @classmethod
     def from_xy(cls, x, y, name="Default"):
@@ -328,16 +397,18 @@ class Vector2Set(FeatureSet):
                                   [0.75, 0.25, 0.60141061])
         """
         dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
-        return cls([dtype_cls(xx, yy) for xx, yy in zip(x, y)], name=name)
+        return cls._from_array([dtype_cls(xx, yy) for xx, yy in zip(x, y)], name=name)
 
     @classmethod
-    def random(cls, n=100, name="Default"):
+    def random(cls, n=100, name="Default", seed=None):
         """Method to create ``Vector2Set`` of features with uniformly distributed
         random orientation.
 
         Keyword Args:
           n: number of objects to be generated
           name: name of dataset. Default is 'Default'
+          seed: None (global numpy random state), int, ``np.random.SeedSequence``
+            or ``np.random.Generator``. Default None
 
         Example:
           >>> np.random.seed(58463123)
@@ -345,10 +416,11 @@ class Vector2Set(FeatureSet):
 
         """
         dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
-        return cls([dtype_cls.random() for i in range(n)], name=name)
+        angles = 360 * _random_state(seed).random(n)
+        return cls._from_array([dtype_cls(a) for a in angles], name=name)
 
     @classmethod
-    def random_vonmises(cls, n=100, position=0, kappa=5, name="Default"):
+    def random_vonmises(cls, n=100, position=0, kappa=5, name="Default", seed=None):
         """Return ``Vector2Set`` of random vectors sampled from von Mises distribution
         around center position with concentration kappa.
 
@@ -357,75 +429,194 @@ class Vector2Set(FeatureSet):
           position: mean orientation given as angle. Default 0
           kappa: precision parameter of the distribution. Default 20
           name: name of dataset. Default is 'Default'
+          seed: None (global numpy random state), int, ``np.random.SeedSequence``
+            or ``np.random.Generator``. Default None
 
         Example:
           >>> l = linset.random_fisher(position=lin(120,50))
         """
         dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
-        angles = np.degrees(vonmises.rvs(kappa, loc=np.radians(position), size=n))
-        return cls([dtype_cls(a) for a in angles], name=name)
+        angles = np.degrees(
+            vonmises.rvs(
+                kappa,
+                loc=np.radians(position),
+                size=n,
+                random_state=_random_state(seed),
+            )
+        )
+        return cls._from_array([dtype_cls(a) for a in angles], name=name)
 
 
 class Vector3Set(FeatureSet):
     """
     Class to store set of ``Vector3`` features
+
+    Features are stored as single read-only (N, 3) array of components. Individual
+    ``Vector3`` like objects are created only on integer indexing or iteration.
     """
 
     __feature_type__ = "Vector3"
 
+    def __init__(self, data, name="Default"):
+        dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
+        if isinstance(data, Vector3Set):
+            # buffers are read-only, so they could be shared
+            other_cls = getattr(sys.modules[__name__], type(data).__feature_type__)
+            assert issubclass(
+                other_cls, dtype_cls
+            ), f"Data must be instances of {type(self).__feature_type__}"
+            arr = data._data
+        else:
+            assert all(
+                [isinstance(obj, dtype_cls) for obj in data]
+            ), f"Data must be instances of {type(self).__feature_type__}"
+            arr = np.array([obj._coords for obj in data], dtype=float).reshape(-1, 3)
+            arr.flags.writeable = False
+        self._data = arr
+        self.name = name
+        self._cache = _StatsCache()
+
+    @classmethod
+    def _from_array(cls, arr, name="Default"):
+        """Create ``FeatureSet`` directly from (N, 3) array without validation"""
+        obj = cls.__new__(cls)
+        obj._data = _frozen_array(arr, (-1, 3))
+        obj.name = name
+        obj._cache = _StatsCache()
+        return obj
+
+    def __copy__(self):
+        return type(self)._from_array(self._data, name=self.name)
+
+    copy = __copy__
+
+    @property
+    def data(self):
+        """Return tuple of features"""
+        return tuple(self)
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is not None and np.dtype(dtype) != self._data.dtype:
+            return self._data.astype(dtype)
+        if copy:
+            return self._data.copy()
+        return self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return type(self)._from_array(self._data[key], name=self.name)
+        elif np.issubdtype(type(key), np.integer):
+            dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
+            return dtype_cls(*self._data[key].tolist())
+        elif isinstance(key, np.ndarray):  # fancy indexing
+            return type(self)._from_array(self._data[key], name=self.name)
+        else:
+            raise TypeError(
+                "Wrong index. Only slice, int and np.array are allowed for indexing."
+            )
+
+    def __iter__(self):
+        dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
+        for row in self._data.tolist():
+            yield dtype_cls(*row)
+
+    def __add__(self, other):
+        if isinstance(other, type(self)):
+            return type(self)._from_array(
+                np.concatenate((self._data, other._data)), name=self.name
+            )
+        else:
+            raise TypeError("Only {self.__name__} is allowed")
+
     def __repr__(self):
         return f"V3({len(self)}) {self.name}"
 
     def __abs__(self):
         """Returns array of euclidean norms"""
-        return np.asarray([abs(e) for e in self])
+        return np.linalg.norm(self._data, axis=1)
 
     @property
     def x(self):
         """Return numpy array of x-components"""
-        return np.array([e.x for e in self])
+        return self._data[:, 0].copy()
 
     @property
     def y(self):
         """Return numpy array of y-components"""
-        return np.array([e.y for e in self])
+        return self._data[:, 1].copy()
 
     @property
     def z(self):
         """Return numpy array of z-components"""
-        return np.array([e.z for e in self])
+        return self._data[:, 2].copy()
 
     @property
     def geo(self):
         """Return arrays of azi and inc according to apsg_conf['notation']"""
-        azi, inc = np.asarray([e.geo for e in self]).T
-        return azi, inc
+        dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
+        if issubclass(dtype_cls, Foliation):
+            return vec2geo_planar_array(self._data)
+        elif issubclass(dtype_cls, Lineation):
+            return vec2geo_linear_array(self._data)
+        else:
+            return vec2geo_linear_signed_array(self._data)
 
     def to_lin(self):
         """Return ``LineationSet`` object with all data converted to ``Lineation``."""
-        return LineationSet([Lineation(e) for e in self], name=self.name)
+        return LineationSet._from_array(self._data, name=self.name)
 
     def to_fol(self):
         """Return ``FoliationSet`` object with all data converted to ``Foliation``."""
-        return FoliationSet([Foliation(e) for e in self], name=self.name)
+        return FoliationSet._from_array(self._data, name=self.name)
 
     def to_vec(self):
         """Return ``Vector3Set`` object with all data converted to ``Vector3``."""
-        return Vector3Set([Vector3(e) for e in self], name=self.name)
+        return Vector3Set._from_array(self._data, name=self.name)
+
+    @property
+    def _axial(self):
+        dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
+        return issubclass(dtype_cls, Axial3)
 
     def project(self, vec):
         """Return projections of all features in ``FeatureSet`` onto vector."""
-        return type(self)([e.project(vec) for e in self], name=self.name)
+        n = _unit_rows(_vector3_arg(vec, "project"))
+        d = self._data @ n
+        if self._axial:
+            d = np.abs(d)
+        return type(self)._from_array(d[:, None] * n, name=self.name)
 
     proj = project
 
     def reject(self, vec):
         """Return rejections of all features in ``FeatureSet`` onto vector."""
-        return type(self)([e.reject(vec) for e in self], name=self.name)
+        n = _unit_rows(_vector3_arg(vec, "reject"))
+        return type(self)._from_array(
+            self._data - (self._data @ n)[:, None] * n, name=self.name
+        )
 
     def dot(self, vec):
         """Return array of dot products of all features in ``FeatureSet`` with vector."""
-        return np.array([e.dot(vec) for e in self])
+        d = self._data @ _vector3_arg(vec, "dot")
+        if self._axial:
+            d = np.abs(d)
+        return d
+
+    def _paired(self, other):
+        """Return arrays of element-wise or all pairs operands"""
+        if other is None:
+            i, j = np.triu_indices(len(self), k=1)
+            return self._data[i], self._data[j]
+        elif issubclass(type(other), FeatureSet):
+            n = min(len(self), len(other))
+            return self._data[:n], np.asarray(other, dtype=float)[:n]
+        elif issubclass(type(other), Vector3):
+            return self._data, np.asarray(other, dtype=float)
+        else:
+            raise TypeError("Wrong argument type!")
 
     def cross(self, other=None):
         """Return cross products of all features in ``FeatureSet``
@@ -434,40 +625,37 @@ class Vector3Set(FeatureSet):
         If argument is ``FeatureSet`` of same length or single data object
         element-wise cross-products are calculated.
         """
-        res = []
-        if other is None:
-            res = [e.cross(f) for e, f in combinations(self.data, 2)]
-        elif issubclass(type(other), FeatureSet):
-            res = [e.cross(f) for e, f in zip(self, other)]
-        elif issubclass(type(other), Vector3):
-            res = [e.cross(other) for e in self]
-        else:
-            raise TypeError("Wrong argument type!")
-        return G(res, name=self.name)
+        a, b = self._paired(other)
+        return Vector3Set._from_array(np.cross(a, b), name=self.name)
 
     __pow__ = cross
 
-    def angle(self, other=None):
+    def angle(self, other=None, dtype=np.float64, max_memory=None):
         """Return angles of all data in ``FeatureSet`` object
 
-        Without arguments it returns angles of all pairs in dataset.
+        Without arguments it returns angles of all pairs in dataset as condensed
+        distance matrix, which could be passed to ``scipy.cluster.hierarchy``.
         If argument is ``FeatureSet`` of same length or single data object
         element-wise angles are calculated.
+
+        Keyword Args:
+          dtype: dtype of angles of all pairs, e.g. np.float32. Default np.float64
+          max_memory: memory budget in bytes for calculation of angles of all
+            pairs. Default is ``apsg_conf["max_memory"]``
         """
-        res = []
         if other is None:
-            res = [e.angle(f) for e, f in combinations(self.data, 2)]
-        elif issubclass(type(other), FeatureSet):
-            res = [e.angle(f) for e, f in zip(self, other)]
-        elif issubclass(type(other), Vector3):
-            res = [e.angle(other) for e in self]
-        else:
-            raise TypeError("Wrong argument type!")
-        return np.asarray(res)
+            return pdist_angles(
+                self._data, axial=self._axial, dtype=dtype, max_memory=max_memory
+            )
+        a, b = self._paired(other)
+        d = np.sum(_unit_rows(a) * _unit_rows(b), axis=-1)
+        if self._axial:
+            d = np.abs(d)
+        return np.degrees(np.arccos(np.clip(d, -1, 1)))
 
     def normalized(self):
         """Return ``FeatureSet`` object with normalized (unit length) elements."""
-        return type(self)([e.normalized() for e in self], name=self.name)
+        return type(self)._from_array(_unit_rows(self._data), name=self.name)
 
     uv = normalized
 
@@ -476,19 +664,33 @@ class Vector3Set(FeatureSet):
 
         Args:
           F: Transformation matrix. Array-like value e.g. ``DeformationGradient3``
+            or ``Matrix3Set`` of same length to transform each feature by its own
+            matrix.
 
         Keyword Args:
           norm: normalize transformed features. True or False. Default False
 
         """
-        return type(self)([e.transform(F, **kwargs) for e in self], name=self.name)
+        F = np.asarray(F, dtype=float)
+        if F.ndim == 3:
+            r = _matvec(F, self._data)
+        else:
+            r = self._data @ F.T
+        if kwargs.get("norm", False):
+            r = _unit_rows(r)
+        return type(self)._from_array(r, name=self.name)
+
+    def rotate(self, axis, phi):
+        """Rotate ``FeatureSet`` object `phi` degress about `axis`."""
+        R = axisangle_matrix(_vector3_arg(axis, "rotate"), phi)
+        return type(self)._from_array(self._data @ R.T, name=self.name)
 
     def is_upper(self):
         """
         Return boolean array of z-coordinate negative test
         """
 
-        return np.asarray([e.is_upper() for e in self])
+        return self._data[:, 2] < 0
 
     def R(self, mean=False):
         """Return resultant of data in ``FeatureSet`` object.
@@ -501,11 +703,28 @@ class Vector3Set(FeatureSet):
         Args:
             mean: if True returns mean resultant. Default False
         """
-        R = sum(self)
+        R = self._cache.get_or_compute("R", self._resultant)
         if mean:
             R = R / len(self)
         return R
 
+    def _resultant(self):
+        dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
+        if self._axial:
+            # same as sum of features, axial addition flips opposite vectors
+            x = y = z = 0.0
+            for a, b, c in self._data.tolist():
+                if x * a + y * b + z * c < 0:
+                    x, y, z = x - a, y - b, z - c
+                else:
+                    x, y, z = x + a, y + b, z + c
+            return dtype_cls(x, y, z)
+        return dtype_cls(*self._data.sum(axis=0).tolist())
+
+    @property
+    def _normalized_R(self):
+        return self._cache.get_or_compute("normalized_R", lambda: self.normalized().R())
+
     def fisher_statistics(self):
         """Fisher's statistics
 
@@ -514,9 +733,12 @@ class Vector3Set(FeatureSet):
             `csd`  estimated angular standard deviation
             `a95`  confidence limit
         """
+        return dict(self._cache.get_or_compute("fisher", self._fisher_statistics))
+
+    def _fisher_statistics(self):
         stats = {"k": np.inf, "a95": 0, "csd": 0}
         N = len(self)
-        R = abs(self.normalized().R())
+        R = abs(self._normalized_R)
         if N != R:
             stats["k"] = (N - 1) / (N - R)
             stats["csd"] = 81 / np.sqrt(stats["k"])
@@ -528,23 +750,70 @@ class Vector3Set(FeatureSet):
 
         Cone axis is resultant and apical angle is a95 confidence limit
         """
-        stats = self.fisher_statistics()
-        return Cone(self.normalized().R(), stats["a95"])
+        stats = self._cache.get_or_compute("fisher", self._fisher_statistics)
+        return Cone(self._normalized_R, stats["a95"])
 
     def fisher_cone_csd(self):
         """Angular standard deviation cone based on Fisher's statistics
 
         Cone axis is resultant and apical angle is angular standard deviation
         """
-        stats = self.fisher_statistics()
-        return Cone(self.normalized().R(), stats["csd"])
+        stats = self._cache.get_or_compute("fisher", self._fisher_statistics)
+        return Cone(self._normalized_R, stats["csd"])
+
+    def fit_kent(self, method="mle"):
+        """Return ``KentDistribution`` fitted to data.
+
+        Axes are estimated by moment method (Kent, 1982), kappa and beta are
+        maximum likelihood estimates for method "mle" or moment estimates for
+        method "moment".
+
+        Keyword Args:
+          method: "mle" or "moment". Default "mle"
+
+        Example:
+          >>> g = linset.random_kent(pair(150, 40, 150, 40), kappa=30, beta=10)
+          >>> kd = g.fit_kent()
+          >>> kd.kappa, kd.beta
+        """
+        return KentDistribution.fit(self._data, method=method)
+
+    def fit_watson(self, kind=None):
+        """Return maximum likelihood ``WatsonDistribution`` fitted to data.
+
+        Axis and concentration are estimated from eigenvalues and eigenvectors
+        of orientation tensor of normalized data.
+
+        Keyword Args:
+          kind: "bipolar", "girdle" or None. When None, kind with higher
+            likelihood is used. Default None
+
+        Example:
+          >>> g = folset.random_watson(position=lin(120, 40), kappa=-30)
+          >>> wd = g.fit_watson()
+          >>> wd.mu, wd.kappa
+        """
+        return WatsonDistribution.fit(self._data, kind=kind)
+
+    def fit_bingham(self):
+        """Return maximum likelihood ``BinghamDistribution`` fitted to data.
+
+        Axes and concentrations are estimated from eigenvalues and eigenvectors
+        of orientation tensor of normalized data.
+
+        Example:
+          >>> g = folset.random_bingham(pair(150, 40, 150, 40), kappa2=5, kappa3=50)
+          >>> bd = g.fit_bingham()
+          >>> bd.kappa2, bd.kappa3
+        """
+        return BinghamDistribution.fit(self._data)
 
     def var(self):
         """Spherical variance based on resultant length (Mardia 1972).
 
         var = 1 - abs(R) / n
         """
-        return 1 - abs(self.normalized().R(mean=True))
+        return 1 - abs(self._normalized_R / len(self))
 
     def delta(self):
         """Cone angle containing ~63% of the data in degrees.
@@ -560,23 +829,97 @@ class Vector3Set(FeatureSet):
         D = 100 * (2 * abs(R) - n) / n
         """
         N = len(self)
-        return 100 * (2 * abs(self.normalized().R()) - N) / N
+        return 100 * (2 * abs(self._normalized_R) - N) / N
 
     def ortensor(self):
         """Return orientation tensor ``Ortensor`` of ``Group``."""
         return self._ortensor
 
+    def bootstrap_statistics(self, n=100, size=None, max_memory=None, seed=None):
+        """Return statistics of bootstraped samples from ``FeatureSet``.
+
+        Samples are drawn as (n, size) index matrix and statistics are
+        calculated as stacked array operations. Samples are processed in chunks
+        to keep memory within budget. Samples are the same as generated by
+        ``bootstrap`` method with the same random state.
+
+        Args:
+          n: number of samples to be generated. Default 100.
+          size: number of data in sample. Default is same as ``FeatureSet``.
+          max_memory: memory budget in bytes. Default is ``apsg_conf["max_memory"]``
+          seed: None (global numpy random state), int, ``np.random.SeedSequence``
+            or ``np.random.Generator``. Default None
+
+        Returns dictionary with keys:
+            `R`             ``FeatureSet`` of sample resultants
+            `k`             array of estimated precision parameters
+            `a95`           array of confidence limits
+            `csd`           array of estimated angular standard deviations
+            `ortensor`      (n, 3, 3) array of orientation tensors
+            `eigenvalues`   (n, 3) array of sorted eigenvalues
+            `eigenvectors`  (n, 3, 3) array with eigenvectors in rows
+
+        Example:
+          >>> l = linset.random_fisher(n=100, position=lin(120,40))
+          >>> bs = l.bootstrap_statistics(n=1000)
+          >>> bs["R"].fisher_statistics()  #doctest: +SKIP
+        """
+        if size is None:
+            size = len(self)
+        if max_memory is None:
+            max_memory = apsg_conf["max_memory"]
+        N = len(self)
+        # counts, indexes and axial samples per replicate
+        chunk = max(1, int(max_memory // (16 * N + 56 * size)))
+        u = _unit_rows(self._data)
+        outer = (self._data[:, :, None] * self._data[:, None, :]).reshape(-1, 9)
+        rng = _random_state(seed)
+        R, Rn, ot = [], [], []
+        for start in range(0, n, chunk):
+            m = min(chunk, n - start)
+            idx = rng.choice(N, (m, size))
+            # number of occurences of each feature in each replicate
+            w = np.bincount((idx + N * np.arange(m)[:, None]).ravel(), minlength=m * N)
+            w = w.reshape(m, N).astype(float)
+            if self._axial:
+                R.append(_resultants(self._data[idx], True))
+                Rn.append(_resultants(u[idx], True))
+            else:
+                R.append(w @ self._data)
+                Rn.append(w @ u)
+            ot.append(w @ outer / size)
+        R = np.concatenate(R).reshape(-1, 3)
+        Rn = np.linalg.norm(np.concatenate(Rn).reshape(-1, 3), axis=1)
+        ot = np.concatenate(ot).reshape(-1, 3, 3)
+        k = np.full(n, np.inf)
+        a95 = np.zeros(n)
+        csd = np.zeros(n)
+        ix = Rn != size
+        if size > 1:
+            k[ix] = (size - 1) / (size - Rn[ix])
+            csd[ix] = 81 / np.sqrt(k[ix])
+            c = 1 - ((size - Rn[ix]) / Rn[ix]) * (20 ** (1 / (size - 1)) - 1)
+            a95[ix] = np.degrees(np.arccos(np.clip(c, -1, 1)))
+        evals, evecs = np.linalg.eigh(ot)
+        return {
+            "R": type(self)._from_array(R, name=self.name),
+            "k": k,
+            "a95": a95,
+            "csd": csd,
+            "ortensor": ot,
+            "eigenvalues": evals[:, ::-1],
+            "eigenvectors": np.swapaxes(evecs[:, :, ::-1], 1, 2),
+        }
+
     @property
     def _ortensor(self):
-        if "ortensor" not in self._cache:
-            self._cache["ortensor"] = OrientationTensor3.from_features(self)
-        return self._cache["ortensor"]
+        return self._cache.get_or_compute(
+            "ortensor", lambda: OrientationTensor3.from_features(self)
+        )
 
     @property
     def _svd(self):
-        if "svd" not in self._cache:
-            self._cache["svd"] = np.linalg.svd(self._ortensor)
-        return self._cache["svd"]
+        return self._cache.get_or_compute("svd", lambda: np.linalg.svd(self._ortensor))
 
     def centered(self, max_vertical=False):
         """Rotate ``FeatureSet`` object to position that eigenvectors are parallel
@@ -588,7 +931,8 @@ class Vector3Set(FeatureSet):
 
         """
         if max_vertical:
-            return self.transform(self._svd[2]).rotate(Vector3(0, -1, 0), 90)
+            R = axisangle_matrix(Vector3(0, -1, 0), 90)
+            return self.transform(R @ self._svd[2])
         else:
             return self.transform(self._svd[2])
 
@@ -597,18 +941,7 @@ class Vector3Set(FeatureSet):
         resultant.
 
         """
-        dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
-        v = Vector3Set(self)
-        v_data = list(v)
-        alldone = np.all(v.angle(v.R()) <= 90)
-        while not alldone:
-            ang = v.angle(v.R())
-            for ix, do in enumerate(ang > 90):
-                if do:
-                    v_data[ix] = -v_data[ix]
-                v = Vector3Set(v_data)
-                alldone = np.all(v.angle(v.R()) <= 90)
-        return type(self)([dtype_cls(vec) for vec in v], name=self.name)
+        return type(self)._from_array(_halfspace(self._data), name=self.name)
 
     @classmethod
     def from_csv(cls, filename, acol=0, icol=1):
@@ -673,9 +1006,9 @@ class Vector3Set(FeatureSet):
             fieldnames = ["azi", "inc"]
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
-            for dt in self:
-                azi, inc = dt.geo
-                writer.writerow({"azi": round(azi, n), "inc": round(inc, n)})
+            azis, incs = self.geo
+            for azi, inc in zip(np.round(azis, n).tolist(), np.round(incs, n).tolist()):
+                writer.writerow({"azi": azi, "inc": inc})
 
     @classmethod
     def from_array(cls, azis, incs, name="Default"):
@@ -693,7 +1026,11 @@ class Vector3Set(FeatureSet):
           >>> l = linset.from_array([120,130,140], [10,20,30])
         """
         dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
-        return cls([dtype_cls(azi, inc) for azi, inc in zip(azis, incs)], name=name)
+        if issubclass(dtype_cls, Foliation):
+            dc = geo2vec_planar_array(azis, incs)
+        else:
+            dc = geo2vec_linear_array(azis, incs)
+        return cls._from_array(dc, name=name)
 
     @classmethod
     def from_xyz(cls, x, y, z, name="Default"):
@@ -712,11 +1049,12 @@ class Vector3Set(FeatureSet):
                                   [0.75, 0.25, 0.60141061],
                                   [0.5, 0.8660254, 0.43837115])
         """
-        dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
-        return cls([dtype_cls(xx, yy, zz) for xx, yy, zz in zip(x, y, z)], name=name)
+        return cls._from_array(np.column_stack((x, y, z)), name=name)
 
     @classmethod
-    def random_normal(cls, n=100, position=Vector3(0, 0, 1), sigma=20, name="Default"):
+    def random_normal(
+        cls, n=100, position=Vector3(0, 0, 1), sigma=20, name="Default", seed=None
+    ):
         """Method to create ``FeatureSet`` of normaly distributed features.
 
         Keyword Args:
@@ -724,6 +1062,8 @@ class Vector3Set(FeatureSet):
           position: mean orientation given as ``Vector3``. Default Vector3(0, 0, 1)
           sigma: sigma of normal distribution. Default 20
           name: name of dataset. Default is 'Default'
+          seed: None (global numpy random state), int, ``np.random.SeedSequence``
+            or ``np.random.Generator``. Default None
 
         Example:
           >>> np.random.seed(58463123)
@@ -732,21 +1072,20 @@ class Vector3Set(FeatureSet):
           L:120/39
 
         """
-        data = []
-        dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
         orig = Vector3(0, 0, 1)
         ax = orig.cross(position)
         ang = orig.angle(position)
-        for s, r in zip(
-            180 * np.random.uniform(low=0, high=180, size=n),
-            np.random.normal(loc=0, scale=sigma, size=n),
-        ):
-            v = orig.rotate(Vector3(s, 0), r).rotate(ax, ang)
-            data.append(dtype_cls(v))
-        return cls(data, name=name)
+        rng = _random_state(seed)
+        s = np.radians(180 * rng.uniform(low=0, high=180, size=n))
+        r = np.radians(rng.normal(loc=0, scale=sigma, size=n))
+        # rotation of orig around horizontal axis (s, 0) through angle r
+        dc = np.column_stack((np.sin(r) * np.sin(s), -np.sin(r) * np.cos(s), np.cos(r)))
+        return cls._from_array(dc, name=name).rotate(ax, ang)
 
     @classmethod
-    def random_fisher(cls, n=100, position=Vector3(0, 0, 1), kappa=20, name="Default"):
+    def random_fisher(
+        cls, n=100, position=Vector3(0, 0, 1), kappa=20, name="Default", seed=None
+    ):
         """Return ``FeatureSet`` of random vectors sampled from von Mises Fisher
         distribution around center position with concentration kappa.
 
@@ -755,16 +1094,20 @@ class Vector3Set(FeatureSet):
           position: mean orientation given as ``Vector3``. Default Vector3(0, 0, 1)
           kappa: precision parameter of the distribution. Default 20
           name: name of dataset. Default is 'Default'
+          seed: None (global numpy random state), int, ``np.random.SeedSequence``
+            or ``np.random.Generator``. Default None
 
         Example:
           >>> l = linset.random_fisher(position=lin(120,50))
+          >>> l = linset.random_fisher(position=lin(120,50), seed=42)
         """
-        dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
-        dc = vonMisesFisher(position, kappa, n)
-        return cls([dtype_cls(d) for d in dc], name=name)
+        dc = vonMisesFisher(position, kappa, n, seed=seed)
+        return cls._from_array(dc, name=name)
 
     @classmethod
-    def random_fisher2(cls, n=100, position=Vector3(0, 0, 1), kappa=20, name="Default"):
+    def random_fisher2(
+        cls, n=100, position=Vector3(0, 0, 1), kappa=20, name="Default", seed=None
+    ):
         """Method to create ``FeatureSet`` of vectors distributed according to
         Fisher distribution.
 
@@ -776,6 +1119,8 @@ class Vector3Set(FeatureSet):
           position: mean orientation given as ``Vector3``. Default Vector3(0, 0, 1)
           kappa: precision parameter of the distribution. Default 20
           name: name of dataset. Default is 'Default'
+          seed: None (global numpy random state), int, ``np.random.SeedSequence``
+            or ``np.random.Generator``. Default None
 
         Example:
           >>> l = linset.random_fisher2(position=lin(120,50))
@@ -784,14 +1129,15 @@ class Vector3Set(FeatureSet):
         ax = orig.cross(position)
         ang = orig.angle(position)
         L = np.exp(-2 * kappa)
-        a = np.random.random(n) * (1 - L) + L
+        rng = _random_state(seed)
+        a = rng.random(n) * (1 - L) + L
         fac = np.sqrt(-np.log(a) / (2 * kappa))
         inc = 90 - 2 * np.degrees(np.arcsin(fac))
-        azi = 360 * np.random.random(n)
+        azi = 360 * rng.random(n)
         return cls.from_array(azi, inc, name=name).rotate(ax, ang)
 
     @classmethod
-    def random_kent(cls, p, n=100, kappa=20, beta=None, name="Default"):
+    def random_kent(cls, p, n=100, kappa=20, beta=None, name="Default", seed=None):
         """Return ``FeatureSet`` of random vectors sampled from Kent distribution
         (Kent, 1982) - The 5-parameter Fisher–Bingham distribution.
 
@@ -801,17 +1147,66 @@ class Vector3Set(FeatureSet):
           kappa: concentration parameter. Default 20
           beta: ellipticity 0 <= beta < kappa
           name: name of dataset. Default is 'Default'
+          seed: None (global numpy random state), int, ``np.random.SeedSequence``
+            or ``np.random.Generator``. Default None
 
         Example:
           >>> p = pair(150, 40, 150, 40)
           >>> l = linset.random_kent(p, n=300, kappa=30)
         """
         assert issubclass(type(p), Pair), "Argument must be Pair object."
-        dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
         if beta is None:
             beta = kappa / 2
         kd = KentDistribution(p.lvec, p.fvec.cross(p.lvec), p.fvec, kappa, beta)
-        return cls([dtype_cls(d) for d in kd.rvs(n)], name=name)
+        return cls._from_array(kd.rvs(n, seed=seed), name=name)
+
+    @classmethod
+    def random_watson(
+        cls, n=100, position=Vector3(0, 0, 1), kappa=20, name="Default", seed=None
+    ):
+        """Return ``FeatureSet`` of random vectors sampled from Watson
+        distribution with axis position and concentration kappa.
+
+        Args:
+          n: number of objects to be generated
+          position: axis of distribution given as ``Vector3``. Default
+            Vector3(0, 0, 1)
+          kappa: concentration parameter. Positive for bipolar, negative for
+            girdle distribution normal to position. Default 20
+          name: name of dataset. Default is 'Default'
+          seed: None (global numpy random state), int, ``np.random.SeedSequence``
+            or ``np.random.Generator``. Default None
+
+        Example:
+          >>> l = linset.random_watson(position=lin(120, 50), kappa=30)
+          >>> s = folset.random_watson(position=lin(120, 50), kappa=-30)
+        """
+        wd = WatsonDistribution(position, kappa)
+        return cls._from_array(wd.rvs(n, seed=seed), name=name)
+
+    @classmethod
+    def random_bingham(cls, p, n=100, kappa2=5, kappa3=50, name="Default", seed=None):
+        """Return ``FeatureSet`` of random vectors sampled from Bingham
+        distribution with mode along lineation and girdle along foliation of
+        ``Pair`` p.
+
+        Args:
+          p: Pair object defining orientation of data
+          n: number of objects to be generated
+          kappa2: concentration along direction in foliation perpendicular to
+            lineation. Default 5
+          kappa3: concentration along foliation normal. Default 50
+          name: name of dataset. Default is 'Default'
+          seed: None (global numpy random state), int, ``np.random.SeedSequence``
+            or ``np.random.Generator``. Default None
+
+        Example:
+          >>> p = pair(150, 40, 150, 40)
+          >>> l = linset.random_bingham(p, n=300, kappa2=0, kappa3=30)
+        """
+        assert issubclass(type(p), Pair), "Argument must be Pair object."
+        bd = BinghamDistribution(p.lvec, p.fvec.cross(p.lvec), p.fvec, kappa2, kappa3)
+        return cls._from_array(bd.rvs(n, seed=seed), name=name)
 
     @classmethod
     def uniform_sfs(cls, n=100, name="Default"):
@@ -830,14 +1225,13 @@ class Vector3Set(FeatureSet):
           >>> v.ortensor().eigenvalues()
           (0.3334645347163635, 0.33333474915201167, 0.33320071613162483)
         """
-        dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
         phi = (1 + np.sqrt(5)) / 2
         i2 = 2 * np.arange(n) - n + 1
         theta = 2 * np.pi * i2 / phi
         sp = i2 / n
         cp = np.sqrt((n + i2) * (n - i2)) / n
         dc = np.array([cp * np.sin(theta), cp * np.cos(theta), sp]).T
-        return cls([dtype_cls(d) for d in dc], name=name)
+        return cls._from_array(dc, name=name)
 
     @classmethod
     def uniform_gss(cls, n=100, name="Default"):
@@ -855,7 +1249,6 @@ class Vector3Set(FeatureSet):
           >>> v.ortensor().eigenvalues()
           (0.33335688569571587, 0.33332315115436933, 0.33331996314991513)
         """
-        dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
         inc = np.pi * (3 - np.sqrt(5))
         off = 2 / n
         k = np.arange(n)
@@ -863,7 +1256,7 @@ class Vector3Set(FeatureSet):
         r = np.sqrt(1 - y * y)
         phi = k * inc
         dc = np.array([np.cos(phi) * r, y, np.sin(phi) * r]).T
-        return cls([dtype_cls(d) for d in dc], name=name)
+        return cls._from_array(dc, name=name)
 
 
 class LineationSet(Vector3Set):
@@ -876,6 +1269,15 @@ class LineationSet(Vector3Set):
     def __repr__(self):
         return f"L({len(self)}) {self.name}"
 
+    def cross(self, other=None):
+        """Return Foliations defined by cross products of all features in
+        ``LineationSet``. See ``Vector3Set.cross`` for details.
+        """
+        r = super().cross(other)
+        return FoliationSet._from_array(r._data, name=r.name)
+
+    __pow__ = cross
+
 
 class FoliationSet(Vector3Set):
     """
@@ -887,9 +1289,43 @@ class FoliationSet(Vector3Set):
     def __repr__(self):
         return f"S({len(self)}) {self.name}"
 
+    def cross(self, other=None):
+        """Return Lineations defined by intersections of all features in
+        ``FoliationSet``. See ``Vector3Set.cross`` for details.
+        """
+        r = super().cross(other)
+        return LineationSet._from_array(r._data, name=r.name)
+
+    __pow__ = cross
+
+    def transform(self, F, **kwargs):
+        """Return affine transformation of all features ``FoliationSet`` by matrix
+        'F'. Plane normals are transformed by inverse of 'F'.
+
+        Args:
+          F: Transformation matrix. Array-like value e.g. ``DeformationGradient3``
+            or ``Matrix3Set`` of same length to transform each feature by its own
+            matrix.
+
+        Keyword Args:
+          norm: normalize transformed features. True or False. Default False
+
+        """
+        F = np.asarray(F, dtype=float)
+        if F.ndim == 3:
+            # normals are transformed by inverse transpose of each matrix
+            r = _matvec(np.swapaxes(np.linalg.inv(F), 1, 2), self._data)
+        else:
+            r = self._data @ np.linalg.inv(F)
+        if kwargs.get("norm", False):
+            r = _unit_rows(r)
+        return type(self)._from_array(r, name=self.name)
+
     def dipvec(self):
         """Return ``FeatureSet`` object with plane dip vector."""
-        return Vector3Set([e.dipvec() for e in self], name=self.name)
+        return Vector3Set._from_array(
+            geo2vec_linear_array(*vec2geo_planar_array(self._data)), name=self.name
+        )
 
 
 class PairSet(FeatureSet):
@@ -899,36 +1335,142 @@ class PairSet(FeatureSet):
 
     __feature_type__ = "Pair"
 
+    def __init__(self, data, name="Default"):
+        dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
+        if isinstance(data, PairSet):
+            # buffers are read-only, so they could be shared
+            other_cls = getattr(sys.modules[__name__], type(data).__feature_type__)
+            assert issubclass(
+                other_cls, dtype_cls
+            ), f"Data must be instances of {type(self).__feature_type__}"
+            arr, misfit = data._data, data._misfit
+        else:
+            assert all(
+                [isinstance(obj, dtype_cls) for obj in data]
+            ), f"Data must be instances of {type(self).__feature_type__}"
+            arr = np.array(
+                [obj.fvec._coords + obj.lvec._coords for obj in data], dtype=float
+            )
+            misfit = np.array([obj.misfit for obj in data], dtype=float)
+        self._assign(arr, misfit, name)
+
+    def _assign(self, arr, misfit, name):
+        arr = _frozen_array(arr, (-1, 6))
+        misfit = np.array(misfit, dtype=float).reshape(-1)
+        misfit.flags.writeable = False
+        self._data = arr
+        self._misfit = misfit
+        self.name = name
+        self._cache = _StatsCache()
+
+    @classmethod
+    def _from_array(cls, arr, name="Default", misfit=None):
+        """Create ``PairSet`` directly from (N, 6) array of orthogonal planar and
+        linear vectors without validation"""
+        obj = cls.__new__(cls)
+        if misfit is None:
+            misfit = np.zeros(len(arr))
+        obj._assign(arr, misfit, name)
+        return obj
+
+    @classmethod
+    def _from_vectors(cls, fvec, lvec, name="Default"):
+        """Create ``PairSet`` from (N, 3) arrays of planar normals and linear
+        vectors. Vectors are adjusted, so linear features fit onto planar ones."""
+        fvec, lvec, misfit = _orthogonalize_pairs(fvec, lvec)
+        if np.any(misfit > 20):
+            warnings.warn(f"Warning: Misfit angle is {misfit.max():.1f} degrees.")
+        return cls._from_array(np.hstack((fvec, lvec)), name=name, misfit=misfit)
+
+    def __copy__(self):
+        return type(self)._from_array(self._data, name=self.name, misfit=self._misfit)
+
+    copy = __copy__
+
+    @property
+    def data(self):
+        """Return tuple of features"""
+        return tuple(self)
+
     def __repr__(self):
         return f"P({len(self)}) {self.name}"
 
-    def __array__(self, dtype=None):
-        return np.array([np.array(p) for p in self.data], dtype=dtype)
+    def __array__(self, dtype=None, copy=None):
+        if dtype is not None and np.dtype(dtype) != self._data.dtype:
+            return self._data.astype(dtype)
+        if copy:
+            return self._data.copy()
+        return self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def _feature(self, ix):
+        # features are already adjusted, so they are created without validation
+        dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
+        fx, fy, fz, lx, ly, lz = self._data[ix].tolist()
+        obj = dtype_cls.__new__(dtype_cls)
+        obj.fvec = Vector3(fx, fy, fz)
+        obj.lvec = Vector3(lx, ly, lz)
+        obj.misfit = float(self._misfit[ix])
+        return obj
+
+    def __getitem__(self, key):
+        if isinstance(key, slice) or isinstance(key, np.ndarray):
+            return type(self)._from_array(
+                self._data[key], name=self.name, misfit=self._misfit[key]
+            )
+        elif np.issubdtype(type(key), np.integer):
+            return self._feature(key)
+        else:
+            raise TypeError(
+                "Wrong index. Only slice, int and np.array are allowed for indexing."
+            )
+
+    def __iter__(self):
+        for ix in range(len(self)):
+            yield self._feature(ix)
+
+    def __add__(self, other):
+        if isinstance(other, type(self)):
+            return type(self)._from_array(
+                np.concatenate((self._data, other._data)),
+                name=self.name,
+                misfit=np.concatenate((self._misfit, other._misfit)),
+            )
+        else:
+            raise TypeError("Only {self.__name__} is allowed")
+
+    def rotate(self, axis, phi):
+        """Rotate ``PairSet`` object `phi` degress about `axis`."""
+        R = axisangle_matrix(_vector3_arg(axis, "rotate"), phi)
+        r = (self._data.reshape(-1, 3) @ R.T).reshape(-1, 6)
+        return type(self)._from_vectors(r[:, :3], r[:, 3:], name=self.name)
 
     @property
     def fol(self):
         """Return Foliations of pairs as FoliationSet"""
-        return FoliationSet([e.fol for e in self], name=self.name)
+        return FoliationSet._from_array(self._data[:, :3], name=self.name)
 
     @property
     def fvec(self):
         """Return planar normal vectors of pairs as Vector3Set"""
-        return Vector3Set([e.fvec for e in self], name=self.name)
+        return Vector3Set._from_array(self._data[:, :3], name=self.name)
 
     @property
     def lin(self):
         """Return Lineation of pairs as LineationSet"""
-        return LineationSet([e.lin for e in self], name=self.name)
+        return LineationSet._from_array(self._data[:, 3:], name=self.name)
 
     @property
     def lvec(self):
         """Return lineation vectors of pairs as Vector3Set"""
-        return Vector3Set([e.lvec for e in self], name=self.name)
+        return Vector3Set._from_array(self._data[:, 3:], name=self.name)
 
     @property
     def misfit(self):
         """Return array of misfits"""
-        return np.array([f.misfit for f in self])
+        return self._misfit.copy()
 
     @property
     def rax(self):
@@ -936,7 +1478,9 @@ class PairSet(FeatureSet):
         Return vectors perpendicular to both planar and linear parts of
         pairs as Vector3Set
         """
-        return Vector3Set([e.rax for e in self], name=self.name)
+        return Vector3Set._from_array(
+            np.cross(self._data[:, 3:], self._data[:, :3]), name=self.name
+        )
 
     @property
     def ortensor(self):
@@ -948,9 +1492,16 @@ class PairSet(FeatureSet):
         return str(self)
 
     @classmethod
-    def random(cls, n=25):
-        """Create PairSet of random pairs"""
-        return PairSet([Pair.random() for i in range(n)])
+    def random(cls, n=25, seed=None):
+        """Create PairSet of random pairs
+
+        Keyword Args:
+          n: number of objects to be generated. Default 25
+          seed: None (global numpy random state), int, ``np.random.SeedSequence``
+            or ``np.random.Generator``. Default None
+        """
+        lvec, p = _random_pair_vectors(n, _random_state(seed))
+        return cls._from_vectors(np.cross(lvec, p), lvec)
 
     @classmethod
     def from_csv(cls, filename, delimiter=",", facol=0, ficol=1, lacol=2, licol=3):
@@ -1029,20 +1580,15 @@ class PairSet(FeatureSet):
         n = apsg_conf["ndigits"]
 
         with open(filename, "w", newline="") as csvfile:
-            fieldnames = ["azi", "inc", "lazi", "linc"]
+            fieldnames = ["fazi", "finc", "lazi", "linc"]
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
-            for dt in self:
-                fazi, finc = dt.fol.geo
-                lazi, linc = dt.lin.geo
-                writer.writerow(
-                    {
-                        "fazi": round(fazi, n),
-                        "finc": round(finc, n),
-                        "lazi": round(lazi, n),
-                        "linc": round(linc, n),
-                    }
-                )
+            fazis, fincs = vec2geo_planar_array(self._data[:, :3])
+            lazis, lincs = vec2geo_linear_array(self._data[:, 3:])
+            for row in zip(
+                *(np.round(v, n).tolist() for v in (fazis, fincs, lazis, lincs))
+            ):
+                writer.writerow(dict(zip(fieldnames, row)))
 
     @classmethod
     def from_array(cls, fazis, fincs, lazis, lincs, name="Default"):
@@ -1056,14 +1602,9 @@ class PairSet(FeatureSet):
           name: name of ``PairSet`` object. Default is 'Default'
         """
 
-        dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
-        return cls(
-            [
-                dtype_cls(fazi, finc, lazi, linc)
-                for fazi, finc, lazi, linc in zip(fazis, fincs, lazis, lincs)
-            ],
-            name=name,
-        )
+        fvec = geo2vec_planar_array(fazis, fincs)
+        lvec = geo2vec_linear_array(lazis, lincs)
+        return cls._from_vectors(fvec, lvec, name=name)
 
 
 class FaultSet(PairSet):
@@ -1076,45 +1617,87 @@ class FaultSet(PairSet):
     def __repr__(self):
         return f"F({len(self)}) {self.name}"
 
+    def _assign(self, arr, misfit, name):
+        super()._assign(arr, misfit, name)
+        sense = _fault_sense(self._data[:, :3], self._data[:, 3:])
+        sense.flags.writeable = False
+        self._sense = sense
+
+    def __array__(self, dtype=None, copy=None):
+        return np.column_stack((self._data, self._sense)).astype(dtype)
+
     @property
     def sense(self):
         """Return array of sense values"""
-        return np.array([f.sense for f in self])
+        return self._sense.copy()
+
+    def _pt_vectors(self, phi):
+        fvec, lvec = self._data[:, :3], self._data[:, 3:]
+        return _rotate_rows(fvec, np.cross(lvec, fvec), phi)
 
     @property
     def p_vector(self, ptangle=90):
         """Return p-axes of FaultSet as Vector3Set"""
-        return Vector3Set([e.p_vector(ptangle) for e in self], name=self.name)
+        return Vector3Set._from_array(self._pt_vectors(-ptangle / 2), name=self.name)
 
     @property
     def t_vector(self, ptangle=90):
         """Return t-axes of FaultSet as Vector3Set"""
-        return Vector3Set([e.t_vector(ptangle) for e in self], name=self.name)
+        return Vector3Set._from_array(self._pt_vectors(ptangle / 2), name=self.name)
 
     @property
     def p(self):
         """Return p-axes of FaultSet as LineationSet"""
-        return LineationSet([e.p for e in self], name=self.name + "-P")
+        return LineationSet._from_array(self._pt_vectors(-45), name=self.name + "-P")
 
     @property
     def t(self):
         """Return t-axes of FaultSet as LineationSet"""
-        return LineationSet([e.t for e in self], name=self.name + "-T")
+        return LineationSet._from_array(self._pt_vectors(45), name=self.name + "-T")
 
     @property
     def m(self):
         """Return m-planes of FaultSet as FoliationSet"""
-        return FoliationSet([e.m for e in self], name=self.name + "-M")
+        m = np.cross(self._data[:, 3:], self._data[:, :3])
+        return FoliationSet._from_array(m, name=self.name + "-M")
 
     @property
     def d(self):
         """Return dihedra planes of FaultSet as FoliationSet"""
-        return FoliationSet([e.d for e in self], name=self.name + "-D")
+        m = np.cross(self._data[:, 3:], self._data[:, :3])
+        d = np.cross(m, self._data[:, :3])
+        return FoliationSet._from_array(d, name=self.name + "-D")
+
+    def stress_inversion(self, **kwargs):
+        """Return best-fit reduced stress tensor of FaultSet.
+
+        Wallace-Bott misfit grid search with iterative refinement. See
+        ``apsg.feature.stress_inversion`` for keyword arguments and results.
+
+        Example:
+            >>> f = stress.from_comp(xx=-5, yy=-2, zz=-1).fault(folset.random_fisher())
+            >>> f.stress_inversion()['R']
+        """
+        from apsg.feature._paleostress import stress_inversion
+
+        return stress_inversion(self, **kwargs)
 
     @classmethod
-    def random(cls, n=25):
-        """Create PairSet of random pairs"""
-        return FaultSet([Fault.random() for i in range(n)])
+    def random(cls, n=25, seed=None):
+        """Create FaultSet of random faults
+
+        Keyword Args:
+          n: number of objects to be generated. Default 25
+          seed: None (global numpy random state), int, ``np.random.SeedSequence``
+            or ``np.random.Generator``. Default None
+        """
+        rng = _random_state(seed)
+        lvec, p = _random_pair_vectors(n, rng)
+        fvec = np.cross(lvec, p)
+        # same as Fault, lineation is reversed when sense should be changed
+        flip = (_fault_sense(fvec, lvec) > 0) & (rng.choice([-1, 1], n) < 0)
+        lvec[flip] = -lvec[flip]
+        return cls._from_vectors(fvec, lvec)
 
     @classmethod
     def from_csv(
@@ -1203,18 +1786,14 @@ class FaultSet(PairSet):
             fieldnames = ["fazi", "finc", "lazi", "linc", "sense"]
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
-            for dt in self:
-                fazi, finc = dt.fol.geo
-                lazi, linc = dt.lin.geo
-                writer.writerow(
-                    {
-                        "fazi": round(fazi, n),
-                        "finc": round(finc, n),
-                        "lazi": round(lazi, n),
-                        "linc": round(linc, n),
-                        "sense": dt.sense,
-                    }
-                )
+            fazis, fincs = vec2geo_planar_array(self._data[:, :3])
+            lazis, lincs = vec2geo_linear_array(self._data[:, 3:])
+            rows = zip(
+                *(np.round(v, n).tolist() for v in (fazis, fincs, lazis, lincs)),
+                self._sense.tolist(),
+            )
+            for row in rows:
+                writer.writerow(dict(zip(fieldnames, row)))
 
     @classmethod
     def from_array(cls, fazis, fincs, lazis, lincs, senses, name="Default"):
@@ -1228,16 +1807,10 @@ class FaultSet(PairSet):
           name: name of ``PairSet`` object. Default is 'Default'
         """
 
-        dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
-        return cls(
-            [
-                dtype_cls(fazi, finc, lazi, linc, sense)
-                for fazi, finc, lazi, linc, sense in zip(
-                    fazis, fincs, lazis, lincs, senses
-                )
-            ],
-            name=name,
-        )
+        fvec = geo2vec_planar_array(fazis, fincs)
+        lvec = geo2vec_linear_array(lazis, lincs)
+        lvec[np.asarray(senses) < 0] *= -1
+        return cls._from_vectors(fvec, lvec, name=name)
 
 
 class ConeSet(FeatureSet):
@@ -1251,61 +1824,169 @@ class ConeSet(FeatureSet):
         return f"C({len(self)}) {self.name}"
 
 
-class EllipseSet(FeatureSet):
+class _MatrixStackSet(FeatureSet):
+    """
+    Base class for containers of matrices stored as (N, n, n) array
+    """
+
+    def __init__(self, data, name="Default"):
+        dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
+        if isinstance(data, _MatrixStackSet):
+            # buffers are read-only, so they could be shared
+            other_cls = getattr(sys.modules[__name__], type(data).__feature_type__)
+            assert issubclass(
+                other_cls, dtype_cls
+            ), f"Data must be instances of {type(self).__feature_type__}"
+            arr = data._data
+        else:
+            assert all(
+                [isinstance(obj, dtype_cls) for obj in data]
+            ), f"Data must be instances of {type(self).__feature_type__}"
+            arr = np.array([obj._coefs for obj in data], dtype=float)
+            arr = arr.reshape((-1,) + dtype_cls.__shape__)
+            arr.flags.writeable = False
+        self._data = arr
+        self.name = name
+        self._cache = _StatsCache()
+
+    @classmethod
+    def _from_array(cls, arr, name="Default"):
+        """Create ``FeatureSet`` directly from (N, n, n) array without validation"""
+        dtype_cls = getattr(sys.modules[__name__], cls.__feature_type__)
+        obj = cls.__new__(cls)
+        arr = _frozen_array(arr, (-1,) + dtype_cls.__shape__)
+        obj._data = arr
+        obj.name = name
+        obj._cache = _StatsCache()
+        return obj
+
+    def __copy__(self):
+        return type(self)._from_array(self._data, name=self.name)
+
+    copy = __copy__
+
+    @property
+    def data(self):
+        """Return tuple of features"""
+        return tuple(self)
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is not None and np.dtype(dtype) != self._data.dtype:
+            return self._data.astype(dtype)
+        if copy:
+            return self._data.copy()
+        return self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice) or isinstance(key, np.ndarray):
+            return type(self)._from_array(self._data[key], name=self.name)
+        elif np.issubdtype(type(key), np.integer):
+            dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
+            return dtype_cls(self._data[key])
+        else:
+            raise TypeError(
+                "Wrong index. Only slice, int and np.array are allowed for indexing."
+            )
+
+    def __iter__(self):
+        dtype_cls = getattr(sys.modules[__name__], type(self).__feature_type__)
+        for m in self._data:
+            yield dtype_cls(m)
+
+    def __add__(self, other):
+        if isinstance(other, type(self)):
+            return type(self)._from_array(
+                np.concatenate((self._data, other._data)), name=self.name
+            )
+        else:
+            raise TypeError("Only {self.__name__} is allowed")
+
+    @property
+    def _eigh(self):
+        return self._cache.get_or_compute("eigh", lambda: _sorted_eigh(self._data))
+
+    def eigenvalues(self) -> np.ndarray:
+        """Return (N, n) array of sorted principal eigenvalues"""
+        return self._eigh[0].copy()
+
+    def eigenvectors(self) -> np.ndarray:
+        """Return (N, n, n) array of principal eigenvectors stored in rows"""
+        return np.swapaxes(self._eigh[1], 1, 2).copy()
+
+
+class EllipseSet(_MatrixStackSet):
     """
     Class to store set of ``Ellipse`` features
     """
 
     __feature_type__ = "Ellipse"
 
+    @property
+    def E1(self) -> np.ndarray:
+        """
+        Return the array of maximum eigenvalues.
+        """
+        return self._eigh[0][:, 0].copy()
+
+    @property
+    def E2(self) -> np.ndarray:
+        """
+        Return the array of minimum eigenvalues.
+        """
+        return self._eigh[0][:, 1].copy()
+
     @property
     def S1(self) -> np.ndarray:
         """
         Return the array of maximum principal stretches.
         """
-        return np.array([e.S1 for e in self])
+        return np.sqrt(self._eigh[0][:, 0])
 
     @property
     def S2(self) -> np.ndarray:
         """
         Return the array of minimum principal stretches.
         """
-        return np.array([e.S2 for e in self])
+        return np.sqrt(self._eigh[0][:, 1])
 
     @property
     def e1(self) -> np.ndarray:
         """
         Return the maximum natural principal strains.
         """
-        return np.array([e.e1 for e in self])
+        return np.log(self.S1)
 
     @property
     def e2(self) -> np.ndarray:
         """
         Return the array of minimum natural principal strains.
         """
-        return np.array([e.e2 for e in self])
+        return np.log(self.S2)
 
     @property
     def ar(self) -> np.ndarray:
         """
         Return the array of axial ratios.
         """
-        return np.array([e.ar for e in self])
+        return self.S1 / self.S2
 
     @property
     def orientation(self) -> np.ndarray:
         """
         Return the array of orientations of the maximum eigenvector.
         """
-        return np.array([e.orientation for e in self])
+        V1 = self._eigh[1][:, :, 0]
+        return np.degrees(np.arctan2(V1[:, 1], V1[:, 0])) % 180
 
     @property
     def e12(self) -> np.ndarray:
         """
         Return the array of differences between natural principal strains.
         """
-        return np.array([e.e12 for e in self])
+        return self.e1 - self.e2
 
 
 class OrientationTensor2Set(EllipseSet):
@@ -1316,215 +1997,268 @@ class OrientationTensor2Set(EllipseSet):
     __feature_type__ = "OrientationTensor2"
 
 
-class EllipsoidSet(FeatureSet):
+class EllipsoidSet(_MatrixStackSet):
     """
     Class to store set of ``Ellipsoid`` features
     """
 
     __feature_type__ = "Ellipsoid"
 
+    @classmethod
+    def from_defgrad(cls, F, form="left", name="Default") -> "EllipsoidSet":
+        """
+        Return set of deformation tensors from ``DeformationGradient3Set``.
+
+        Kwargs:
+            form: 'left' or 'B' for left Cauchy–Green deformation tensor or
+                  Finger deformation tensor
+                  'right' or 'C' for right Cauchy–Green deformation tensor or
+                  Green's deformation tensor.
+                  Default is 'left'.
+        """
+        F = np.asarray(F, dtype=float)
+        if form in ("left", "B"):
+            return cls._from_array(F @ np.swapaxes(F, -1, -2), name=name)
+        elif form in ("right", "C"):
+            return cls._from_array(np.swapaxes(F, -1, -2) @ F, name=name)
+        else:
+            raise TypeError("Wrong form argument")
+
     @property
     def strength(self) -> np.ndarray:
         """
         Return the array of the Woodcock strength.
         """
-        return np.array([e.strength for e in self])
+        return self.e13
 
     @property
     def shape(self) -> np.ndarray:
         """
         Return the array of the Woodcock shape.
         """
-        return np.array([e.shape for e in self])
+        return self.K
+
+    @property
+    def E1(self) -> np.ndarray:
+        """
+        Return the array of maximum eigenvalues.
+        """
+        return self._eigh[0][:, 0].copy()
+
+    @property
+    def E2(self) -> np.ndarray:
+        """
+        Return the array of middle eigenvalues.
+        """
+        return self._eigh[0][:, 1].copy()
+
+    @property
+    def E3(self) -> np.ndarray:
+        """
+        Return the array of minimum eigenvalues.
+        """
+        return self._eigh[0][:, 2].copy()
 
     @property
     def S1(self) -> np.ndarray:
         """
         Return the array of maximum principal stretches.
         """
-        return np.array([e.S1 for e in self])
+        return np.sqrt(self._eigh[0][:, 0])
 
     @property
     def S2(self) -> np.ndarray:
         """
         Return the array of middle principal stretches.
         """
-        return np.array([e.S2 for e in self])
+        return np.sqrt(self._eigh[0][:, 1])
 
     @property
     def S3(self) -> np.ndarray:
         """
         Return the array of minimum principal stretches.
         """
-        return np.array([e.S3 for e in self])
+        return np.sqrt(self._eigh[0][:, 2])
 
     @property
     def e1(self) -> np.ndarray:
         """
         Return the array of the maximum natural principal strain.
         """
-        return np.array([e.e1 for e in self])
+        return np.log(self.S1)
 
     @property
     def e2(self) -> np.ndarray:
         """
         Return the array of the middle natural principal strain.
         """
-        return np.array([e.e2 for e in self])
+        return np.log(self.S2)
 
     @property
     def e3(self) -> np.ndarray:
         """
         Return the array of the minimum natural principal strain.
         """
-        return np.array([e.e3 for e in self])
+        return np.log(self.S3)
 
     @property
     def Rxy(self) -> np.ndarray:
         """
         Return the array of the Rxy ratios.
         """
-        return np.array([e.Rxy for e in self])
+        S1, S2 = self.S1, self.S2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(S2 != 0, S1 / S2, np.inf)
 
     @property
     def Ryz(self) -> np.ndarray:
         """
         Return the array of the Ryz ratios.
         """
-        return np.array([e.Ryz for e in self])
+        S2, S3 = self.S2, self.S3
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(S3 != 0, S2 / S3, np.inf)
 
     @property
     def e12(self) -> np.ndarray:
         """
         Return the array of the e1 - e2 values.
         """
-        return np.array([e.e12 for e in self])
+        return self.e1 - self.e2
 
     @property
     def e13(self) -> np.ndarray:
         """
         Return the array of the e1 - e3 values.
         """
-        return np.array([e.e13 for e in self])
+        return self.e1 - self.e3
 
     @property
     def e23(self) -> np.ndarray:
         """
         Return the array of the e2 - e3 values.
         """
-        return np.array([e.e23 for e in self])
+        return self.e2 - self.e3
 
     @property
     def k(self) -> np.ndarray:
         """
         Return the array of the strain symmetries.
         """
-        return np.array([e.k for e in self])
+        Rxy, Ryz = self.Rxy, self.Ryz
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(Ryz > 1, (Rxy - 1) / (Ryz - 1), np.inf)
 
     @property
     def d(self) -> np.ndarray:
         """
         Return the array of the strain intensities.
         """
-        return np.array([e.d for e in self])
+        return np.sqrt((self.Rxy - 1) ** 2 + (self.Ryz - 1) ** 2)
 
     @property
     def K(self) -> np.ndarray:
         """
         Return the array of the strain symmetries K (Ramsay, 1983).
         """
-        return np.array([e.K for e in self])
+        e12, e23 = self.e12, self.e23
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(e23 > 0, e12 / e23, np.inf)
 
     @property
     def D(self) -> np.ndarray:
         """
         Return the array of the strain intensities D (Ramsay, 1983)..
         """
-        return np.array([e.D for e in self])
+        return self.e12**2 + self.e23**2
 
     @property
     def r(self) -> np.ndarray:
         """
         Return the array of the strain intensities (Watterson, 1968).
         """
-        return np.array([e.r for e in self])
+        return self.Rxy + self.Ryz - 1
 
     @property
     def goct(self) -> np.ndarray:
         """
         Return the array of the natural octahedral unit shears (Nadai, 1963).
         """
-        return np.array([e.goct for e in self])
+        return 2 * np.sqrt(self.e12**2 + self.e23**2 + self.e13**2) / 3
 
     @property
     def eoct(self) -> np.ndarray:
         """
         Return the array of the natural octahedral unit strains (Nadai, 1963).
         """
-        return np.array([e.eoct for e in self])
+        return np.sqrt(3) * self.goct / 2
 
     @property
     def lode(self) -> np.ndarray:
         """
         Return the array of Lode parameters (Lode, 1926).
         """
-        return np.array([e.lode for e in self])
+        e1, e2, e3 = self.e1, self.e2, self.e3
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(e1 - e3 > 0, (2 * e2 - e1 - e3) / (e1 - e3), 0)
 
     @property
     def P(self) -> np.ndarray:
         """
         Return the array of Point indexes (Vollmer, 1990).
         """
-        return np.array([e.P for e in self])
+        return self._eigh[0][:, 0] - self._eigh[0][:, 1]
 
     @property
     def G(self) -> np.ndarray:
         """
         Return the array of Girdle indexes (Vollmer, 1990).
         """
-        return np.array([e.G for e in self])
+        return 2 * (self._eigh[0][:, 1] - self._eigh[0][:, 2])
 
     @property
     def R(self) -> np.ndarray:
         """
         Return the array of Random indexes (Vollmer, 1990).
         """
-        return np.array([e.R for e in self])
+        return 3 * self._eigh[0][:, 2]
 
     @property
     def B(self) -> np.ndarray:
         """
         Return the array of Cylindricity indexes (Vollmer, 1990).
         """
-        return np.array([e.B for e in self])
+        return self.P + self.G
 
     @property
     def Intensity(self) -> np.ndarray:
         """
         Return the array of Intensity indexes (Lisle, 1985).
         """
-        return np.array([e.Intensity for e in self])
+        return 7.5 * np.sum((self._eigh[0] - 1 / 3) ** 2, axis=1)
 
     @property
     def aMAD_l(self) -> np.ndarray:
         """
         Return approximate angular deviation from the major axis along E1.
         """
-        return np.array([e.aMAD_l for e in self])
+        E1 = self._eigh[0][:, 0]
+        return np.degrees(np.arctan(np.sqrt((1 - E1) / E1)))
 
     @property
     def aMAD_p(self) -> np.ndarray:
         """
         Return approximate deviation from the plane normal to E3.
         """
-        return np.array([e.aMAD_p for e in self])
+        E3 = self._eigh[0][:, 2]
+        return np.degrees(np.arctan(np.sqrt(E3 / (1 - E3))))
 
     @property
     def aMAD(self) -> np.ndarray:
         """
         Return approximate deviation according to the shape
         """
-        return np.array([e.aMAD for e in self])
+        return np.where(self.shape > 1, self.aMAD_l, self.aMAD_p)
 
     @property
     def MAD_l(self) -> np.ndarray:
@@ -1532,7 +2266,8 @@ class EllipsoidSet(FeatureSet):
         Return maximum angular deviation (MAD) of linearly distributed vectors.
         Kirschvink 1980
         """
-        return np.array([e.MAD_l for e in self])
+        E1, E2, E3 = self._eigh[0].T
+        return np.degrees(np.arctan(np.sqrt((E2 + E3) / E1)))
 
     @property
     def MAD_p(self) -> np.ndarray:
@@ -1540,14 +2275,15 @@ class EllipsoidSet(FeatureSet):
         Return maximum angular deviation (MAD) of planarly distributed vectors.
         Kirschvink 1980
         """
-        return np.array([e.MAD_p for e in self])
+        E1, E2, E3 = self._eigh[0].T
+        return np.degrees(np.arctan(np.sqrt(E3 / E2 + E3 / E1)))
 
     @property
     def MAD(self) -> np.ndarray:
         """
         Return approximate deviation according to shape
         """
-        return np.array([e.MAD for e in self])
+        return np.where(self.shape > 1, self.MAD_l, self.MAD_p)
 
 
 class OrientationTensor3Set(EllipsoidSet):
@@ -1558,6 +2294,276 @@ class OrientationTensor3Set(EllipsoidSet):
     __feature_type__ = "OrientationTensor3"
 
 
+class Matrix3Set(_MatrixStackSet):
+    """
+    Class to store set of ``Matrix3`` features
+
+    Matrices are stored as (N, 3, 3) array and all operations are evaluated
+    for the whole set at once. Matrix multiplication follows NumPy broadcasting,
+    i.e. both operands must have same length or one of them must be single
+    matrix or vector.
+
+    Example:
+        >>> F = Matrix3Set([defgrad.from_axisangle(lin(120, 30), 45), defgrad()])
+        >>> F @ vecset([vec(1, 0, 0), vec(0, 1, 0)])
+        V3(2) Default
+    """
+
+    __feature_type__ = "Matrix3"
+
+    def __init__(self, data, name="Default"):
+        if isinstance(data, np.ndarray):
+            arr = np.array(data, dtype=float)
+            assert (
+                arr.ndim == 3 and arr.shape[1:] == Matrix3.__shape__
+            ), "Data must be array of shape (N, 3, 3)"
+            arr.flags.writeable = False
+            self._data = arr
+            self.name = name
+            self._cache = _StatsCache()
+        else:
+            super().__init__(data, name=name)
+
+    def __repr__(self):
+        return f"M3({len(self)}) {self.name}"
+
+    def __matmul__(self, other):
+        if isinstance(other, Vector3Set):
+            return Vector3Set._from_array(
+                _matvec(self._data, other._data), name=other.name
+            )
+        b = np.asarray(other, dtype=float)
+        if b.shape == Vector3.__shape__:
+            return Vector3Set._from_array(self._data @ b, name=self.name)
+        if b.shape[-2:] == Matrix3.__shape__:
+            return type(self)._from_array(self._data @ b, name=self.name)
+        return NotImplemented
+
+    def __rmatmul__(self, other):
+        b = np.asarray(other, dtype=float)
+        if b.shape[-2:] == Matrix3.__shape__:
+            return type(self)._from_array(b @ self._data, name=self.name)
+        return NotImplemented
+
+    @property
+    def T(self):
+        """Return set of transposed matrices"""
+        return type(self)._from_array(np.swapaxes(self._data, 1, 2), name=self.name)
+
+    @property
+    def I(self):
+        """Return set of inverse matrices"""
+        return type(self)._from_array(np.linalg.inv(self._data), name=self.name)
+
+    @property
+    def det(self) -> np.ndarray:
+        """Return the array of determinants"""
+        return np.linalg.det(self._data)
+
+    def transform(self, other):
+        """
+        Coordinate transformations of all matrices
+
+        Using rotation matrix it returns ``A' = R * A * R . T``. Rotation could be
+        single matrix or ``Matrix3Set`` of same length.
+        """
+        R = np.asarray(other, dtype=float)
+        return type(self)._from_array(
+            R @ self._data @ np.swapaxes(R, -1, -2), name=self.name
+        )
+
+
+class DeformationGradient3Set(Matrix3Set):
+    """
+    Class to store set of ``DeformationGradient3`` features
+    """
+
+    __feature_type__ = "DeformationGradient3"
+
+    def __repr__(self):
+        return f"F3({len(self)}) {self.name}"
+
+    @property
+    def _svd(self):
+        return self._cache.get_or_compute("svd", lambda: np.linalg.svd(self._data))
+
+    @property
+    def R(self):
+        """Return set of rotation parts from polar decomposition"""
+        W, _, Vh = self._svd
+        return type(self)._from_array(W @ Vh, name=self.name)
+
+    @property
+    def U(self):
+        """Return set of stretching parts from right polar decomposition"""
+        _, s, Vh = self._svd
+        return type(self)._from_array(
+            (np.swapaxes(Vh, 1, 2) * s[:, None, :]) @ Vh, name=self.name
+        )
+
+    @property
+    def V(self):
+        """Return set of stretching parts from left polar decomposition"""
+        W, s, _ = self._svd
+        return type(self)._from_array(
+            (W * s[:, None, :]) @ np.swapaxes(W, 1, 2), name=self.name
+        )
+
+    def transform_features(self, features, **kwargs):
+        """
+        Return generator of features transformed by all tensors in set
+
+        For deformation path it yields the features, e.g. passive markers, for
+        every timestep. Products are evaluated in chunks limited by
+        apsg_conf["max_memory"].
+
+        Features are transformed as by their ``transform`` method, i.e. plane
+        normals of ``FoliationSet`` are transformed by inverse transpose of
+        tensors.
+
+        Args:
+          features: ``Vector3Set`` or its subclass. Array of vectors with shape
+            (N, 3) is converted to ``Vector3Set``
+
+        Keyword Args:
+          norm: normalize transformed features. True or False. Default False
+        """
+        if isinstance(features, FeatureSet):
+            if not isinstance(features, Vector3Set):
+                raise TypeError("Features must be Vector3Set or its subclass.")
+        else:
+            features = Vector3Set._from_array(np.asarray(features, dtype=float))
+        v = features._data
+        if isinstance(features, FoliationSet):
+            # v @ inv(F) is inverse transpose of F applied to normals
+            M = np.linalg.inv(self._data)
+        else:
+            M = np.swapaxes(self._data, 1, 2)
+        # result and temporary copy of 3 components per feature and tensor
+        chunk = max(1, apsg_conf["max_memory"] // (48 * max(len(v), 1)))
+        for start in range(0, len(self), chunk):
+            r = v @ M[start : start + chunk]
+            if kwargs.get("norm", False):
+                r = _unit_rows(r)
+            for rk in r:
+                yield type(features)._from_array(rk, name=features.name)
+
+
+class Stress3Set(Matrix3Set):
+    """
+    Class to store set of ``Stress3`` features
+
+    Methods evaluating stress on planes accept single normal vector,
+    ``FoliationSet`` or (N, 3) array of normals and return arrays of values for
+    all stress tensors and all planes, i.e. shape (M, N) for M stress tensors and
+    N planes or (M,) for single plane.
+
+    Example:
+        >>> S = Stress3Set([stress.from_comp(xx=-5, zz=10, xy=a) for a in range(5)])
+        >>> ts = S.slip_tendency(folset.random_fisher(n=1000))
+    """
+
+    __feature_type__ = "Stress3"
+
+    def __repr__(self):
+        return f"S3({len(self)}) {self.name}"
+
+    @property
+    def sigma1(self) -> np.ndarray:
+        """
+        Return the array of maximum principal stresses (max compressive).
+        """
+        return self._eigh[0][:, 2].copy()
+
+    @property
+    def sigma2(self) -> np.ndarray:
+        """
+        Return the array of intermediate principal stresses.
+        """
+        return self._eigh[0][:, 1].copy()
+
+    @property
+    def sigma3(self) -> np.ndarray:
+        """
+        Return the array of minimum principal stresses (max tensile).
+        """
+        return self._eigh[0][:, 0].copy()
+
+    @property
+    def shape_ratio(self) -> np.ndarray:
+        """
+        Return the array of shape ratios R (Gephart & Forsyth 1984).
+        """
+        E = self._eigh[0]
+        return (E[:, 2] - E[:, 1]) / (E[:, 2] - E[:, 0])
+
+    def _effective(self, fp):
+        return self._data + fp * np.eye(3)
+
+    def cauchy(self, n) -> np.ndarray:
+        """
+        Return the array of stress vectors associated with planes given by normals.
+        """
+        a, single = _normals_arg(n)
+        t, _, _ = _stress_components(self._data, a)
+        return t[:, 0] if single else t
+
+    def normal_stress(self, n) -> np.ndarray:
+        """
+        Return the array of normal stress magnitudes on planes given by normals.
+        """
+        a, single = _normals_arg(n)
+        t, _, _ = _stress_components(self._data, a)
+        r = np.sum(a * t, axis=-1)
+        return r[:, 0] if single else r
+
+    def shear_stress(self, n) -> np.ndarray:
+        """
+        Return the array of shear stress magnitudes on planes given by normals.
+        """
+        a, single = _normals_arg(n)
+        _, _, tau = _stress_components(self._data, a)
+        r = np.linalg.norm(tau, axis=-1)
+        return r[:, 0] if single else r
+
+    def slip_tendency(self, n, fp=0, log=False) -> np.ndarray:
+        """
+        Return the array of slip tendencies of planes given by normals.
+
+        Keyword Args:
+          fp (float): fluid pressure. Default 0
+          log (bool): when True, returns logarithm of slip tendency
+        """
+        a, single = _normals_arg(n)
+        r = _slip_tendency(self._effective(fp), a, log)
+        return r[:, 0] if single else r
+
+    def dilation_tendency(self, n, fp=0) -> np.ndarray:
+        """
+        Return the array of dilation tendencies of planes given by normals.
+
+        Keyword Args:
+          fp (float): fluid pressure. Default 0
+        """
+        a, single = _normals_arg(n)
+        r = _dilation_tendency(
+            self._effective(fp), a, self.sigma1 + fp, self.sigma3 + fp
+        )
+        return r[:, 0] if single else r
+
+    def fault(self, n):
+        """
+        Return tuple of ``FaultSet`` objects, one for each stress tensor, derived
+        from planes given by normals.
+        """
+        a, _ = _normals_arg(n)
+        _, sn, tau = _stress_components(self._data, a)
+        return tuple(
+            FaultSet._from_vectors(_unit_rows(f), _unit_rows(l), name=self.name)
+            for f, l in zip(sn, tau)
+        )
+
+
 class ClusterSet(object):
     """
     Provides a hierarchical clustering using `scipy.cluster` routines.
@@ -1714,3 +2720,128 @@ def G(lst, name="Default"):
 
 def angle_metric(u, v):
     return np.degrees(np.arccos(np.abs(np.dot(u, v))))
+
+
+def _resultants(a, axial):
+    """Return resultants of stacked (m, n, 3) samples"""
+    if not axial:
+        return a.sum(axis=1)
+    # same as sum of features, axial addition flips opposite vectors
+    r = np.zeros((len(a), 3))
+    for j in range(a.shape[1]):
+        v = a[:, j]
+        r += np.where(np.einsum("ij,ij->i", r, v) < 0, -1.0, 1.0)[:, None] * v
+    return r
+
+
+def _rotate_rows(v, axis, theta):
+    """Rotate rows of v around axis (or rows of axis) through angle theta"""
+    k = _unit_rows(np.broadcast_to(axis, v.shape))
+    theta = np.radians(np.asarray(theta, dtype=float))[..., None]
+    c, s = np.cos(theta), np.sin(theta)
+    kv = np.sum(k * v, axis=-1, keepdims=True)
+    return c * v + s * np.cross(k, v) + (1 - c) * kv * k
+
+
+def _orthogonalize_pairs(fvec, lvec):
+    """Return adjusted planar and linear vectors of pairs and their misfits"""
+    fvec = np.asarray(fvec, dtype=float)
+    lvec = np.asarray(lvec, dtype=float)
+    d = np.sum(_unit_rows(fvec) * _unit_rows(lvec), axis=1)
+    ang = np.degrees(np.arccos(np.clip(d, -1, 1)))
+    ax = np.cross(fvec, lvec)
+    fvec = _rotate_rows(fvec, ax, (ang - 90) / 2)
+    lvec = _rotate_rows(lvec, ax, -(ang - 90) / 2)
+    return fvec, lvec, np.abs(90 - ang)
+
+
+def _fault_sense(fvec, lvec):
+    """Return int8 array of sense of movement of faults"""
+    rax = np.cross(lvec, fvec)
+    # georax is rax reversed when only one of vectors is in upper hemisphere
+    same = (lvec[:, 2] < 0) == (fvec[:, 2] < 0)
+    same |= np.all(np.isclose(rax, -rax), axis=1)
+    return np.where(same, 1, -1).astype(np.int8)
+
+
+def _frozen_array(arr, shape):
+    """Return read-only float array of given shape. Read-only arrays already
+    owned by library are shared, other data are copied, so arrays of caller
+    are never made read-only."""
+    if not (
+        isinstance(arr, np.ndarray)
+        and arr.dtype == float
+        and arr.flags.c_contiguous
+        and not arr.flags.writeable
+    ):
+        arr = np.array(arr, dtype=float)
+    arr = arr.reshape(shape)
+    arr.flags.writeable = False
+    return arr
+
+
+def _random_pair_vectors(n, rng):
+    """Return two (n, 3) arrays of random unit vectors drawn as by Pair.random"""
+    v = rng.standard_normal((n, 2, 3))
+    v /= np.linalg.norm(v, axis=2, keepdims=True)
+    return v[:, 0], v[:, 1]
+
+
+def _matvec(m, v):
+    """Return products of stacked matrices and vectors with broadcasting"""
+    return np.matmul(m, v[..., None])[..., 0]
+
+
+def _sorted_eigh(a):
+    """Return eigenvalues and eigenvectors of stacked symmetric matrices sorted
+    in descending order"""
+    evals, evecs = np.linalg.eigh(a)
+    return evals[:, ::-1], evecs[:, :, ::-1]
+
+
+def _halfspace(a):
+    """Return copy of vectors flipped to have angle<=90 with their resultant"""
+    a = np.array(a, dtype=float)
+    # every pass strictly increases length of resultant, so it terminates
+    while True:
+        flip = a @ a.sum(axis=0) < 0
+        if not flip.any():
+            return a
+        a[flip] = -a[flip]
+
+
+def _vector3_arg(arg, method):
+    """Return argument as array of 3 components or raise ``TypeError``"""
+    v = np.asarray(arg, dtype=float)
+    if v.shape != Vector3.__shape__:
+        raise TypeError(f"Unsupported argument for {method}. Expecting Vector3")
+    return v
+
+
+def _normals_arg(n):
+    """Return normals as (N, 3) array and flag whether single vector was given"""
+    a = np.asarray(n, dtype=float)
+    if a.shape == Vector3.__shape__:
+        return a[None, :], True
+    if a.ndim != 2 or a.shape[1] != 3:
+        raise TypeError("Plane normals must be Vector3, Vector3Set or (N, 3) array")
+    return a, False
+
+
+class _StatsCache(dict):
+    """Cache of derived statistics counting hits and misses"""
+
+    __slots__ = ("hits", "misses")
+
+    def __init__(self):
+        super().__init__()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key, func):
+        if key in self:
+            self.hits += 1
+            return self[key]
+        self.misses += 1
+        value = self[key] = func()
+        return value
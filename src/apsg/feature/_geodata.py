@@ -8,8 +8,10 @@ from apsg.helpers._notation import (
     vec2geo_linear,
     vec2geo_linear_signed,
 )
+from apsg.helpers._helper import _random_state
 from apsg.decorator._decorator import ensure_first_arg_same, ensure_arguments
 from apsg.math._vector import Vector3, Axial3
+from apsg.math._rotation import rotate_vector
 
 
 class Lineation(Axial3):
@@ -90,7 +92,9 @@ class Foliation(Axial3):
         if len(args) == 0:
             coords = (0, 0, 1)
         elif len(args) == 1:
-            if np.asarray(args[0]).shape == Foliation.__shape__:
+            if isinstance(args[0], Vector3):
+                coords = args[0]._coords
+            elif np.asarray(args[0]).shape == Foliation.__shape__:
                 coords = np.asarray(args[0])
             elif isinstance(args[0], str):
                 if args[0].lower() == "x":
@@ -265,7 +269,7 @@ class Pair:
         """
         return not self == other
 
-    def __array__(self, dtype=None):
+    def __array__(self, dtype=None, copy=None):
         return np.hstack((self.fvec, self.lvec)).astype(dtype)
 
     def label(self):
@@ -279,12 +283,18 @@ class Pair:
         return {"datatype": type(self).__name__, "args": (fazi, finc, lazi, linc)}
 
     @classmethod
-    def random(cls):
+    def random(cls, seed=None):
         """
         Random Pair
+
+        Keyword Args:
+            seed: None (global numpy random state), int,
+                ``np.random.SeedSequence`` or ``np.random.Generator``.
+                Default None
         """
 
-        lin, p = Vector3.random(), Vector3.random()
+        rng = _random_state(seed)
+        lin, p = Vector3.random(seed=rng), Vector3.random(seed=rng)
         fol = lin.cross(p)
         return cls(fol, lin)
 
@@ -302,7 +312,9 @@ class Pair:
             P:210/83-287/60
 
         """
-        return type(self)(self.fvec.rotate(axis, phi), self.lvec.rotate(axis, phi))
+        return type(self)(
+            rotate_vector(self.fvec, axis, phi), rotate_vector(self.lvec, axis, phi)
+        )
 
     @property
     def rax(self):
@@ -456,7 +468,7 @@ class Fault(Pair):
         """
         return not self == other
 
-    def __array__(self, dtype=None):
+    def __array__(self, dtype=None, copy=None):
         return np.hstack((self.fvec, self.lvec, self.sense)).astype(dtype)
 
     def to_json(self):
@@ -469,15 +481,20 @@ class Fault(Pair):
         }
 
     @classmethod
-    def random(cls):
+    def random(cls, seed=None):
         """
         Random Fault
+
+        Keyword Args:
+            seed: None (global numpy random state), int,
+                ``np.random.SeedSequence`` or ``np.random.Generator``.
+                Default None
         """
-        import random
 
-        lvec, p = Vector3.random(), Vector3.random()
+        rng = _random_state(seed)
+        lvec, p = Vector3.random(seed=rng), Vector3.random(seed=rng)
         fvec = lvec.cross(p)
-        return cls(fvec, lvec, random.choice([-1, 1]))
+        return cls(fvec, lvec, int(rng.choice([-1, 1])))
 
     @property
     def georax(self):
@@ -620,7 +637,7 @@ class Cone:
     def __ne__(self, other):
         return not self == other
 
-    def __array__(self, dtype=None):
+    def __array__(self, dtype=None, copy=None):
         return np.hstack((self.axis, self.secant, self.revangle)).astype(dtype)
 
     def label(self):
@@ -637,12 +654,18 @@ class Cone:
         }
 
     @classmethod
-    def random(cls):
+    def random(cls, seed=None):
         """
         Random Cone
+
+        Keyword Args:
+            seed: None (global numpy random state), int,
+                ``np.random.SeedSequence`` or ``np.random.Generator``.
+                Default None
         """
 
-        axis, secant = Vector3.random(), Vector3.random()
+        rng = _random_state(seed)
+        axis, secant = Vector3.random(seed=rng), Vector3.random(seed=rng)
         return cls(axis, secant, 360)
 
     @ensure_arguments(Vector3)
@@ -660,7 +683,9 @@ class Cone:
 
         """
         return type(self)(
-            self.axis.rotate(axis, phi), self.secant.rotate(axis, phi), self.revangle
+            rotate_vector(self.axis, axis, phi),
+            rotate_vector(self.secant, axis, phi),
+            self.revangle,
         )
 
     def apical_angle(self):
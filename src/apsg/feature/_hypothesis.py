@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+from scipy.stats import chi2, f as fdist
+
+from apsg.config import apsg_conf
+from apsg.helpers._math import _unit_rows
+from apsg.helpers._helper import _random_state
+from apsg.feature._container import Vector3Set
+
+__all__ = ("rayleigh_test", "bingham_test", "gine_test", "watson_two_sample")
+
+
+def rayleigh_test(features, n_resamples=None, seed=None, max_memory=None):
+    """Rayleigh test of uniformity of directional data against unimodal
+    alternative.
+
+    Statistic is S = 3 * R**2 / n, where R is length of resultant of unit
+    vectors. Asymptotic p-value uses modified statistic
+    (1 - 1 / (2 * n)) * S + S**2 / (10 * n) with chi-square distribution with
+    3 degrees of freedom (Mardia & Jupp, 2000). Use ``bingham_test`` or
+    ``gine_test`` for axial data.
+
+    Args:
+        features: ``Vector3Set`` or (N, 3) array_like of vectors
+
+    Keyword Args:
+        n_resamples (int): number of Monte Carlo samples of uniform
+            distribution used for p-value. When None asymptotic p-value is
+            returned. Default None
+        seed: None (global numpy random state), int, ``np.random.SeedSequence``
+            or ``np.random.Generator``. Default None
+        max_memory (int): memory budget in bytes for batch of Monte Carlo
+            samples. Default apsg_conf["max_memory"]
+
+    Returns:
+        dictionary with keys 'statistic' and 'pvalue'
+
+    Example:
+        >>> g = vecset.random_fisher(n=50, kappa=2)
+        >>> rayleigh_test(g)
+    """
+
+    def statistic(X):
+        return 3 * np.sum(X.sum(axis=-2) ** 2, axis=-1) / X.shape[-2]
+
+    X = _unit_data(features)
+    n = len(X)
+    S = statistic(X)
+    if n_resamples is None:
+        Sm = (1 - 1 / (2 * n)) * S + S**2 / (10 * n)
+        return {"statistic": float(S), "pvalue": float(chi2.sf(Sm, 3))}
+    null = _uniform_null(statistic, n, n_resamples, seed, 72 * n, max_memory)
+    return {"statistic": float(S), "pvalue": _pvalue(S, null)}
+
+
+def bingham_test(features, n_resamples=None, seed=None, max_memory=None):
+    """Bingham test of uniformity of axial data against bipolar or girdle
+    alternatives.
+
+    Statistic is S = 15 * n / 2 * sum((tau - 1 / 3)**2), where tau are
+    eigenvalues of orientation tensor of unit vectors. Asymptotic null
+    distribution is chi-square with 5 degrees of freedom (Mardia & Jupp,
+    2000). Statistic is evaluated as 15 * n / 2 * (trace(T @ T) - 1 / 3)
+    without eigen-decomposition, so Monte Carlo samples are processed as
+    stacked arrays.
+
+    Args:
+        features: ``Vector3Set`` or (N, 3) array_like of vectors
+
+    Keyword Args:
+        n_resamples (int): number of Monte Carlo samples of uniform
+            distribution used for p-value. When None asymptotic p-value is
+            returned. Default None
+        seed: None (global numpy random state), int, ``np.random.SeedSequence``
+            or ``np.random.Generator``. Default None
+        max_memory (int): memory budget in bytes for batch of Monte Carlo
+            samples. Default apsg_conf["max_memory"]
+
+    Returns:
+        dictionary with keys 'statistic' and 'pvalue'
+
+    Example:
+        >>> g = folset.random_watson(n=50, kappa=-2)
+        >>> bingham_test(g)
+    """
+
+    def statistic(X):
+        n = X.shape[-2]
+        T = np.swapaxes(X, -1, -2) @ X / n
+        return 7.5 * n * (np.sum(T**2, axis=(-2, -1)) - 1 / 3)
+
+    X = _unit_data(features)
+    n = len(X)
+    S = statistic(X)
+    if n_resamples is None:
+        return {"statistic": float(S), "pvalue": float(chi2.sf(S, 5))}
+    null = _uniform_null(statistic, n, n_resamples, seed, 72 * n, max_memory)
+    return {"statistic": float(S), "pvalue": _pvalue(S, null)}
+
+
+def gine_test(features, axial=None, n_resamples=999, seed=None, max_memory=None):
+    """Gine test of uniformity consistent against all alternatives.
+
+    For axial data Gine's statistic Gn = n / 2 - 4 / (n * pi) * sum(sin(psi))
+    is used, for directional data Fn = 3 * n / 2 - 4 / (n * pi) *
+    sum(psi + sin(psi)), where psi are angles between all pairs of vectors
+    (Mardia & Jupp, 2000). Null distribution is simulated by Monte Carlo
+    samples of uniform distribution generated as stacked (samples, n, 3)
+    arrays. Pairwise angles are evaluated in chunks within memory budget.
+
+    Args:
+        features: ``Vector3Set`` or (N, 3) array_like of vectors
+
+    Keyword Args:
+        axial (bool): whether data are axial. When None, it is True for
+            ``FeatureSet`` of axial features. Default None
+        n_resamples (int): number of Monte Carlo samples. Default 999
+        seed: None (global numpy random state), int, ``np.random.SeedSequence``
+            or ``np.random.Generator``. Default None
+        max_memory (int): memory budget in bytes for batch of Monte Carlo
+            samples. Default apsg_conf["max_memory"]
+
+    Returns:
+        dictionary with keys 'statistic' and 'pvalue'
+
+    Example:
+        >>> g = folset.random_watson(n=50, kappa=-2)
+        >>> gine_test(g)
+    """
+    if axial is None:
+        axial = _is_axial(features)
+    if max_memory is None:
+        max_memory = apsg_conf["max_memory"]
+
+    def statistic(X):
+        m, n = X.shape[0], X.shape[1]
+        # angles and temporary arrays of row block against all vectors
+        rows = max(1, max_memory // (32 * m * n))
+        total = np.zeros(m)
+        for i in range(0, n, rows):
+            c = np.clip(X[:, i : i + rows] @ np.swapaxes(X, -1, -2), -1, 1)
+            s = np.sqrt(1 - c**2)
+            if not axial:
+                s += np.arccos(c)
+            total += s.sum(axis=(1, 2))
+        # every pair is counted twice
+        return (0.5 if axial else 1.5) * n - 2 * total / (n * np.pi)
+
+    X = _unit_data(features)
+    n = len(X)
+    S = statistic(X[None])[0]
+    null = _uniform_null(statistic, n, n_resamples, seed, 32 * n * n, max_memory)
+    return {"statistic": float(S), "pvalue": _pvalue(S, null)}
+
+
+def watson_two_sample(
+    features1, features2, axial=None, n_resamples=999, seed=None, max_memory=None
+):
+    """Watson two-sample test of common mean direction or common principal
+    axis.
+
+    For directional data statistic is R1 + R2 - R, where R1, R2 and R are
+    lengths of resultants of samples and pooled data (Watson & Williams,
+    1956). For axial data largest eigenvalues of sums of outer products of
+    samples and pooled data are used instead of resultant lengths. Null
+    distribution is simulated by random permutations of pooled data, which
+    are processed in chunks as stacked arrays. When n_resamples is None,
+    asymptotic F test for Fisher distributed directional data is used.
+
+    Args:
+        features1, features2: ``Vector3Set`` or (N, 3) array_like of vectors
+
+    Keyword Args:
+        axial (bool): whether data are axial. When None, it is True for
+            ``FeatureSet`` of axial features. Default None
+        n_resamples (int): number of random permutations. Default 999
+        seed: None (global numpy random state), int, ``np.random.SeedSequence``
+            or ``np.random.Generator``. Default None
+        max_memory (int): memory budget in bytes for batch of permutations.
+            Default apsg_conf["max_memory"]
+
+    Returns:
+        dictionary with keys 'statistic' and 'pvalue'
+
+    Example:
+        >>> g1 = linset.random_fisher(n=30, position=lin(120, 40), kappa=20)
+        >>> g2 = linset.random_fisher(n=30, position=lin(130, 45), kappa=20)
+        >>> watson_two_sample(g1, g2)
+    """
+    if axial is None:
+        axial = _is_axial(features1) and _is_axial(features2)
+    X1, X2 = _unit_data(features1), _unit_data(features2)
+    X = np.concatenate((X1, X2))
+    n1, n = len(X1), len(X)
+    if axial:
+        # flattened outer products of pooled vectors
+        X = (X[:, :, None] * X[:, None, :]).reshape(-1, 9)
+
+    total = X.sum(axis=0)
+    size = _largest_eigenvalue if axial else lambda A: np.linalg.norm(A, axis=-1)
+
+    def statistic(A):
+        # A are (m, 3) resultants or (m, 9) sums of outer products of samples
+        # drawn as first one
+        return size(A) + size(total - A) - size(total[None])
+
+    S = statistic(X[:n1].sum(axis=0)[None])[0]
+    if n_resamples is None:
+        if axial:
+            raise ValueError("Asymptotic test is available only for directional data.")
+        R12 = np.linalg.norm(X1.sum(axis=0)) + np.linalg.norm(X2.sum(axis=0))
+        F = (n - 2) * S / (n - R12)
+        return {"statistic": float(S), "pvalue": float(fdist.sf(F, 2, 2 * (n - 2)))}
+    if max_memory is None:
+        max_memory = apsg_conf["max_memory"]
+    rng = _random_state(seed)
+    # random keys, permutations and weights per replicate
+    chunk = max(1, max_memory // (24 * n))
+    null = []
+    for start in range(0, n_resamples, chunk):
+        m = min(chunk, n_resamples - start)
+        idx = np.argsort(rng.random((m, n)), axis=1)[:, :n1]
+        w = np.zeros((m, n))
+        np.put_along_axis(w, idx, 1, axis=1)
+        null.append(statistic(w @ X))
+    return {"statistic": float(S), "pvalue": _pvalue(S, np.concatenate(null))}
+
+
+def _unit_data(features):
+    return _unit_rows(np.asarray(features, dtype=float).reshape(-1, 3))
+
+
+def _is_axial(features):
+    return isinstance(features, Vector3Set) and features._axial
+
+
+def _largest_eigenvalue(A):
+    return np.linalg.eigvalsh(A.reshape(-1, 3, 3))[:, -1]
+
+
+def _uniform_null(statistic, n, n_resamples, seed, nbytes, max_memory=None):
+    """Return statistic of n_resamples uniform samples of n unit vectors.
+    Samples are generated as stacked (m, n, 3) arrays, where m is limited by
+    memory budget and nbytes needed per sample."""
+    if max_memory is None:
+        max_memory = apsg_conf["max_memory"]
+    rng = _random_state(seed)
+    chunk = max(1, max_memory // nbytes)
+    null = []
+    for start in range(0, n_resamples, chunk):
+        m = min(chunk, n_resamples - start)
+        X = rng.standard_normal((m, n, 3))
+        X /= np.linalg.norm(X, axis=2, keepdims=True)
+        null.append(statistic(X))
+    return np.concatenate(null)
+
+
+def _pvalue(S, null):
+    """Return Monte Carlo p-value of observed statistic S"""
+    return float((1 + np.sum(null >= S)) / (1 + len(null)))
@@ -9,6 +9,7 @@ import numpy as np
 
 from apsg.helpers._helper import eformat
 from apsg.math._vector import Vector3
+from apsg.math._rotation import axisangle_matrix
 from apsg.feature._geodata import Lineation, Foliation, Pair
 from apsg.feature._container import Vector3Set
 from apsg.feature._tensor3 import DeformationGradient3
@@ -398,9 +399,12 @@ class Core(object):
     @property
     def tilt(self):
         """Returns ``Vector3Set`` of vectors in tilt‐corrected coordinates system"""
-        return self.geo.rotate(
+        H = DeformationGradient3.from_two_pairs(self.sref, self.gref)
+        R = axisangle_matrix(
             Lineation(self.bedding.geo[0] - 90, 0), -self.bedding.geo[1]
         )
+        # back-rotation composed with in-situ transformation, so one pass only
+        return self.V.transform(R @ H)
 
     def pca(self, kind="geo", origin=False):
         """
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy.stats import norm
+
+from apsg.config import apsg_conf
+from apsg.helpers._math import _unit_rows
+from apsg.feature._tensor3 import Stress3
+from apsg.feature._container import (
+    Vector3Set,
+    FaultSet,
+    Stress3Set,
+    _rotate_rows,
+)
+
+__all__ = ("stress_inversion",)
+
+
+def stress_inversion(
+    faults,
+    n_axes=500,
+    n_spin=18,
+    n_ratio=11,
+    refine=4,
+    confidence=0.95,
+    processes=1,
+    max_memory=None,
+):
+    """Return reduced paleostress tensor which best explains fault-slip data.
+
+    Wallace-Bott hypothesis is used, i.e. slip on each fault is parallel to
+    the resolved shear stress. Misfit of fault is the angle between observed
+    and predicted slip directions (sense of slip is respected) and the best-fit
+    tensor minimizes mean misfit. Reduced tensors are searched on a grid of
+    orientations of principal axes and shape ratios, followed by iterative
+    refinement around the best candidate. Misfits are evaluated for chunks of
+    candidate tensors at once, optionally distributed across process pool.
+
+    Sign convention of stress follows ``Stress3``, i.e. compressive stress is
+    negative and faults calculated by ``Stress3.fault`` on planes with
+    compressive normal stress have zero misfit.
+
+    Args:
+        faults: ``FaultSet`` or sequence of ``Fault`` objects
+
+    Keyword Args:
+        n_axes (int): number of sigma1 directions in search grid. Default 500
+        n_spin (int): number of sigma3 directions around each sigma1 direction.
+            Default 18
+        n_ratio (int): number of shape ratios in search grid. Default 11
+        refine (int): number of refinement iterations. Default 4
+        confidence (float): confidence level of misfit confidence region.
+            Default 0.95
+        processes (int): number of worker processes. None uses all CPUs.
+            Default 1
+        max_memory (int): memory budget in bytes for misfit evaluation of
+            chunk of candidate tensors. Default apsg_conf["max_memory"]
+
+    Returns:
+        dictionary with keys:
+          - 'stress': best-fit reduced ``Stress3`` with sigma1 = -1 and
+            sigma3 = 0
+          - 'R': shape ratio (sigma1 - sigma2) / (sigma1 - sigma3)
+          - 'misfit': mean misfit in degrees
+          - 'misfits': array of misfits of individual faults in degrees
+          - 'region': ``Stress3Set`` of evaluated tensors with mean misfit within
+            confidence region of best-fit
+          - 'region_misfit': array of mean misfits of tensors in region
+
+    Example:
+        >>> S = stress.from_comp(xx=-5, yy=-2, zz=-1, xy=1)
+        >>> f = S.fault(folset.random_fisher(n=50, kappa=1))
+        >>> res = stress_inversion(f)
+        >>> res['R'], res['misfit']
+    """
+    if not isinstance(faults, FaultSet):
+        faults = FaultSet(faults)
+    data = np.asarray(faults._data)
+    fvec, lvec = _unit_rows(data[:, :3]), _unit_rows(data[:, 3:])
+    if max_memory is None:
+        max_memory = apsg_conf["max_memory"]
+    # traction, shear and temporary arrays of 3 components per fault
+    chunk = max(1, max_memory // (96 * len(fvec)))
+
+    s1, s2, R = _grid_candidates(n_axes, n_spin, n_ratio)
+    with _Evaluator(fvec, lvec, chunk, processes) as evaluate:
+        misfit = evaluate(_reduced_stress(s1, s2, R))
+        cs1, cs2, cR, cmisfit = [s1], [s2], [R], [misfit]
+        ix = np.argmin(misfit)
+        step = 90 / np.sqrt(n_axes)
+        dR = 1 / max(n_ratio - 1, 1)
+        for _ in range(refine):
+            s1, s2, R = _perturbed_candidates(s1[ix], s2[ix], R[ix], step, dR)
+            misfit = evaluate(_reduced_stress(s1, s2, R))
+            cs1.append(s1), cs2.append(s2), cR.append(R), cmisfit.append(misfit)
+            ix = np.argmin(misfit)
+            step, dR = step / 2, dR / 2
+    s1, s2, R = np.concatenate(cs1), np.concatenate(cs2), np.concatenate(cR)
+    misfit = np.concatenate(cmisfit)
+    ix = np.argmin(misfit)
+    best = _reduced_stress(s1[ix : ix + 1], s2[ix : ix + 1], R[ix : ix + 1])
+    misfits = _misfits(best, fvec, lvec)[0]
+    # mean misfits within confidence interval of best-fit mean misfit
+    se = misfits.std(ddof=1) / np.sqrt(len(misfits)) if len(misfits) > 1 else 0
+    inside = misfit <= misfit[ix] + norm.ppf(confidence) * se
+    return {
+        "stress": Stress3(best[0]),
+        "R": float(R[ix]),
+        "misfit": float(misfit[ix]),
+        "misfits": misfits,
+        "region": Stress3Set._from_array(
+            _reduced_stress(s1[inside], s2[inside], R[inside]), name=faults.name
+        ),
+        "region_misfit": misfit[inside],
+    }
+
+
+class _Evaluator:
+    """Evaluate mean misfits of candidate tensors in chunks, optionally in pool"""
+
+    def __init__(self, fvec, lvec, chunk, processes):
+        self.fvec, self.lvec, self.chunk = fvec, lvec, chunk
+        self.pool = ProcessPoolExecutor(processes) if processes != 1 else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        if self.pool is not None:
+            self.pool.shutdown()
+
+    def __call__(self, S):
+        chunks = [S[i : i + self.chunk] for i in range(0, len(S), self.chunk)]
+        if self.pool is None:
+            res = [_mean_misfits(c, self.fvec, self.lvec) for c in chunks]
+        else:
+            n = len(chunks)
+            res = self.pool.map(_mean_misfits, chunks, [self.fvec] * n, [self.lvec] * n)
+        return np.concatenate(list(res))
+
+
+def _misfits(S, fvec, lvec):
+    """Return (M, N) array of angles between observed and predicted slip"""
+    t = fvec @ np.swapaxes(S, -1, -2)
+    tn = np.sum(t * fvec, axis=-1, keepdims=True)
+    tau = _unit_rows(t - tn * fvec)
+    # block on side of fault normal moves against resolved shear traction
+    c = -np.sum(tau * lvec, axis=-1)
+    return np.degrees(np.arccos(np.clip(c, -1, 1)))
+
+
+def _mean_misfits(S, fvec, lvec):
+    return _misfits(S, fvec, lvec).mean(axis=1)
+
+
+def _reduced_stress(s1, s2, R):
+    """Return (M, 3, 3) reduced stress tensors with sigma1 = -1, sigma3 = 0 and
+    sigma2 = R - 1 for principal directions s1 and s2"""
+    return -s1[:, :, None] * s1[:, None, :] + (R - 1)[:, None, None] * (
+        s2[:, :, None] * s2[:, None, :]
+    )
+
+
+def _grid_candidates(n_axes, n_spin, n_ratio):
+    """Return sigma1 and sigma2 directions and shape ratios of search grid"""
+    a = np.asarray(Vector3Set.uniform_gss(n=2 * n_axes))
+    a = a[a[:, 2] >= 0]
+    # reference direction perpendicular to sigma1
+    ref = np.cross(a, np.where(np.abs(a[:, 2:]) < 0.9, [0, 0, 1], [1, 0, 0]))
+    ref = _unit_rows(ref)
+    spin = np.arange(n_spin) * 180 / n_spin
+    s1 = np.repeat(a, n_spin, axis=0)
+    s2 = _rotate_rows(np.repeat(ref, n_spin, axis=0), s1, np.tile(spin, len(a)))
+    R = np.linspace(0, 1, n_ratio)
+    return (
+        np.repeat(s1, n_ratio, axis=0),
+        np.repeat(s2, n_ratio, axis=0),
+        np.tile(R, len(s1)),
+    )
+
+
+def _perturbed_candidates(s1, s2, R, step, dR, n_axes=50, n_angles=5):
+    """Return candidates rotated from best-fit orientation by angles up to step
+    around uniformly distributed axes with shape ratios within dR"""
+    axes = np.asarray(Vector3Set.uniform_gss(n=n_axes))
+    angles = np.linspace(-step, step, n_angles)
+    axes = np.repeat(axes, n_angles, axis=0)
+    angles = np.tile(angles, n_axes)
+    s1 = _rotate_rows(np.broadcast_to(s1, axes.shape), axes, angles)
+    s2 = _rotate_rows(np.broadcast_to(s2, axes.shape), axes, angles)
+    ratios = np.clip(R + np.linspace(-dR, dR, 5), 0, 1)
+    n = len(ratios)
+    return (
+        np.repeat(s1, n, axis=0),
+        np.repeat(s2, n, axis=0),
+        np.tile(ratios, len(s1)),
+    )
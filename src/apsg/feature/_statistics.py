@@ -1,70 +1,164 @@
 import math
+import os
+from functools import lru_cache
+
 import numpy as np
 
-from scipy.special import gamma as gamma_fun
-from scipy.special import iv as modified_bessel_2ndkind
-from scipy.special import ivp as modified_bessel_2ndkind_derivative
-from scipy.stats import uniform
-from scipy.stats import norm as gauss
-from scipy.optimize import minimize_scalar
+from scipy.special import gammaln, xlogy, logsumexp, dawsn, erf
+from scipy.special import ive as bessel_ive
+from scipy.optimize import minimize, minimize_scalar, brentq
+from scipy.integrate import quad
+from scipy.interpolate import RectBivariateSpline
+
+from apsg.config import apsg_conf
+from apsg.helpers._math import acosd, _unit_rows
+from apsg.helpers._helper import _random_state
+from apsg.math._vector import Vector3
+from apsg.feature._tensor3 import OrientationTensor3
 
+_BINGHAM_TABLE = os.path.join(os.path.dirname(__file__), "data", "bingham.npz")
 
-def vonMisesFisher(mu, kappa, num_samples):
+
+def vonMisesFisher(mu, kappa, num_samples, seed=None):
     """Generate N samples from von Mises Fisher
     distribution around center mu in R^N with concentration kappa.
 
-    Adopted from https://github.com/jasonlaska/spherecluster
-    """
+    Rejection sampling of Wood (1994) is evaluated in vectorized blocks.
 
-    def _sample_weight(kappa):
-        """Rejection sampling scheme for sampling distance from center on
-        surface of the sphere.
-        """
-        b = 2 / (np.sqrt(4.0 * kappa**2 + 4) + 2 * kappa)
-        x = (1.0 - b) / (1.0 + b)
-        c = kappa * x + 2 * np.log(1 - x**2)
+    Wood, A. T. A. (1994). Simulation of the von Mises Fisher distribution.
+        Communications in Statistics - Simulation and Computation, 23(1), 157-164.
 
-        while True:
-            z = np.random.beta(1, 1)
-            w = (1.0 - (1.0 + b) * z) / (1.0 - (1.0 - b) * z)
-            u = np.random.uniform(low=0, high=1)
-            if kappa * w + 2 * np.log(1.0 - x * w) - c >= np.log(u):
-                return w
-
-    def _sample_orthonormal_to(mu):
-        """Sample point on sphere orthogonal to mu."""
-        v = np.random.randn(mu.shape[0])
-        proj_mu_v = mu * np.dot(mu, v) / np.linalg.norm(mu)
-        orthto = v - proj_mu_v
-        return orthto / np.linalg.norm(orthto)
-
-    result = np.zeros((num_samples, 3))
-    for nn in range(num_samples):
-        # sample offset from center (on sphere) with spread kappa
-        w = _sample_weight(kappa)
-
-        # sample a point v on the unit sphere that's orthogonal to mu
-        v = _sample_orthonormal_to(mu)
-
-        # compute new point
-        result[nn, :] = v * np.sqrt(1.0 - w**2) + w * mu
-
-    return result
-
-
-def estimate_k(features):
-    # objective function to be minimized
-    def obj_fun(k):
-        W = np.exp(
-            k * (np.abs(np.dot(np.asarray(features), np.asarray(features).T)))
-        ) * (k / (4 * math.pi * math.sinh(k + 1e-9)))
-        np.fill_diagonal(W, 0.0)
-        return -np.log(W.sum(axis=0)).sum()
-
-    if len(features) > 1:
-        return minimize_scalar(obj_fun, bounds=(0.1, len(features)), method="bounded").x
-    else:
+    Keyword Args:
+      seed: None (global numpy random state), int, ``np.random.SeedSequence``
+        or ``np.random.Generator``. Default None
+    """
+    rng = _random_state(seed)
+    mu = np.asarray(mu, dtype=float)
+    mu = mu / np.linalg.norm(mu)
+    # sample offset from center (on sphere) with spread kappa
+    w = _wood_weights(kappa, len(mu), num_samples, rng)
+    # sample points on the unit sphere that are orthogonal to mu
+    v = rng.standard_normal((num_samples, len(mu)))
+    v = _unit_rows(v - np.outer(v @ mu, mu))
+    return v * np.sqrt(1.0 - w**2)[:, None] + w[:, None] * mu
+
+
+def _wood_weights(kappa, p, n, rng):
+    """Rejection sampling of cosines of distances from center in blocks"""
+    b = (p - 1) / (np.sqrt(4.0 * kappa**2 + (p - 1) ** 2) + 2 * kappa)
+    x = (1.0 - b) / (1.0 + b)
+    c = kappa * x + (p - 1) * np.log(1 - x**2)
+    w = np.empty(n)
+    done = 0
+    while done < n:
+        # acceptance rate is high, small oversampling avoids most extra blocks
+        size = int(1.1 * (n - done)) + 10
+        z = rng.beta((p - 1) / 2, (p - 1) / 2, size)
+        ws = (1.0 - (1.0 + b) * z) / (1.0 - (1.0 - b) * z)
+        u = rng.uniform(size=size)
+        ws = ws[kappa * ws + (p - 1) * np.log(1.0 - x * ws) - c >= np.log(u)]
+        ws = ws[: n - done]
+        w[done : done + len(ws)] = ws
+        done += len(ws)
+    return w
+
+
+def estimate_k(features, max_memory=None, max_n=None):
+    """Estimate concentration of exponential Kamb kernel by maximizing
+    leave-one-out likelihood of data.
+
+    Absolute dot products of all pairs are calculated only once when they fit
+    in memory budget, otherwise they are evaluated in memory-bounded blocks of
+    rows. Maximum is found by safeguarded Newton iterations on analytic
+    derivatives of likelihood, so only few passes over data are needed.
+
+    As each pass evaluates exponentials of all pairs, larger data are
+    represented by fixed random subsample of max_n features. Concentration
+    estimated from subsample is rescaled by (N / max_n)**(1 / 3), as optimal
+    kernel width for density on sphere decreases with N**(-1 / 6).
+
+    Args:
+      features: ``Vector3Set`` or (N, 3) array
+
+    Keyword Args:
+      max_memory: memory budget in bytes. Default is ``apsg_conf["max_memory"]``
+      max_n: maximum number of features used for estimate. Default is
+        ``apsg_conf["estimate_k_max_n"]``
+    """
+    x = np.asarray(features, dtype=float).reshape(-1, 3)
+    n = len(x)
+    if max_n is None:
+        max_n = apsg_conf["estimate_k_max_n"]
+    if n > max_n >= 2:
+        # fixed generator gives reproducible subsample without consuming
+        # global random state
+        idx = np.random.default_rng(0).choice(n, max_n, replace=False)
+        k = estimate_k(x[idx], max_memory=max_memory, max_n=max_n)
+        return k * (n / max_n) ** (1 / 3)
+    if n < 2:
         return 1
+    if max_memory is None:
+        max_memory = apsg_conf["max_memory"]
+    # shifted cosines and two temporary arrays
+    rows = max(1, max_memory // (24 * n))
+
+    def dots(i):
+        # absolute cosines of rows from i to all data, self excluded
+        c = np.abs(x[i : i + rows] @ x.T)
+        # exponentials of excluded self are exactly zero for any k in bounds
+        c[np.arange(len(c)), np.arange(i, i + len(c))] = -1e6
+        # shift rows by maxima, so exponentials do not underflow
+        cmax = c.max(axis=1)
+        return c - cmax[:, None], cmax.sum() - len(c)
+
+    if rows >= n:
+        cached = [dots(0)]
+        blocks = cached.__iter__
+    else:
+
+        def blocks():
+            for i in range(0, n, rows):
+                yield dots(i)
+
+    def derivatives(k):
+        # first and second derivative of log likelihood with respect to k
+        q = np.exp(-2 * k)
+        d1 = n * (1 / k - 2 * q / (1 - q))
+        d2 = n * (4 * q / (1 - q) ** 2 - 1 / k**2)
+        for d, shift in blocks():
+            e = np.exp(k * d)
+            de = d * e
+            S, A, B = e.sum(axis=1), de.sum(axis=1), (d * de).sum(axis=1)
+            d1 += shift + np.sum(A / S)
+            d2 += np.sum(B / S - (A / S) ** 2)
+        return d1, d2
+
+    # Newton iterations for root of k * d1, which is nearly linear in k, with
+    # bisection fallback within bounds. Initial guess is based on distances
+    # to nearest neighbours.
+    lo, hi = 0.1, float(n)
+    nn = -sum(shift for _, shift in blocks())
+    k = min(max(n / nn, lo), hi) if nn > 0 else hi
+    for _ in range(100):
+        d1, d2 = derivatives(k)
+        if d1 == 0:
+            break
+        if d1 > 0:
+            if k == hi:
+                break
+            lo = k
+        else:
+            if k == lo:
+                break
+            hi = k
+        slope = d1 + k * d2
+        knew = k - k * d1 / slope if slope < 0 else np.inf
+        if not lo < knew < hi:
+            knew = np.sqrt(lo * hi)
+        if abs(knew - k) < 1e-6 * k:
+            break
+        k = knew
+    return k
 
 
 class KentDistribution(object):
@@ -145,6 +239,54 @@ class KentDistribution(object):
         psi = np.arctan2(u[2][0], u[1][0])
         return (theta, phi, psi)
 
+    @classmethod
+    def fit(cls, xs, method="mle"):
+        """
+        Returns ``KentDistribution`` fitted to 3D unit vectors in xs with
+        shape (N, 3).
+
+        Axes are estimated by moment method of Kent (1982). With method
+        "moment", kappa and beta are moment estimates too, with method "mle"
+        they are maximum likelihood estimates for given axes, found using
+        analytic gradient of log likelihood.
+        """
+
+        xs = _unit_rows(np.asarray(xs, dtype=float))
+        xbar = xs.mean(axis=0)
+        S = xs.T @ xs / len(xs)
+        r1 = np.linalg.norm(xbar)
+        theta, phi = cls.gamma1_to_spherical_coordinates(xbar / r1)
+        H = cls.create_matrix_H(theta, phi)
+        B = H.T @ S @ H
+        psi = 0.5 * np.arctan2(2 * B[1, 2], B[1, 1] - B[2, 2])
+        Gamma = H @ cls.create_matrix_K(psi)
+        T = Gamma.T @ S @ Gamma
+        r2 = T[1, 1] - T[2, 2]
+        # moment estimates of kappa and beta
+        eps = 1e-12
+        a1 = 1 / max(2 - 2 * r1 - r2, eps)
+        a2 = 1 / max(2 - 2 * r1 + r2, eps)
+        kappa, beta = a1 + a2, max((a1 - a2) / 2, 0.0)
+        if method == "mle":
+            # sufficient statistics for given axes
+            m = np.array([Gamma[:, 0] @ xbar, r2])
+
+            def obj(p):
+                logc, dlogc, _ = _kent_series(*p)
+                return logc[()] - m @ p, dlogc - m
+
+            res = minimize(
+                obj,
+                [kappa, beta],
+                jac=True,
+                method="L-BFGS-B",
+                bounds=[(1e-6, None), (0, None)],
+            )
+            kappa, beta = res.x
+        elif method != "moment":
+            raise ValueError("Method must be 'mle' or 'moment'.")
+        return cls(Gamma[:, 0], Gamma[:, 1], Gamma[:, 2], kappa, beta)
+
     def __init__(self, gamma1, gamma2, gamma3, kappa, beta):
         self.gamma1 = np.array(gamma1, dtype=np.float64)
         self.gamma2 = np.array(gamma2, dtype=np.float64)
@@ -161,9 +303,6 @@ class KentDistribution(object):
         for gamma in (gamma1, gamma2, gamma3):
             assert len(gamma) == 3
 
-        self._cached_rvs = np.array([], dtype=np.float64)
-        self._cached_rvs.shape = (0, 3)
-
     def __repr__(self):
         return "kent(%s, %s, %s, %s, %s)" % (
             self.theta,
@@ -177,53 +316,29 @@ class KentDistribution(object):
     def Gamma(self):
         return self.create_matrix_Gamma(self.theta, self.phi, self.psi)
 
-    def normalize(self, cache=dict(), return_num_iterations=False):
+    def normalize(self, return_num_iterations=False):
         """
         Returns the normalization constant of the Kent distribution.
         The proportional error may be expected not to be greater than
         1E-11.
         """
 
-        (k, b) = (self.kappa, self.beta)
-        if (k, b) not in cache:
-            G = gamma_fun
-            Imb2 = modified_bessel_2ndkind
-            result = 0.0
-            j = 0
-            if b == 0.0:
-                result = (0.5 * k) ** (-2 * j - 0.5) * Imb2(2 * j + 0.5, k)
-                result /= G(j + 1)
-                result *= G(j + 0.5)
-            else:
-
-                while True:
-                    a = np.exp(
-                        np.log(b) * 2 * j + np.log(0.5 * k) * (-2 * j - 0.5)
-                    ) * Imb2(2 * j + 0.5, k)
-                    a /= G(j + 1)
-                    a *= G(j + 0.5)
-                    result += a
-
-                    j += 1
-                    if abs(a) < abs(result) * 1e-12 and j > 5:
-                        break
-
-            cache[k, b] = 2 * np.pi * result
+        logc, _, j = _kent_series_cached(self.kappa, self.beta)
         if return_num_iterations:
-            return (cache[k, b], j)
+            return (np.exp(logc), j)
         else:
-            return cache[k, b]
+            return np.exp(logc)
 
     def log_normalize(self, return_num_iterations=False):
         """
         Returns the logarithm of the normalization constant.
         """
 
+        logc, _, j = _kent_series_cached(self.kappa, self.beta)
         if return_num_iterations:
-            (normalize, num_iter) = self.normalize(return_num_iterations=True)
-            return (np.log(normalize), num_iter)
+            return (logc, j)
         else:
-            return np.log(self.normalize())
+            return logc
 
     def pdf_max(self, normalize=True):
         return np.exp(self.log_pdf_max(normalize))
@@ -296,87 +411,28 @@ class KentDistribution(object):
         else:
             return df
 
-    def normalize_prime(self, cache=dict(), return_num_iterations=False):
+    def normalize_prime(self, return_num_iterations=False):
         """
         Returns the derivative of the normalization factor with respect
         to kappa and beta.
         """
 
-        (k, b) = (self.kappa, self.beta)
-        if (k, b) not in cache:
-            G = gamma_fun
-            Imb2 = modified_bessel_2ndkind
-            (dcdk, dcdb) = (0.0, 0.0)
-            j = 0
-            if b == 0:
-                dcdk = (
-                    G(j + 0.5)
-                    / G(j + 1)
-                    * ((-0.5 * j - 0.125) * k ** (-2 * j - 1.5))
-                    * Imb2(2 * j + 0.5, k)
-                )
-                dcdk += (
-                    G(j + 0.5)
-                    / G(j + 1)
-                    * (0.5 * k) ** (-2 * j - 0.5)
-                    * modified_bessel_2ndkind_derivative(2 * j + 0.5, k, 1)
-                )
-
-                dcdb = 0.0
-            else:
-                while True:
-                    dk = (
-                        (-1 * j - 0.25)
-                        * np.exp(np.log(b) * 2 * j + np.og(0.5 * k) * (-2 * j - 1.5))
-                        * Imb2(2 * j + 0.5, k)
-                    )
-                    dk += np.exp(
-                        np.log(b) * 2 * j + np.log(0.5 * k) * (-2 * j - 0.5)
-                    ) * modified_bessel_2ndkind_derivative(2 * j + 0.5, k, 1)
-                    dk /= G(j + 1)
-                    dk *= G(j + 0.5)
-
-                    db = (
-                        2
-                        * j
-                        * np.exp(
-                            np.log(b) * (2 * j - 1) + np.log(0.5 * k) * (-2 * j - 0.5)
-                        )
-                        * Imb2(2 * j + 0.5, k)
-                    )
-                    db /= G(j + 1)
-                    db *= G(j + 0.5)
-                    dcdk += dk
-                    dcdb += db
-
-                    j += 1
-                    if (
-                        abs(dk) < abs(dcdk) * 1e-12
-                        and abs(db) < abs(dcdb) * 1e-12
-                        and j > 5
-                    ):
-                        break
-
-            # print("dc", dcdk, dcdb, "(", k, b)
-
-            cache[k, b] = 2 * np.pi * np.array([dcdk, dcdb])
+        logc, dlogc, j = _kent_series_cached(self.kappa, self.beta)
         if return_num_iterations:
-            return (cache[k, b], j)
+            return (np.exp(logc) * np.array(dlogc), j)
         else:
-            return cache[k, b]
+            return np.exp(logc) * np.array(dlogc)
 
     def log_normalize_prime(self, return_num_iterations=False):
         """
         Returns the derivative of the logarithm of the normalization factor.
         """
 
+        _, dlogc, j = _kent_series_cached(self.kappa, self.beta)
         if return_num_iterations:
-            (normalize_prime, num_iter) = self.normalize_prime(
-                return_num_iterations=True
-            )
-            return (normalize_prime / self.normalize(), num_iter)
+            return (np.array(dlogc), j)
         else:
-            return self.normalize_prime() / self.normalize()
+            return np.array(dlogc)
 
     def log_likelihood(self, xs):
         """
@@ -398,33 +454,841 @@ class KentDistribution(object):
         else:
             return np.sum(retval, len(np.shape(retval)) - 1)
 
-    def _rvs_helper(self):
-        num_samples = 10000
-        xs = gauss(0, 1).rvs((num_samples, 3))
-        xs = np.divide(xs, np.reshape(np.linalg.norm(xs, axis=1), (num_samples, 1)))
-        pvalues = self.pdf(xs, normalize=False)
-        fmax = self.pdf_max(normalize=False)
-        return xs[uniform(0, fmax).rvs(num_samples) < pvalues]
-
-    def rvs(self, n_samples=None):
+    def rvs(self, n_samples=None, seed=None):
         """
-        Returns random samples from the Kent distribution by rejection sampling.
-        May become inefficient for large kappas.
+        Returns random samples from the Kent distribution.
+
+        Samples are generated in vectorized blocks using the approach of Kent,
+        Ganeiber & Mardia (2018). In the Lambert equal-area projection centered
+        on gamma1 the density factorizes into two independent one-dimensional
+        densities, which are simulated by rejection from normal or uniform
+        envelopes, so the acceptance rate remains bounded for any kappa and beta.
+
+        Kent, J. T., Ganeiber, A. M., & Mardia, K. V. (2018). A new unified
+            approach for the simulation of a wide class of directional
+            distributions. Journal of Computational and Graphical Statistics,
+            27(2), 291-301.
 
         The returned random samples are 3D unit vectors.
         If n_samples == None then a single sample x is returned with shape (3,)
         If n_samples is an integer value N then N samples are returned in an array with shape (N, 3)
+
+        Keyword Args:
+          seed: None (global numpy random state), int, ``np.random.SeedSequence``
+            or ``np.random.Generator``. Default None
         """
+        rng = _random_state(seed)
+        num_samples = 1 if n_samples is None else n_samples
+        k, b = self.kappa, self.beta
+        z = np.empty((num_samples, 2))
+        done = 0
+        while done < num_samples:
+            m = num_samples - done
+            zs = np.column_stack(
+                (
+                    _quartic_exponential(k / 2 - b, b / 4, m, rng),
+                    _quartic_exponential(k / 2 + b, -b / 4, m, rng),
+                )
+            )
+            zs = zs[np.sum(zs**2, axis=1) <= 4]
+            z[done : done + len(zs)] = zs
+            done += len(zs)
+        # inverse Lambert equal-area projection
+        r2 = np.sum(z**2, axis=1)
+        x = np.column_stack((1 - r2 / 2, z * np.sqrt(1 - r2 / 4)[:, None]))
+        rvs = x @ np.array([self.gamma1, self.gamma2, self.gamma3])
+        if n_samples is None:
+            return rvs[0]
+        return rvs
+
+
+def kent_log_normalize(kappa, beta, return_prime=False):
+    """Return logarithm of normalization constant of Kent distribution.
+
+    Series of modified Bessel functions (Kent, 1982) is evaluated in log-space
+    for arrays of kappa and beta at once, so it does not overflow for large
+    kappa.
+
+    Args:
+      kappa: concentration parameter(s)
+      beta: ellipticity parameter(s)
+
+    Keyword Args:
+      return_prime (bool): when True, also derivatives of logarithm of
+        normalization constant with respect to kappa and beta are returned
+        as array with shape (2, ...). Default False
+
+    Example:
+      >>> kent_log_normalize([10, 100, 1000], [2, 20, 200])
+    """
+    logc, dlogc, _ = _kent_series(kappa, beta)
+    if return_prime:
+        return logc, dlogc
+    return logc
+
+
+def _kent_series(kappa, beta, tol=1e-12, block=32):
+    """Return log normalization constant, its derivatives and number of terms"""
+    k, b = np.broadcast_arrays(np.asarray(kappa, float), np.asarray(beta, float))
+    if np.any(k < 0) or np.any(b < 0):
+        raise ValueError("Kappa and beta must be non-negative.")
+    shape = k.shape
+    k = np.maximum(k.reshape(-1, 1), 1e-12)
+    b = b.reshape(-1, 1)
+    logt, ratio = [], []
+    with np.errstate(divide="ignore", invalid="ignore"):
+        while True:
+            j = np.arange(len(logt) * block, (len(logt) + 1) * block)
+            v = 2 * j + 0.5
+            # terms scaled by exp(-kappa) using exponentially scaled Bessel
+            iv, iv1 = bessel_ive(v, k), bessel_ive(v + 1, k)
+            lt = (
+                gammaln(j + 0.5)
+                - gammaln(j + 1)
+                + xlogy(2 * j, b)
+                - v * np.log(k / 2)
+                + np.log(iv)
+            )
+            logt.append(lt)
+            ratio.append(np.where(iv > 0, iv1 / iv, 0))
+            total = logsumexp(np.hstack(logt), axis=1, keepdims=True)
+            last = lt[:, -1:]
+            if np.all(
+                (last < total + np.log(tol)) & (last <= lt[:, -2:-1])
+                | np.isneginf(last)
+                | np.isnan(last)
+            ):
+                break
+    logt, ratio = np.hstack(logt), np.hstack(ratio)
+    j = np.arange(logt.shape[1])
+    w = np.exp(logt - total)
+    dk = np.sum(w * ratio, axis=1)
+    db = np.sum(w * np.divide(2 * j, b, out=np.zeros_like(w), where=b > 0), axis=1)
+    logc = np.log(2 * np.pi) + k[:, 0] + total[:, 0]
+    return logc.reshape(shape), np.array([dk, db]).reshape((2,) + shape), len(j)
+
+
+@lru_cache(maxsize=1024)
+def _kent_series_cached(kappa, beta):
+    logc, dlogc, n = _kent_series(kappa, beta)
+    return float(logc), tuple(dlogc.tolist()), n
+
+
+def _quartic_exponential(a, c, n, rng):
+    """Sample n values from density proportional to exp(-a*u**2 - c*u**4) on
+    interval [-2, 2] by rejection from normal or uniform envelope"""
+
+    def log_bound(b):
+        # maximum of (b - a)*s - c*s**2 for s = u**2 in [0, 4]
+        s = [0.0, 4.0]
+        if c > 0:
+            s.append(min(max((b - a) / (2 * c), 0.0), 4.0))
+        return max((b - a) * v - c * v**2 for v in s)
+
+    # envelope exp(-b*u**2)
+    if c > 0:
+        b = (a + math.sqrt(a**2 + 4 * c)) / 2
+    else:
+        # c*u**4 >= 4*c*u**2 on [-2, 2]
+        b = a + 4 * c
+    use_normal = b > 0 and (
+        log_bound(b) + 0.5 * math.log(math.pi / b) < log_bound(0) + math.log(4)
+    )
+    logM = log_bound(b) if use_normal else log_bound(0)
+    u = np.empty(n)
+    done = 0
+    while done < n:
+        size = int(1.2 * (n - done)) + 10
+        if use_normal:
+            us = rng.standard_normal(size) / math.sqrt(2 * b)
+            logr = (b - a) * us**2 - c * us**4 - logM
+            ok = (np.abs(us) <= 2) & (np.log(rng.uniform(size=size)) <= logr)
+        else:
+            us = rng.uniform(-2, 2, size)
+            logr = -a * us**2 - c * us**4 - logM
+            ok = np.log(rng.uniform(size=size)) <= logr
+        us = us[ok][: n - done]
+        u[done : done + len(us)] = us
+        done += len(us)
+    return u
+
+
+class WatsonDistribution(object):
+    """
+    Watson distribution of axial data on unit sphere with density
+
+        f(x) = exp(kappa * (mu . x)**2) / c(kappa)
+
+    Positive kappa gives bipolar distribution concentrated around axis mu,
+    negative kappa gives girdle distribution concentrated around plane normal
+    to mu. Normalization constant c(kappa) = 4 * pi * M(1/2, 3/2, kappa), where
+    M is Kummer's confluent hypergeometric function, is evaluated in
+    closed form using error function or Dawson integral.
+
+    Mardia, K. V., & Jupp, P. E. (2000). Directional statistics. Wiley.
 
+    Args:
+      mu: axis of distribution as 3 elements array_like
+      kappa (float): concentration parameter
+
+    Example:
+      >>> wd = WatsonDistribution([0, 0, 1], -20)
+      >>> x = wd.rvs(100, seed=42)
+      >>> WatsonDistribution.fit(x)
+    """
+
+    def __init__(self, mu, kappa):
+        mu = np.asarray(mu, dtype=np.float64)
+        self.mu = mu / np.linalg.norm(mu)
+        self.kappa = float(kappa)
+
+    def __repr__(self):
+        return "watson(%s, %s)" % (self.mu.tolist(), self.kappa)
+
+    @classmethod
+    def from_ortensor(cls, ot, kind=None):
+        """
+        Returns maximum likelihood ``WatsonDistribution`` for orientation
+        tensor of unit vectors, i.e. mean of their outer products.
+
+        Bipolar distribution has axis along first eigenvector and girdle
+        distribution along third eigenvector of tensor.
+
+        Keyword Args:
+          kind: "bipolar", "girdle" or None. When None, kind with higher
+            likelihood is used. Default None
+        """
+        evals, evecs = np.linalg.eigh(np.asarray(ot, dtype=float))
+        evals = evals / evals.sum()
+        ix = {None: [2, 0], "bipolar": [2], "girdle": [0]}.get(kind)
+        if ix is None:
+            raise ValueError("Kind must be 'bipolar', 'girdle' or None.")
+        tau = evals[ix]
+        kappa = np.array([_watson_kappa(t) for t in tau])
+        # log likelihood per observation is kappa * tau - log(c(kappa))
+        best = np.argmax(kappa * tau - watson_log_normalize(kappa))
+        return cls(evecs[:, ix[best]], kappa[best])
+
+    @classmethod
+    def fit(cls, xs, kind=None):
+        """
+        Returns maximum likelihood ``WatsonDistribution`` fitted to 3D vectors
+        in xs with shape (N, 3). See ``from_ortensor`` for details.
+        """
+        xs = _unit_rows(np.asarray(xs, dtype=float))
+        return cls.from_ortensor(xs.T @ xs / len(xs), kind=kind)
+
+    def log_normalize(self):
+        """
+        Returns the logarithm of normalization constant.
+        """
+        return float(watson_log_normalize(self.kappa))
+
+    def normalize(self):
+        """
+        Returns the normalization constant.
+        """
+        return math.exp(self.log_normalize())
+
+    def log_pdf(self, xs):
+        """
+        Returns the logarithm of probability density function for 3D vectors in
+        xs with shape (..., 3).
+        """
+        return self.kappa * (np.asarray(xs) @ self.mu) ** 2 - self.log_normalize()
+
+    def pdf(self, xs):
+        """
+        Returns the probability density function for 3D vectors in xs.
+        """
+        return np.exp(self.log_pdf(xs))
+
+    def log_likelihood(self, xs):
+        """
+        Returns the log likelihood for xs.
+        """
+        return float(np.sum(self.log_pdf(xs)))
+
+    def rvs(self, n_samples=None, seed=None):
+        """
+        Returns random samples from the Watson distribution.
+
+        Samples are generated in vectorized blocks by rejection from angular
+        central Gaussian envelope (Kent, Ganeiber & Mardia, 2018).
+
+        If n_samples == None then a single sample x is returned with shape (3,)
+        If n_samples is an integer value N then N samples are returned in an
+        array with shape (N, 3)
+
+        Keyword Args:
+          seed: None (global numpy random state), int, ``np.random.SeedSequence``
+            or ``np.random.Generator``. Default None
+        """
+        rng = _random_state(seed)
         num_samples = 1 if n_samples is None else n_samples
-        rvs = self._cached_rvs
-        while len(rvs) < num_samples:
-            new_rvs = self._rvs_helper()
-            rvs = np.concatenate([rvs, new_rvs])
+        k = self.kappa
+        G = _orthonormal_frame(self.mu)
+        if k >= 0:
+            rvs = _bingham_rvs(k, k, num_samples, rng) @ G
+        else:
+            rvs = _bingham_rvs(0, -k, num_samples, rng) @ G[[1, 2, 0]]
         if n_samples is None:
-            self._cached_rvs = rvs[1:]
             return rvs[0]
+        return rvs
+
+
+def watson_log_normalize(kappa, return_prime=False):
+    """Return logarithm of normalization constant of Watson distribution.
+
+    Closed form expressions are evaluated for arrays of kappa at once.
+
+    Args:
+      kappa: concentration parameter(s)
+
+    Keyword Args:
+      return_prime (bool): when True, also derivative of logarithm of
+        normalization constant with respect to kappa, i.e. expected value of
+        (mu . x)**2, is returned. Default False
+
+    Example:
+      >>> watson_log_normalize([-100, -1, 0, 1, 100])
+    """
+    k = np.asarray(kappa, dtype=float)
+    s = np.sqrt(np.abs(k))
+    small = np.abs(k) < 1e-4
+    with np.errstate(divide="ignore", invalid="ignore"):
+        logm = np.where(
+            k > 0,
+            k + np.log(dawsn(s)) - np.log(s),
+            np.log(np.sqrt(np.pi) / 2) + np.log(erf(s)) - np.log(s),
+        )
+        dlogm = np.where(
+            k > 0,
+            1 / (2 * s * dawsn(s)) - 1 / (2 * k),
+            -1 / (2 * k) - np.exp(-s * s) / (np.sqrt(np.pi) * s * erf(s)),
+        )
+    # series of cumulants for small kappa
+    logm = np.where(small, k / 3 + 2 * k**2 / 45, logm)
+    dlogm = np.where(small, 1 / 3 + 4 * k / 45, dlogm)
+    logc = np.log(4 * np.pi) + logm
+    if return_prime:
+        return logc, dlogm
+    return logc
+
+
+def _watson_kappa(tau):
+    """Return kappa of Watson distribution with expected (mu . x)**2 = tau"""
+    tau = min(max(tau, 1e-12), 1 - 1e-12)
+    lo, hi = (0.0, 10 / (1 - tau)) if tau > 1 / 3 else (-10 / tau, 0.0)
+    return brentq(lambda k: watson_log_normalize(k, True)[1] - tau, lo, hi)
+
+
+class BinghamDistribution(object):
+    """
+    Bingham distribution of axial data on unit sphere with density
+
+        f(x) = exp(-kappa2 * (gamma2 . x)**2 - kappa3 * (gamma3 . x)**2) / c
+
+    where gamma1, gamma2 and gamma3 are orthonormal axes and
+    0 <= kappa2 <= kappa3 are concentration parameters. Axis gamma1 is mode,
+    gamma3 is pole to girdle. Equal kappas gives bipolar distribution,
+    zero kappa2 gives uniform girdle.
+
+    Normalization constant c = 4 * pi * 1F1(1/2; 3/2; -diag(kappa2, kappa3, 0))
+    is confluent hypergeometric function of matrix argument. It is served from
+    precomputed table interpolated by bicubic spline, so it is evaluated for
+    arrays of concentrations at once.
+
+    Bingham, C. (1974). An antipodally symmetric distribution on the sphere.
+        The Annals of Statistics, 2(6), 1201-1225.
+
+    Args:
+      gamma1, gamma2, gamma3: orthonormal axes as 3 elements array_like
+      kappa2, kappa3 (float): non-negative concentration parameters
+
+    Example:
+      >>> bd = BinghamDistribution([1, 0, 0], [0, 1, 0], [0, 0, 1], 5, 50)
+      >>> x = bd.rvs(100, seed=42)
+      >>> BinghamDistribution.fit(x)
+    """
+
+    def __init__(self, gamma1, gamma2, gamma3, kappa2, kappa3):
+        self.gamma1 = np.asarray(gamma1, dtype=np.float64)
+        self.gamma2 = np.asarray(gamma2, dtype=np.float64)
+        self.gamma3 = np.asarray(gamma3, dtype=np.float64)
+        self.kappa2 = float(kappa2)
+        self.kappa3 = float(kappa3)
+
+    def __repr__(self):
+        return "bingham(%s, %s, %s, %s, %s)" % (
+            self.gamma1.tolist(),
+            self.gamma2.tolist(),
+            self.gamma3.tolist(),
+            self.kappa2,
+            self.kappa3,
+        )
+
+    @property
+    def Gamma(self):
+        return np.column_stack((self.gamma1, self.gamma2, self.gamma3))
+
+    @classmethod
+    def from_ortensor(cls, ot):
+        """
+        Returns maximum likelihood ``BinghamDistribution`` for orientation
+        tensor of unit vectors, i.e. mean of their outer products.
+
+        Axes are eigenvectors of tensor and concentrations solve likelihood
+        equations for its eigenvalues, using analytic gradient of tabulated
+        normalization constant.
+        """
+        evals, evecs = np.linalg.eigh(np.asarray(ot, dtype=float))
+        tau = np.maximum(evals[:2] / evals.sum(), 1e-12)
+
+        def obj(p):
+            logc, dlogc = bingham_log_normalize(p[1], p[0], return_prime=True)
+            return float(logc) + tau @ p, dlogc[::-1] + tau
+
+        # kappa3 and kappa2 of concentrated distribution as initial guess
+        res = minimize(
+            obj,
+            np.maximum(1 / (2 * tau) - 1.5, 0),
+            jac=True,
+            method="L-BFGS-B",
+            bounds=[(0, None), (0, None)],
+        )
+        kappa3, kappa2 = res.x
+        return cls(evecs[:, 2], evecs[:, 1], evecs[:, 0], kappa2, kappa3)
+
+    @classmethod
+    def fit(cls, xs):
+        """
+        Returns maximum likelihood ``BinghamDistribution`` fitted to 3D vectors
+        in xs with shape (N, 3). See ``from_ortensor`` for details.
+        """
+        xs = _unit_rows(np.asarray(xs, dtype=float))
+        return cls.from_ortensor(xs.T @ xs / len(xs))
+
+    def log_normalize(self):
+        """
+        Returns the logarithm of normalization constant.
+        """
+        return float(bingham_log_normalize(self.kappa2, self.kappa3))
+
+    def normalize(self):
+        """
+        Returns the normalization constant.
+        """
+        return math.exp(self.log_normalize())
+
+    def log_pdf(self, xs):
+        """
+        Returns the logarithm of probability density function for 3D vectors in
+        xs with shape (..., 3).
+        """
+        xs = np.asarray(xs)
+        return (
+            -self.kappa2 * (xs @ self.gamma2) ** 2
+            - self.kappa3 * (xs @ self.gamma3) ** 2
+            - self.log_normalize()
+        )
+
+    def pdf(self, xs):
+        """
+        Returns the probability density function for 3D vectors in xs.
+        """
+        return np.exp(self.log_pdf(xs))
+
+    def log_likelihood(self, xs):
+        """
+        Returns the log likelihood for xs.
+        """
+        return float(np.sum(self.log_pdf(xs)))
+
+    def rvs(self, n_samples=None, seed=None):
+        """
+        Returns random samples from the Bingham distribution.
+
+        Samples are generated in vectorized blocks by rejection from angular
+        central Gaussian envelope, which has bounded acceptance rate for any
+        concentrations.
+
+        Kent, J. T., Ganeiber, A. M., & Mardia, K. V. (2018). A new unified
+            approach for the simulation of a wide class of directional
+            distributions. Journal of Computational and Graphical Statistics,
+            27(2), 291-301.
+
+        If n_samples == None then a single sample x is returned with shape (3,)
+        If n_samples is an integer value N then N samples are returned in an
+        array with shape (N, 3)
+
+        Keyword Args:
+          seed: None (global numpy random state), int, ``np.random.SeedSequence``
+            or ``np.random.Generator``. Default None
+        """
+        rng = _random_state(seed)
+        num_samples = 1 if n_samples is None else n_samples
+        rvs = _bingham_rvs(self.kappa2, self.kappa3, num_samples, rng) @ self.Gamma.T
+        if n_samples is None:
+            return rvs[0]
+        return rvs
+
+
+def bingham_log_normalize(kappa2, kappa3, return_prime=False):
+    """Return logarithm of normalization constant of Bingham distribution.
+
+    Values are interpolated from table precomputed by numerical integration
+    for concentrations up to 10000 and extended by asymptotic expansion above,
+    so arrays of concentrations are evaluated at once.
+
+    Args:
+      kappa2: concentration parameter(s) along second axis
+      kappa3: concentration parameter(s) along third axis
+
+    Keyword Args:
+      return_prime (bool): when True, also derivatives of logarithm of
+        normalization constant with respect to kappa2 and kappa3 are returned
+        as array with shape (2, ...). Default False
+
+    Example:
+      >>> bingham_log_normalize([1, 10, 100], [10, 100, 1000])
+    """
+    a, b = np.broadcast_arrays(np.asarray(kappa2, float), np.asarray(kappa3, float))
+    if np.any(a < 0) or np.any(b < 0):
+        raise ValueError("Concentration parameters must be non-negative.")
+    u, spline = _bingham_table()
+    amax = math.expm1(u[-1])
+    ac, bc = np.minimum(a, amax), np.minimum(b, amax)
+    ua, ub = np.log1p(ac), np.log1p(bc)
+    logf = np.array(spline.ev(ua, ub))
+    da = np.array(spline.ev(ua, ub, dx=1) / (1 + ac))
+    db = np.array(spline.ev(ua, ub, dy=1) / (1 + bc))
+    out = (a > amax) | (b > amax)
+    if np.any(out):
+        # shift by asymptotic expansion from boundary of table
+        a, b, ac, bc = a[out], b[out], ac[out], bc[out]
+        g, ga, gb = _bingham_asymptote(a, b)
+        gc, gac, gbc = _bingham_asymptote(ac, bc)
+        logf[out] += g - gc
+        da[out] = np.where(a > amax, 0, da[out] - gac) + ga
+        db[out] = np.where(b > amax, 0, db[out] - gbc) + gb
+    logc = np.log(4 * np.pi) + logf
+    if return_prime:
+        return logc, np.array([da, db])
+    return logc
+
+
+def _bingham_asymptote(a, b):
+    """Return leading term of log(1F1(1/2; 3/2; -diag(a, b, 0))) for large
+    maximum of a, b up to constant and its derivatives"""
+    hi, lo = np.maximum(a, b), np.minimum(a, b)
+    r = bessel_ive(1, lo / 2) / bessel_ive(0, lo / 2)
+    g = -np.log(hi) / 2 + np.log(bessel_ive(0, lo / 2))
+    dhi, dlo = -1 / (2 * hi), (r - 1) / 2
+    return g, np.where(a >= b, dhi, dlo), np.where(a >= b, dlo, dhi)
+
+
+@lru_cache(maxsize=1)
+def _bingham_table():
+    """Return grid and bicubic spline of tabulated log(1F1(1/2; 3/2; -diag(a,
+    b, 0))) on square grid of log1p(a) and log1p(b). Table is loaded from
+    package data created by ``_bingham_table_compute``."""
+    with np.load(_BINGHAM_TABLE) as data:
+        u, logf = data["u"], data["logf"]
+    return u, RectBivariateSpline(u, u, logf, kx=3, ky=3, s=0)
+
+
+def _bingham_table_compute(n=161, amax=1e4):
+    """Compute table of log(1F1(1/2; 3/2; -diag(a, b, 0))) on (n, n) grid of
+    log1p(a) and log1p(b) up to amax. Used to create package data by
+    ``np.savez_compressed(_BINGHAM_TABLE, u=u, logf=logf)``"""
+    u = np.linspace(0, math.log1p(amax), n)
+    logf = np.empty((n, n))
+    for i in range(n):
+        for j in range(i + 1):
+            logf[i, j] = logf[j, i] = _bingham_log_f_quad(
+                math.expm1(u[i]), math.expm1(u[j])
+            )
+    return u, logf
+
+
+def _bingham_log_f_quad(a, b):
+    """Return log(1F1(1/2; 3/2; -diag(a, b, 0))) by numerical integration.
+
+    Averaging exp(-a*x**2 - b*y**2) over sphere analytically in azimuth leads to
+    integral of exponentially scaled modified Bessel function over z in [0, 1].
+    """
+    a, b = max(a, b), min(a, b)
+
+    def f(t):
+        s = 1 - t * t
+        return math.exp(-b * s) * bessel_ive(0, (a - b) * s / 2)
+
+    # integrand is concentrated within 1/b of t = 1
+    w = 1 / math.sqrt(max(b, 1.0))
+    points = [1 - 10 * w] if w < 0.1 else None
+    v, _ = quad(f, 0, 1, epsabs=0, epsrel=1e-13, limit=200, points=points)
+    return math.log(v)
+
+
+def _bingham_rvs(kappa2, kappa3, n, rng):
+    """Sample n vectors from Bingham distribution with axes along coordinate
+    axes by rejection from angular central Gaussian envelope"""
+    lam = np.array([0.0, kappa2, kappa3])
+    # optimal envelope parameter solves sum(1 / (b + 2 * lam)) = 1
+    if np.any(lam > 0):
+        b = brentq(lambda b: np.sum(1 / (b + 2 * lam)) - 1, 1e-12, 3)
+    else:
+        b = 3.0
+    omega = 1 + 2 * lam / b
+    logM = -(3 - b) / 2 + 1.5 * math.log(3 / b)
+    x = np.empty((n, 3))
+    done = 0
+    while done < n:
+        size = int(1.5 * (n - done)) + 10
+        y = rng.standard_normal((size, 3)) / np.sqrt(omega)
+        y /= np.linalg.norm(y, axis=1)[:, None]
+        y2 = y**2
+        logr = -y2 @ lam + 1.5 * np.log(y2 @ omega) - logM
+        ys = y[np.log(rng.uniform(size=size)) <= logr][: n - done]
+        x[done : done + len(ys)] = ys
+        done += len(ys)
+    return x
+
+
+def _orthonormal_frame(mu):
+    """Return rows of orthonormal frame with first row mu"""
+    mu = np.asarray(mu, dtype=float)
+    ref = [0.0, 0.0, 1.0] if abs(mu[2]) < 0.9 else [1.0, 0.0, 0.0]
+    v = np.cross(mu, ref)
+    v /= np.linalg.norm(v)
+    return np.array([mu, v, np.cross(mu, v)])
+
+
+class OrientationTensor3Accumulator(object):
+    """
+    Streaming accumulator of orientation tensor.
+
+    Keeps running sum of outer products of vectors and their count, so
+    orientation tensor could be calculated from data, which do not fit in
+    memory. Accumulators from parallel workers could be merged.
+
+    Args:
+      data: optional initial data. See ``update`` method.
+
+    Example:
+      >>> acc = OrientationTensor3Accumulator()
+      >>> for i in range(10):
+      ...     acc.update(linset.random_fisher(n=1000, position=lin(120, 50)))
+      >>> acc.merge(OrientationTensor3Accumulator(linset.random_fisher()))
+      OrientationTensor3Accumulator(10100)
+      >>> acc.ortensor()
+
+    """
+
+    def __init__(self, data=None):
+        self.n = 0
+        self.scatter = np.zeros((3, 3))
+        if data is not None:
+            self.update(data)
+
+    def __repr__(self):
+        return f"OrientationTensor3Accumulator({self.n})"
+
+    def update(self, data, chunksize=None):
+        """Add data to accumulator.
+
+        Args:
+          data: ``Vector3Set``, ``Vector3`` like object, (N, 3) array or
+            iterable (e.g. generator or database cursor) yielding any of them.
+            Rows of iterables are processed in chunks.
+
+        Keyword Args:
+          chunksize (int): number of rows processed at once. Default is derived
+            from ``apsg_conf["max_memory"]``
+
+        Returns self
+        """
+        for a in _array_chunks(data, chunksize):
+            self.n += len(a)
+            self.scatter += a.T @ a
+        return self
+
+    def merge(self, other):
+        """Merge other accumulator into this one. Returns self"""
+        self.n += other.n
+        self.scatter += other.scatter
+        return self
+
+    def ortensor(self):
+        """Return ``OrientationTensor3`` of accumulated data"""
+        if self.n == 0:
+            raise ValueError("No data accumulated.")
+        return OrientationTensor3(self.scatter / self.n)
+
+
+class FisherAccumulator(object):
+    """
+    Streaming accumulator of Fisher statistics.
+
+    Keeps number of vectors, running resultant of unit vectors and running
+    resultant of vectors weighted by their length, so statistics could be
+    calculated from data arriving in chunks. Results are same as of
+    ``Vector3Set`` methods for the same data in the same order. Accumulators
+    from parallel workers could be merged. Resultant of axial data depends on
+    order of data, so non-empty axial accumulators could not be merged
+    exactly and merging them raises ``ValueError``.
+
+    Keyword Args:
+      data: optional initial data. See ``update`` method.
+      axial (bool): True for axial data, i.e. same as ``LineationSet`` or
+        ``FoliationSet``. Default False
+
+    Example:
+      >>> acc = FisherAccumulator(axial=True)
+      >>> for i in range(10):
+      ...     acc.update(linset.random_fisher(position=lin(120, 50)))
+      >>> acc.fisher_statistics()
+
+    """
+
+    def __init__(self, data=None, axial=False):
+        self.n = 0
+        self.axial = axial
+        self.resultant = np.zeros(3)
+        self.weighted_resultant = np.zeros(3)
+        if data is not None:
+            self.update(data)
+
+    def __repr__(self):
+        return f"FisherAccumulator({self.n})"
+
+    def update(self, data, chunksize=None):
+        """Add data to accumulator.
+
+        Args:
+          data: ``Vector3Set``, ``Vector3`` like object, (N, 3) array or
+            iterable (e.g. generator or database cursor) yielding any of them.
+            Rows of iterables are processed in chunks.
+
+        Keyword Args:
+          chunksize (int): number of rows processed at once. Default is derived
+            from ``apsg_conf["max_memory"]``
+
+        Returns self
+        """
+        for a in _array_chunks(data, chunksize):
+            self.n += len(a)
+            if self.axial:
+                self.resultant = _axial_resultant(_unit_rows(a), self.resultant)
+                self.weighted_resultant = _axial_resultant(a, self.weighted_resultant)
+            else:
+                self.resultant += _unit_rows(a).sum(axis=0)
+                self.weighted_resultant += a.sum(axis=0)
+        return self
+
+    def merge(self, other):
+        """Merge other accumulator into this one. Returns self
+
+        Note: For axial data the result depends on order of data, so merged
+        statistics would differ from statistics of all data. Axial
+        accumulators could be merged only when one of them is empty.
+        """
+        if self.axial != other.axial:
+            raise ValueError("Could not merge axial and non-axial accumulators.")
+        if self.axial and self.n > 0 and other.n > 0:
+            raise ValueError(
+                "Could not merge non-empty axial accumulators exactly. "
+                "Update single accumulator with all data instead."
+            )
+        self.n += other.n
+        self.resultant = self.resultant + other.resultant
+        self.weighted_resultant = self.weighted_resultant + other.weighted_resultant
+        return self
+
+    def R(self, mean=False):
+        """Return resultant of accumulated data as ``Vector3``.
+
+        Args:
+            mean: if True returns mean resultant. Default False
+        """
+        R = Vector3(*self.weighted_resultant.tolist())
+        if mean:
+            R = R / self.n
+        return R
+
+    def fisher_statistics(self):
+        """Fisher's statistics
+
+        fisher_statistics returns dictionary with keys:
+            `k`    estimated precision parameter,
+            `csd`  estimated angular standard deviation
+            `a95`  confidence limit
+        """
+        stats = {"k": np.inf, "a95": 0, "csd": 0}
+        N = self.n
+        R = math.hypot(*self.resultant)
+        if N != R:
+            stats["k"] = (N - 1) / (N - R)
+            stats["csd"] = 81 / math.sqrt(stats["k"])
+            stats["a95"] = acosd(1 - ((N - R) / R) * (20 ** (1 / (N - 1)) - 1))
+        return stats
+
+    def var(self):
+        """Spherical variance based on resultant length (Mardia 1972).
+
+        var = 1 - abs(R) / n
+        """
+        return 1 - math.hypot(*self.resultant) / self.n
+
+    def delta(self):
+        """Cone angle containing ~63% of the data in degrees.
+
+        For enough large sample it approach angular standard deviation (csd)
+        of Fisher statistics
+        """
+        return acosd(math.hypot(*self.weighted_resultant) / self.n)
+
+    def rdegree(self):
+        """Degree of preffered orientation of accumulated vectors.
+
+        D = 100 * (2 * abs(R) - n) / n
+        """
+        return 100 * (2 * math.hypot(*self.resultant) - self.n) / self.n
+
+
+def _axial_resultant(a, r):
+    """Add rows of array to resultant r, flipping rows opposite to running
+    resultant. Same as sum of ``Axial3`` features."""
+    x, y, z = r.tolist()
+    for a, b, c in a.tolist():
+        if x * a + y * b + z * c < 0:
+            x, y, z = x - a, y - b, z - c
         else:
-            self._cached_rvs = rvs[num_samples:]
-            retval = rvs[:num_samples]
-            return retval
+            x, y, z = x + a, y + b, z + c
+    return np.array([x, y, z])
+
+
+def _array_chunks(data, chunksize=None):
+    """Yield (N, 3) float arrays from array like data or from iterable of rows
+    or chunks. Consecutive rows are grouped to chunks of given size."""
+    if hasattr(data, "__array__") or isinstance(data, (list, tuple)):
+        yield np.asarray(data, dtype=float).reshape(-1, 3)
+        return
+    if chunksize is None:
+        chunksize = max(1, apsg_conf["max_memory"] // 240)
+    rows = []
+    for item in data:
+        a = np.asarray(item, dtype=float)
+        if a.ndim == 1:
+            rows.append(a)
+            if len(rows) == chunksize:
+                yield np.array(rows)
+                rows = []
+        else:
+            if rows:
+                yield np.array(rows)
+                rows = []
+            yield a.reshape(-1, 3)
+    if rows:
+        yield np.array(rows)
@@ -509,4 +509,5 @@ class OrientationTensor2(Ellipse):
 
         """
 
-        return cls(np.dot(np.array(g).T, np.array(g)) / len(g))
+        a = np.asarray(g)
+        return cls(np.dot(a.T, a) / len(g))
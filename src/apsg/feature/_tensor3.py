@@ -2,9 +2,11 @@ import math
 import numpy as np
 from scipy import linalg as spla
 
-from apsg.helpers._math import sind, cosd, atand
+from apsg.config import apsg_conf
+from apsg.helpers._math import atand, _unit_rows
 from apsg.math._vector import Vector3
 from apsg.math._matrix import Matrix3
+from apsg.math._rotation import axisangle_matrix
 from apsg.decorator._decorator import ensure_arguments
 from apsg.feature._geodata import Lineation, Foliation, Pair, Fault
 
@@ -85,20 +87,7 @@ class DeformationGradient3(Matrix3):
         Example:
           >>> F = defgrad.from_axisangle(lin(120, 30), 45)
         """
-
-        x, y, z = vector.uv()._coords
-        c, s = cosd(theta), sind(theta)
-        xs, ys, zs = x * s, y * s, z * s
-        xc, yc, zc = x * (1 - c), y * (1 - c), z * (1 - c)
-        xyc, yzc, zxc = x * yc, y * zc, z * xc
-
-        return cls(
-            [
-                [x * xc + c, xyc - zs, zxc + ys],
-                [xyc + zs, y * yc + c, yzc - xs],
-                [zxc - ys, yzc + xs, z * zc + c],
-            ]
-        )
+        return cls(axisangle_matrix(vector, theta))
 
     @classmethod
     @ensure_arguments(Vector3, Vector3)
@@ -280,19 +269,70 @@ class VelocityGradient3(Matrix3):
 
         Keyword Args:
             time (float): time of deformation. Default 1
-            steps (int): when bigger than 1, will return a list
-                         of ``DeformationGradient3`` tensors for each timestep.
+            steps (int): when bigger than 1, will return a
+                         ``DeformationGradient3Set`` of tensors for each timestep
+                         of deformation path from 0 to time.
+
+        Matrix exponential is calculated only once for the time step and the path
+        is accumulated by multiplication.
+
+        Example:
+            >>> L = velgrad(np.diag([0.1, 0, -0.1]))
+            >>> L.defgrad(time=2, steps=101)
+            F3(101) Default
         """
         from scipy.linalg import expm
+        from apsg.feature._container import DeformationGradient3Set
 
-        if steps > 1:  # FIX once container for matrix will be implemented
-            return [
-                DeformationGradient3(expm(np.asarray(self) * t))
-                for t in np.linspace(0, time, steps)
-            ]
+        if steps > 1:
+            E = expm(np.asarray(self) * time / (steps - 1))
+            return DeformationGradient3Set._from_array(_matrix_powers(E, steps))
         else:
             return DeformationGradient3(expm(np.asarray(self) * time))
 
+    def defgrad_path(self, time=1, steps=2, chunksize=None):
+        """
+        Return generator of ``DeformationGradient3Set`` chunks of deformation path.
+
+        Lazy version of ``defgrad`` for very long paths. Consecutive chunks
+        together contain the tensors for all `steps` timesteps from 0 to time.
+
+        Keyword Args:
+            time (float): time of deformation. Default 1
+            steps (int): number of timesteps. Default 2
+            chunksize (int): number of tensors in chunk. Default is derived from
+                apsg_conf["max_memory"]
+
+        Example:
+            >>> L = velgrad(np.diag([0.1, 0, -0.1]))
+            >>> for F in L.defgrad_path(time=10, steps=100000):
+            ...     k = ellipsoidset.from_defgrad(F).k
+        """
+        from scipy.linalg import expm
+        from apsg.feature._container import DeformationGradient3Set
+
+        if chunksize is None:
+            # 72 bytes per tensor and few temporary arrays
+            chunksize = max(1, apsg_conf["max_memory"] // (4 * 72))
+        dt = time / (steps - 1) if steps > 1 else 0
+        E = expm(np.asarray(self) * dt)
+        P = _matrix_powers(E, min(chunksize, steps))
+        En = P[-1] @ E
+        F = np.eye(3)
+        for start in range(0, steps, len(P)):
+            n = min(len(P), steps - start)
+            yield DeformationGradient3Set._from_array(P[:n] @ F)
+            F = F @ En
+
+    @property
+    def kinematic_vorticity(self):
+        """
+        Return kinematic vorticity number Wk, i.e. ratio of magnitudes of spin and
+        rate of deformation tensors. Wk is 0 for pure shear, 1 for simple shear and
+        infinite for rigid body rotation.
+        """
+        return float(np.linalg.norm(self.spin()) / np.linalg.norm(self.rate()))
+
     def rate(self):
         """
         Return rate of deformation tensor
@@ -540,7 +580,8 @@ class Stress3(Tensor3):
         Return stress vector associated with plane given by normal vector.
 
         Args:
-          n: normal given as ``Vector3`` or ``Foliation`` object
+          n: normal given as ``Vector3`` or ``Foliation`` object. When
+            ``FoliationSet`` or (N, 3) array is given, ``Vector3Set`` is returned.
 
         Example:
           >>> S = stress.from_comp(xx=-5, yy=-2, zz=10, xy=1)
@@ -548,15 +589,20 @@ class Stress3(Tensor3):
           Vector3(-2.52, 0.812, 8.66)
 
         """
+        if np.ndim(n) > 1:
+            from apsg.feature._container import Vector3Set
 
-        return Vector3(np.dot(self, n.normalized()))
+            t, _, _ = _stress_components(np.asarray(self), _plane_normals(n))
+            return Vector3Set._from_array(t)
+        return Vector3(np.dot(self, Vector3(n).normalized()))
 
     def fault(self, n):
         """
         Return ``Fault`` object derived from given by normal vector.
 
         Args:
-          n: normal given as ``Vector3`` or ``Foliation`` object
+          n: normal given as ``Vector3`` or ``Foliation`` object. When
+            ``FoliationSet`` or (N, 3) array is given, ``FaultSet`` is returned.
 
         Example:
           >>> S = stress.from_comp(xx=-5, yy=-2, zz=10, xy=8)
@@ -564,16 +610,25 @@ class Stress3(Tensor3):
           F:160/30-141/29 +
 
         """
+        if np.ndim(n) > 1:
+            from apsg.feature._container import FaultSet
 
+            _, sn, tau = _stress_components(np.asarray(self), _plane_normals(n))
+            return FaultSet._from_vectors(_unit_rows(sn), _unit_rows(tau))
         sn, tau = self.stress_comp(n)
         return Fault(sn.normalized(), tau.normalized())
 
     def stress_comp(self, n):
         """
         Return normal and shear stress ``Vector3`` components on plane given
-        by normal vector.
+        by normal vector. For ``FoliationSet`` or (N, 3) array ``Vector3Set``
+        objects are returned.
         """
+        if np.ndim(n) > 1:
+            from apsg.feature._container import Vector3Set
 
+            _, sn, tau = _stress_components(np.asarray(self), _plane_normals(n))
+            return Vector3Set._from_array(sn), Vector3Set._from_array(tau)
         t = self.cauchy(n)
         sn = t.proj(n)
 
@@ -581,23 +636,31 @@ class Stress3(Tensor3):
 
     def normal_stress(self, n):
         """
-        Return normal stress magnitude on plane given by normal vector.
+        Return normal stress magnitude on plane given by normal vector. For
+        ``FoliationSet`` or (N, 3) array the array of values is returned.
         """
-
+        if np.ndim(n) > 1:
+            n = _plane_normals(n)
+            t, _, _ = _stress_components(np.asarray(self), n)
+            return np.sum(n * t, axis=-1)
         return float(np.dot(n, self.cauchy(n)))
 
     def shear_stress(self, n):
         """
-        Return shear stress magnitude on plane given by normal vector.
+        Return shear stress magnitude on plane given by normal vector. For
+        ``FoliationSet`` or (N, 3) array the array of values is returned.
         """
-
+        if np.ndim(n) > 1:
+            _, _, tau = _stress_components(np.asarray(self), _plane_normals(n))
+            return np.linalg.norm(tau, axis=-1)
         sn, tau = self.stress_comp(n)
         return abs(tau)
 
     def slip_tendency(self, n, fp=0, log=False):
         """
         Return slip tendency calculated as the ratio of shear stress
-        to normal stress acting on the plane.
+        to normal stress acting on the plane. For ``FoliationSet`` or (N, 3) array
+        the array of values is returned.
 
         Note: Providing fluid pressure effective normal stress is calculated
 
@@ -608,6 +671,8 @@ class Stress3(Tensor3):
         """
 
         Se = self.effective(fp)
+        if np.ndim(n) > 1:
+            return _slip_tendency(np.asarray(Se), _plane_normals(n), log)
         sn, tau = Se.stress_comp(n)
         if log:
             return np.log(abs(tau) / abs(sn))
@@ -616,7 +681,8 @@ class Stress3(Tensor3):
 
     def dilation_tendency(self, n, fp=0):
         """
-        Return dilation tendency of the plane.
+        Return dilation tendency of the plane. For ``FoliationSet`` or (N, 3) array
+        the array of values is returned.
 
         Note: Providing fluid pressure effective stress is used
 
@@ -625,6 +691,10 @@ class Stress3(Tensor3):
 
         """
         Se = self.effective(fp)
+        if np.ndim(n) > 1:
+            return _dilation_tendency(
+                np.asarray(Se), _plane_normals(n), Se.sigma1, Se.sigma3
+            )
         sn, tau = Se.stress_comp(n)
         return (Se.sigma1 - abs(sn)) / (Se.sigma1 - Se.sigma3)
 
@@ -1008,7 +1078,8 @@ class OrientationTensor3(Ellipsoid):
 
         """
 
-        return cls(np.dot(np.array(g).T, np.array(g)) / len(g))
+        a = np.asarray(g)
+        return cls(np.dot(a.T, a) / len(g))
 
     @classmethod
     def from_pairs(cls, p, shift=True) -> "OrientationTensor3":
@@ -1056,3 +1127,61 @@ class OrientationTensor3(Ellipsoid):
                 OrientationTensor3.from_features(p.lvec)
                 - OrientationTensor3.from_features(p.fvec)
             )
+
+
+def _matrix_powers(E, n):
+    """Return (n, 3, 3) array of matrix powers E**k for k = 0, ..., n - 1
+
+    Powers are accumulated by multiplication of already calculated block by
+    repeatedly squared E, so only log2(n) stacked products are needed.
+    """
+    P = np.empty((n, 3, 3))
+    P[0] = np.eye(3)
+    Em = np.asarray(E, dtype=float)
+    m = 1
+    while m < n:
+        k = min(m, n - m)
+        P[m : m + k] = P[:k] @ Em
+        Em = Em @ Em
+        m += k
+    return P
+
+
+def _plane_normals(n):
+    """Return plane normals given as ``FeatureSet`` or array as (N, 3) array"""
+    n = np.asarray(n, dtype=float)
+    if n.ndim != 2 or n.shape[1] != 3:
+        raise TypeError("Plane normals must be Vector3Set or (N, 3) array")
+    return n
+
+
+def _stress_components(S, n):
+    """Return traction, normal and shear stress vectors on planes
+
+    S could be single (3, 3) or stacked (M, 3, 3) stress tensors and n is
+    (N, 3) array of plane normals. Returned arrays have shape (N, 3) or
+    (M, N, 3).
+    """
+    u = _unit_rows(n)
+    t = u @ np.swapaxes(S, -1, -2)
+    sn = np.sum(t * u, axis=-1, keepdims=True) * u
+    return t, sn, t - sn
+
+
+def _slip_tendency(Se, n, log=False):
+    """Return array of slip tendencies for effective stress tensor(s) Se"""
+    _, sn, tau = _stress_components(Se, n)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ts = np.linalg.norm(tau, axis=-1) / np.linalg.norm(sn, axis=-1)
+        if log:
+            return np.log(ts)
+    return ts
+
+
+def _dilation_tendency(Se, n, sigma1, sigma3):
+    """Return array of dilation tendencies for effective stress tensor(s) Se
+    with principal stresses sigma1 and sigma3 given as scalars or (M,) arrays"""
+    _, sn, _ = _stress_components(Se, n)
+    sigma1 = np.asarray(sigma1, dtype=float)[..., None]
+    sigma3 = np.asarray(sigma3, dtype=float)[..., None]
+    return (sigma1 - np.linalg.norm(sn, axis=-1)) / (sigma1 - sigma3)
@@ -1,12 +1,26 @@
 # -*- coding: utf-8 -*-
 
-from apsg.helpers._math import sind, cosd, tand, acosd, asind, atand, atan2d, sqrt2
-from apsg.helpers._helper import eformat
+from apsg.helpers._math import (
+    sind,
+    cosd,
+    tand,
+    acosd,
+    asind,
+    atand,
+    atan2d,
+    sqrt2,
+    pdist_angles,
+)
+from apsg.helpers._helper import eformat, spawn_generators
 from apsg.helpers._notation import (
     geo2vec_planar,
     geo2vec_linear,
     vec2geo_planar,
     vec2geo_linear,
+    geo2vec_planar_array,
+    geo2vec_linear_array,
+    vec2geo_planar_array,
+    vec2geo_linear_array,
 )
 
 __all__ = (
@@ -18,11 +32,17 @@ __all__ = (
     "atand",
     "atan2d",
     "sqrt2",
+    "pdist_angles",
     "is_like_vec3",
     "is_like_matrix3",
     "eformat",
+    "spawn_generators",
     "geo2vec_planar",
     "geo2vec_linear",
     "vec2geo_planar",
     "vec2geo_linear",
+    "geo2vec_planar_array",
+    "geo2vec_linear_array",
+    "vec2geo_planar_array",
+    "vec2geo_linear_array",
 )
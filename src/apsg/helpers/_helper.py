@@ -1,3 +1,5 @@
+import numpy as np
+
 # some utils
 
 
@@ -5,3 +7,44 @@ def eformat(f, prec):
     s = "{:e}".format(f)
     m, e = s.split("e")
     return "{:.{:d}f}E{:0d}".format(float(m), prec, int(e))
+
+
+def _random_state(seed=None):
+    """Return random generator for seed. When seed is None, global numpy random
+    state is used, so ``np.random.seed`` still gives reproducible results.
+    Otherwise seed could be int, ``np.random.SeedSequence``,
+    ``np.random.Generator`` or ``np.random.RandomState``. Generators are
+    returned unchanged, so they could be passed through nested calls."""
+    if seed is None:
+        return np.random.mtrand._rand
+    if isinstance(seed, np.random.RandomState):
+        return seed
+    return np.random.default_rng(seed)
+
+
+def spawn_generators(seed, n):
+    """Return list of n statistically independent random generators.
+
+    Child streams are spawned from ``np.random.SeedSequence``, so they could be
+    passed as seed to stochastic functions running in separate processes.
+    To get results independent of number of workers, spawn one generator
+    per task (e.g. per chunk of simulations) rather than per worker.
+
+    Args:
+        seed: None, int, ``np.random.SeedSequence`` or ``np.random.Generator``
+        n (int): number of generators
+
+    Example:
+        >>> from concurrent.futures import ProcessPoolExecutor
+        >>> seeds = spawn_generators(42, 64)
+        >>> with ProcessPoolExecutor() as pool:
+        ...     res = list(pool.map(simulation, seeds))
+    """
+    if isinstance(seed, np.random.Generator):
+        # Generator.spawn and BitGenerator.seed_seq need numpy >= 1.25
+        bitgen = seed.bit_generator
+        seq = getattr(bitgen, "seed_seq", None) or bitgen._seed_seq
+        return [np.random.Generator(type(bitgen)(s)) for s in seq.spawn(n)]
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return [np.random.default_rng(s) for s in seed.spawn(n)]
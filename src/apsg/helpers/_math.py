@@ -1,4 +1,7 @@
 import math
+import numpy as np
+
+from apsg.config import apsg_conf
 
 sqrt2 = math.sqrt(2.0)
 
@@ -44,3 +47,60 @@ def atan2d(y, x):
         x (float): x coordinate
     """
     return math.degrees(math.atan2(y, x))
+
+
+# VECTORIZED KERNELS
+
+
+def pdist_angles(u, axial=False, dtype=np.float64, max_memory=None):
+    """
+    Calculate angles in degrees between all pairs of vectors.
+
+    Angles are returned as condensed distance matrix, i.e. in the same order as
+    ``scipy.spatial.distance.pdist`` and as expected by
+    ``scipy.cluster.hierarchy.linkage``. Dot products are evaluated in blocks of
+    rows to keep temporary arrays within memory budget.
+
+    Args:
+        u: (N, 2) or (N, 3) array of vectors
+
+    Keyword Args:
+        axial (bool): when True, data are axial and angles are within 0-90
+            degrees. Default False
+        dtype: dtype of returned array, e.g. np.float32. Default np.float64
+        max_memory (int): memory budget for temporary arrays in bytes. Default
+            is ``apsg_conf["max_memory"]``
+
+    Returns:
+        1D array of N * (N - 1) / 2 angles
+    """
+    u = np.asarray(u, dtype=float)
+    n = len(u)
+    if n < 2:
+        return np.empty(0, dtype=dtype)
+    if max_memory is None:
+        max_memory = apsg_conf["max_memory"]
+    norm = np.linalg.norm(u, axis=1, keepdims=True)
+    u = np.divide(u, norm, out=np.zeros_like(u), where=norm > 0)
+    res = np.empty(n * (n - 1) // 2, dtype=dtype)
+    # dot products, triangular mask and selected values per row
+    rows = max(1, int(max_memory // (17 * n)))
+    start = 0
+    for i0 in range(0, n - 1, rows):
+        i1 = min(i0 + rows, n - 1)
+        d = u[i0:i1] @ u[i0 + 1 :].T
+        # row i of block pairs with all vectors j > i
+        d = d[np.arange(i1 - i0)[:, None] <= np.arange(n - i0 - 1)]
+        if axial:
+            np.abs(d, out=d)
+        np.clip(d, -1, 1, out=d)
+        np.degrees(np.arccos(d, out=d), out=d)
+        res[start : start + len(d)] = d
+        start += len(d)
+    return res
+
+
+def _unit_rows(a):
+    """Normalize vectors along last axis. Zero vectors are kept unchanged."""
+    n = np.linalg.norm(a, axis=-1, keepdims=True)
+    return np.divide(a, n, out=np.array(a, dtype=float), where=n > 0)
@@ -1,3 +1,5 @@
+import numpy as np
+
 from apsg.config import apsg_conf
 from apsg.helpers._math import sind, cosd, asind, atan2d
 
@@ -117,3 +119,145 @@ def vec2geo_linear(arg):
         v (Vector3): ``Vector3`` like object
     """
     return vec2lin_dd(arg)
+
+
+# VECTORIZED NOTATION TRANSFORMATIONS
+#
+# Array variants of functions above. They accept arrays of azimuths and
+# inclinations (or (N, 3) arrays of vector components) and return (N, 3) arrays
+# of direction cosines (or tuple of arrays of azimuths and inclinations).
+
+
+def fol2vec_dd_array(azi, inc):
+    azi, inc = np.radians(azi), np.radians(inc)
+    return np.column_stack(
+        (-np.cos(azi) * np.sin(inc), -np.sin(azi) * np.sin(inc), np.cos(inc))
+    )
+
+
+def fol2vec_rhr_array(strike, dip):
+    return fol2vec_dd_array(np.add(strike, 90), dip)
+
+
+def geo2vec_planar_array(azi, inc):
+    """
+    Function to transform arrays of geological measurements of planes to
+    (N, 3) array of normal vectors
+
+    Conversion is done according to `notation` configuration
+
+    Args:
+        azi (array_like): dip directions or strikes
+        inc (array_like): dips
+    """
+    return {"dd": fol2vec_dd_array, "rhr": fol2vec_rhr_array}[apsg_conf["notation"]](
+        azi, inc
+    )
+
+
+def lin2vec_dd_array(azi, inc):
+    azi, inc = np.radians(azi), np.radians(inc)
+    return np.column_stack(
+        (np.cos(azi) * np.cos(inc), np.sin(azi) * np.cos(inc), np.sin(inc))
+    )
+
+
+def geo2vec_linear_array(azi, inc):
+    """
+    Function to transform arrays of geological measurements of lines to
+    (N, 3) array of vectors
+
+    Args:
+        azi (array_like): plunge directions
+        inc (array_like): plunges
+    """
+    return lin2vec_dd_array(azi, inc)
+
+
+def _unit_array(v, lower):
+    n = np.atleast_2d(np.asarray(v, dtype=float))
+    d = np.linalg.norm(n, axis=1, keepdims=True)
+    n = np.divide(n, d, out=n.copy(), where=d > 0)
+    if lower:
+        n[n[:, 2] < 0] *= -1
+    return n
+
+
+def _asind_array(x):
+    return np.degrees(np.arcsin(np.clip(x, -1, 1)))
+
+
+def vec2fol_dd_array(v):
+    n = _unit_array(v, lower=True)
+    return (
+        np.mod(np.degrees(np.arctan2(n[:, 1], n[:, 0])) + 180, 360),
+        90 - _asind_array(n[:, 2]),
+    )
+
+
+def vec2fol_dd_signed_array(v):
+    n = _unit_array(v, lower=False)
+    return (
+        np.mod(np.degrees(np.arctan2(n[:, 1], n[:, 0])) + 180, 360),
+        90 - _asind_array(n[:, 2]),
+    )
+
+
+def vec2fol_rhr_array(v):
+    n = _unit_array(v, lower=True)
+    return (
+        np.mod(np.degrees(np.arctan2(n[:, 1], n[:, 0])) + 90, 360),
+        90 - _asind_array(n[:, 2]),
+    )
+
+
+def vec2fol_rhr_signed_array(v):
+    n = _unit_array(v, lower=False)
+    return (
+        np.mod(np.degrees(np.arctan2(n[:, 1], n[:, 0])) + 90, 360),
+        90 - _asind_array(n[:, 2]),
+    )
+
+
+def vec2geo_planar_signed_array(v):
+    return {"dd": vec2fol_dd_signed_array, "rhr": vec2fol_rhr_signed_array}[
+        apsg_conf["notation"]
+    ](v)
+
+
+def vec2geo_planar_array(v):
+    """
+    Function to transform (N, 3) array of normal vectors to arrays of geological
+    measurements of planes
+
+    Conversion is done according to `notation` configuration
+
+    Args:
+        v (array_like): (N, 3) array of vector components
+    """
+    return {"dd": vec2fol_dd_array, "rhr": vec2fol_rhr_array}[apsg_conf["notation"]](v)
+
+
+def vec2lin_dd_array(v):
+    n = _unit_array(v, lower=True)
+    return np.mod(np.degrees(np.arctan2(n[:, 1], n[:, 0])), 360), _asind_array(n[:, 2])
+
+
+def vec2lin_dd_signed_array(v):
+    n = _unit_array(v, lower=False)
+    return np.mod(np.degrees(np.arctan2(n[:, 1], n[:, 0])), 360), _asind_array(n[:, 2])
+
+
+def vec2geo_linear_signed_array(v):
+    return vec2lin_dd_signed_array(v)
+
+
+def vec2geo_linear_array(v):
+    """
+    Function to transform (N, 3) array of vectors to arrays of geological
+    measurements of lines
+
+    Args:
+        v (array_like): (N, 3) array of vector components
+    """
+    return vec2lin_dd_array(v)
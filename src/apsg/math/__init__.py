@@ -2,5 +2,26 @@
 
 from apsg.math._vector import Vector3, Axial3, Vector2, Axial2
 from apsg.math._matrix import Matrix3, Matrix2
+from apsg.math._rotation import (
+    axisangle_matrix,
+    rotate_vector,
+    axisangle_quaternion,
+    quaternion_product,
+    quaternion_matrix,
+    compose_rotations,
+)
 
-__all__ = ("Vector3", "Axial3", "Vector2", "Axial2", "Matrix3", "Matrix2")
+__all__ = (
+    "Vector3",
+    "Axial3",
+    "Vector2",
+    "Axial2",
+    "Matrix3",
+    "Matrix2",
+    "axisangle_matrix",
+    "rotate_vector",
+    "axisangle_quaternion",
+    "quaternion_product",
+    "quaternion_matrix",
+    "compose_rotations",
+)
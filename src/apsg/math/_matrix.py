@@ -40,7 +40,7 @@ class Matrix:
     def to_json(self):
         return {"datatype": type(self).__name__, "args": (self._coefs,)}
 
-    def __array__(self, dtype=None):
+    def __array__(self, dtype=None, copy=None):
         return np.array(self._coefs, dtype=dtype)
 
     def __nonzero__(self):
@@ -343,6 +343,9 @@ class Matrix3(Matrix):
         return Vector3(np.dot(np.array(self), other))
 
     def __matmul__(self, other):
+        if np.ndim(other) > 2:
+            # stacks of matrices evaluate product in __rmatmul__
+            return NotImplemented
         r = np.dot(np.array(self), other)
         if np.asarray(r).shape == Matrix3.__shape__:
             return type(self)(r)
@@ -0,0 +1,118 @@
+"""
+Shared rotation engine. Rotations are represented by 3x3 matrices applied by
+single matrix multiplication. Sequences of rotations are composed as unit
+quaternions and converted to matrix only once.
+"""
+
+import math
+from functools import lru_cache
+
+import numpy as np
+
+from apsg.math._vector import Vector3
+
+
+def axisangle_matrix(axis, theta):
+    """Return rotation matrix for rotation about axis through angle theta.
+
+    Right-hand rule applies. Matrices are cached per (axis, angle) pair and
+    returned arrays are read-only.
+
+    Args:
+        axis: rotation axis as ``Vector3`` like object
+        theta (float): angle of rotation in degrees
+    """
+    return _axisangle_matrix(*_unit_axis(axis), float(theta))
+
+
+def rotate_vector(v, axis, theta):
+    """Return ``Vector3`` v rotated about axis through angle theta in degrees using
+    cached rotation matrix. Intended for scalar features, result is of same type
+    as v."""
+    R = _axisangle_coefs(*_unit_axis(axis), float(theta))
+    x, y, z = v._coords
+    return v._from_coords(tuple(r[0] * x + r[1] * y + r[2] * z for r in R))
+
+
+def _unit_axis(axis):
+    if isinstance(axis, Vector3):
+        x, y, z = axis._coords
+    else:
+        x, y, z = (float(c) for c in np.asarray(axis, dtype=float).reshape(3))
+    d = math.sqrt(x * x + y * y + z * z)
+    if d:
+        return x / d, y / d, z / d
+    return x, y, z
+
+
+@lru_cache(maxsize=512)
+def _axisangle_coefs(x, y, z, theta):
+    t = math.radians(theta)
+    c, s = math.cos(t), math.sin(t)
+    xs, ys, zs = x * s, y * s, z * s
+    xc, yc, zc = x * (1 - c), y * (1 - c), z * (1 - c)
+    xyc, yzc, zxc = x * yc, y * zc, z * xc
+    return (
+        (x * xc + c, xyc - zs, zxc + ys),
+        (xyc + zs, y * yc + c, yzc - xs),
+        (zxc - ys, yzc + xs, z * zc + c),
+    )
+
+
+@lru_cache(maxsize=512)
+def _axisangle_matrix(x, y, z, theta):
+    R = np.array(_axisangle_coefs(x, y, z, theta))
+    R.flags.writeable = False
+    return R
+
+
+def axisangle_quaternion(axis, theta):
+    """Return unit quaternion (w, x, y, z) for rotation about axis through angle
+    theta in degrees"""
+    x, y, z = _unit_axis(axis)
+    t = math.radians(theta) / 2
+    s = math.sin(t)
+    return np.array([math.cos(t), x * s, y * s, z * s])
+
+
+def quaternion_product(p, q):
+    """Return Hamilton product of quaternions p and q, i.e. rotation q followed
+    by rotation p"""
+    pw, px, py, pz = p
+    qw, qx, qy, qz = q
+    return np.array(
+        [
+            pw * qw - px * qx - py * qy - pz * qz,
+            pw * qx + px * qw + py * qz - pz * qy,
+            pw * qy - px * qz + py * qw + pz * qx,
+            pw * qz + px * qy - py * qx + pz * qw,
+        ]
+    )
+
+
+def quaternion_matrix(q):
+    """Return rotation matrix of quaternion q. Quaternion is normalized."""
+    w, x, y, z = np.asarray(q, dtype=float) / np.linalg.norm(q)
+    return np.array(
+        [
+            [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+            [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+            [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)],
+        ]
+    )
+
+
+def compose_rotations(*rotations):
+    """Return rotation matrix of sequence of rotations applied in given order.
+
+    Args:
+        rotations: (axis, theta) pairs with angles in degrees
+
+    Example:
+        >>> R = compose_rotations((lin(120, 30), 45), (vec('z'), -90))
+        >>> v = vecset.random_fisher().transform(R)
+    """
+    q = np.array([1.0, 0.0, 0.0, 0.0])
+    for axis, theta in rotations:
+        q = quaternion_product(axisangle_quaternion(axis, theta), q)
+    return quaternion_matrix(q)
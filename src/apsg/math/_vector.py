@@ -1,9 +1,11 @@
 import math
+import operator
 
 import numpy as np
 
 from apsg.config import apsg_conf
 from apsg.helpers._math import sind, cosd, acosd, atan2d
+from apsg.helpers._helper import _random_state
 from apsg.helpers._notation import (
     geo2vec_linear,
     vec2geo_linear_signed,
@@ -18,15 +20,22 @@ class Vector:
 
     __slots__ = ("_coords",)
 
+    @classmethod
+    def _from_coords(cls, coords):
+        # trusted constructor skipping argument parsing, coords must be tuple
+        obj = cls.__new__(cls)
+        obj._coords = coords
+        return obj
+
     def __copy__(self):
-        return type(self)(self._coords)
+        return self._from_coords(self._coords)
 
     copy = __copy__
 
     def __hash__(self):
         return hash((type(self).__name__,) + self._coords)
 
-    def __array__(self, dtype=None):
+    def __array__(self, dtype=None, copy=None):
         return np.array(self._coords, dtype=dtype)
 
     def to_json(self):
@@ -49,18 +58,30 @@ class Vector:
     #        return iter(self._coords)
 
     def __add__(self, other):
-        return type(self)(np.add(self, other))
+        c = _operand(self, other)
+        if c is None:
+            return type(self)(np.add(self, other))
+        return self._from_coords(tuple(map(operator.add, self._coords, c)))
 
     __radd__ = __add__
 
     def __sub__(self, other):
-        return type(self)(np.subtract(self, other))
+        c = _operand(self, other)
+        if c is None:
+            return type(self)(np.subtract(self, other))
+        return self._from_coords(tuple(map(operator.sub, self._coords, c)))
 
     def __rsub__(self, other):
-        return type(self)(np.subtract(other, self))
+        c = _operand(self, other)
+        if c is None:
+            return type(self)(np.subtract(other, self))
+        return self._from_coords(tuple(map(operator.sub, c, self._coords)))
 
     def __mul__(self, other):
-        return type(self)(np.multiply(self, other))
+        c = _operand(self, other)
+        if c is None:
+            return type(self)(np.multiply(self, other))
+        return self._from_coords(tuple(map(operator.mul, self._coords, c)))
 
     __rmul__ = __mul__
 
@@ -77,7 +98,10 @@ class Vector:
         return type(self)(np.floor_divide(other, self))
 
     def __truediv__(self, other):
-        return type(self)(np.true_divide(self, other))
+        c = _operand(self, other)
+        if c is None or 0 in c:
+            return type(self)(np.true_divide(self, other))
+        return self._from_coords(tuple(map(operator.truediv, self._coords, c)))
 
     def __rtruediv__(self, other):
         return type(self)(np.true_divide(other, self))
@@ -197,13 +221,15 @@ class Vector2(Vector):
         return 3
 
     def __neg__(self):
-        return type(self)(-self.x, -self.y)
+        x, y = self._coords
+        return self._from_coords((-x, -y))
 
     def normalized(self):
         """Returns normalized (unit length) vector"""
         d = self.magnitude()
         if d:
-            return type(self)(self.x / d, self.y / d)
+            x, y = self._coords
+            return self._from_coords((x / d, y / d))
         return self.copy()
 
     uv = normalized
@@ -223,7 +249,11 @@ class Vector2(Vector):
         Args:
             other (Vector2): other vector
         """
-        return self.x * other.x + self.y * other.y
+        return self._dot(other)
+
+    def _dot(self, other):
+        a, b = self._coords, other._coords
+        return a[0] * b[0] + a[1] * b[1]
 
     def __matmul__(self, other):
         r = np.dot(self, other)
@@ -256,11 +286,16 @@ class Vector2(Vector):
         return self.x * other.y - self.y * other.x
 
     @classmethod
-    def random(cls):
+    def random(cls, seed=None):
         """
         Random 2D vector
+
+        Keyword Args:
+            seed: None (global numpy random state), int,
+                ``np.random.SeedSequence`` or ``np.random.Generator``.
+                Default None
         """
-        return cls(360 * np.random.rand())
+        return cls(360 * _random_state(seed).random())
 
     @ensure_first_arg_same
     def rotate(self, axis, theta):
@@ -318,26 +353,26 @@ class Axial2(Vector2):  # Do we need it?
 
     def __add__(self, other):
         if issubclass(type(other), Vector2):
-            if super().dot(other) < 0:
+            if super()._dot(other) < 0:
                 other = -other
-        return type(self)(np.add(self, other))
+        return super().__add__(other)
 
     __radd__ = __add__
 
     def __sub__(self, other):
         if issubclass(type(other), Vector2):
-            if super().dot(other) < 0:
+            if super()._dot(other) < 0:
                 other = -other
-        return type(self)(np.subtract(self, other))
+        return super().__sub__(other)
 
     def __rsub__(self, other):
         if issubclass(type(other), Vector2):
-            if super().dot(other) < 0:
+            if super()._dot(other) < 0:
                 other = -other
-        return type(self)(np.subtract(other, self))
+        return super().__rsub__(other)
 
-    def dot(self, other):
-        return abs(super().dot(other))
+    def _dot(self, other):
+        return abs(super()._dot(other))
 
 
 class Vector3(Vector):
@@ -371,10 +406,16 @@ class Vector3(Vector):
     __shape__ = (3,)
 
     def __init__(self, *args):
-        if len(args) == 0:
+        if len(args) == 3:
+            coords = args
+        elif len(args) == 0:
             coords = (1, 0, 0)
         elif len(args) == 1:
-            if np.asarray(args[0]).shape == Vector3.__shape__:
+            if isinstance(args[0], Vector3):
+                coords = args[0]._coords
+            elif _is_coords(args[0], 3):
+                coords = args[0]
+            elif np.asarray(args[0]).shape == Vector3.__shape__:
                 coords = tuple(c.item() for c in np.asarray(args[0]))
             elif isinstance(args[0], str):
                 if args[0].lower() == "x":
@@ -389,8 +430,6 @@ class Vector3(Vector):
                 raise TypeError(f"Not valid arguments for {type(self).__name__}")
         elif len(args) == 2:
             coords = geo2vec_linear(*args)
-        elif len(args) == 3:
-            coords = args
         else:
             raise TypeError(f"Not valid arguments for {type(self).__name__}")
         self._coords = tuple(coords)
@@ -412,16 +451,21 @@ class Vector3(Vector):
         return 3
 
     def __neg__(self):
-        return type(self)(-self.x, -self.y, -self.z)
+        x, y, z = self._coords
+        return self._from_coords((-x, -y, -z))
 
     def __abs__(self):
-        return math.sqrt(self.x**2 + self.y**2 + self.z**2)
+        x, y, z = self._coords
+        return math.sqrt(x * x + y * y + z * z)
+
+    magnitude = __abs__
 
     def normalized(self):
         """Returns normalized (unit length) vector"""
         d = self.magnitude()
         if d:
-            return type(self)(self.x / d, self.y / d, self.z / d)
+            x, y, z = self._coords
+            return self._from_coords((x / d, y / d, z / d))
         return self.copy()
 
     uv = normalized
@@ -436,7 +480,11 @@ class Vector3(Vector):
         Args:
             other (Vector3): other vector
         """
-        return self.x * other.x + self.y * other.y + self.z * other.z
+        return self._dot(other)
+
+    def _dot(self, other):
+        a, b = self._coords, other._coords
+        return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
 
     def __matmul__(self, other):
         r = np.dot(self, other)
@@ -460,11 +508,7 @@ class Vector3(Vector):
         Args:
             other (Vector3): other vector
         """
-        return type(self)(
-            self.y * other.z - self.z * other.y,
-            -self.x * other.z + self.z * other.x,
-            self.x * other.y - self.y * other.x,
-        )
+        return self._from_coords(_cross(self._coords, other._coords))
 
     def lower(self):
         """Change vector direction to point towards positive Z direction"""
@@ -500,29 +544,40 @@ class Vector3(Vector):
         return cls(0, 0, 1)
 
     @classmethod
-    def random(cls):
+    def random(cls, seed=None):
         """
         Create random 3D vector
+
+        Keyword Args:
+            seed: None (global numpy random state), int,
+                ``np.random.SeedSequence`` or ``np.random.Generator``.
+                Default None
         """
-        return cls(np.random.randn(3)).normalized()
+        return cls(_random_state(seed).standard_normal(3)).normalized()
 
     @ensure_first_arg_same
     def rotate(self, axis, theta):
         """Return the vector rotated around axis through angle theta. Right-hand rule
         applies
         """
-        v = Vector3(self)  # ensure vector
-        k = Vector3(axis.uv())
-        return type(self)(
-            cosd(theta) * v
-            + sind(theta) * k.cross(v)
-            + (1 - cosd(theta)) * k * (k.dot(v))
+        v = self._coords
+        k = axis.uv()._coords
+        c, s = cosd(theta), sind(theta)
+        d = (1 - c) * (k[0] * v[0] + k[1] * v[1] + k[2] * v[2])
+        kv = _cross(k, v)
+        return self._from_coords(
+            (
+                c * v[0] + s * kv[0] + d * k[0],
+                c * v[1] + s * kv[1] + d * k[1],
+                c * v[2] + s * kv[2] + d * k[2],
+            )
         )
 
     @ensure_first_arg_same
     def angle(self, other):
         """Return the angle to the vector other"""
-        return acosd(np.clip(self.uv().dot(other.uv()), -1, 1))
+        d = abs(self) * abs(other)
+        return acosd(self._dot(other) / d if d else 0)
 
     def transform(self, F, **kwargs):
         """
@@ -565,23 +620,51 @@ class Axial3(Vector3):
 
     def __add__(self, other):
         if issubclass(type(other), Vector3):
-            if super().dot(other) < 0:
+            if super()._dot(other) < 0:
                 other = -other
-        return type(self)(np.add(self, other))
+        return super().__add__(other)
 
     __radd__ = __add__
 
     def __sub__(self, other):
         if issubclass(type(other), Vector3):
-            if super().dot(other) < 0:
+            if super()._dot(other) < 0:
                 other = -other
-        return type(self)(np.subtract(self, other))
+        return super().__sub__(other)
 
     def __rsub__(self, other):
         if issubclass(type(other), Vector3):
-            if super().dot(other) < 0:
+            if super()._dot(other) < 0:
                 other = -other
-        return type(self)(np.subtract(other, self))
-
-    def dot(self, other):
-        return abs(super().dot(other))
+        return super().__rsub__(other)
+
+    def _dot(self, other):
+        return abs(super()._dot(other))
+
+
+def _operand(vector, other):
+    # coordinates of other for fast elementwise arithmetic with vector, or None
+    # when other must go through numpy broadcasting
+    if isinstance(other, Vector):
+        if len(other._coords) == len(vector._coords):
+            return other._coords
+    elif isinstance(other, (int, float)):
+        return (other,) * len(vector._coords)
+    return None
+
+
+def _is_coords(arg, n):
+    # True for tuple or list of n python numbers
+    return (
+        type(arg) in (tuple, list)
+        and len(arg) == n
+        and all(type(c) in (int, float) for c in arg)
+    )
+
+
+def _cross(a, b):
+    return (
+        a[1] * b[2] - a[2] * b[1],
+        a[2] * b[0] - a[0] * b[2],
+        a[0] * b[1] - a[1] * b[0],
+    )
@@ -265,7 +265,11 @@ class APSGAccessor:
             name (str): Name of created column. Default 'vecs'
         """
         res = self._obj.copy()
-        seq = [Vector3(*row.values) for _, row in self._obj[columns].iterrows()]
+        vals = self._obj[columns].to_numpy(dtype=float).T
+        if len(columns) == 3:
+            seq = Vector3Set.from_xyz(*vals)
+        else:
+            seq = Vector3Set.from_array(*vals)
         res[name] = Vector3Array(seq)
         return res
 
@@ -278,7 +282,7 @@ class APSGAccessor:
             name (str): Name of created column. Default 'fols'
         """
         res = self._obj.copy()
-        seq = [Foliation(*row.values) for _, row in self._obj[columns].iterrows()]
+        seq = FoliationSet.from_array(*self._obj[columns].to_numpy(dtype=float).T)
         res[name] = FolArray(seq)
         return res
 
@@ -291,7 +295,7 @@ class APSGAccessor:
             name (str): Name of created column. Default 'lins'
         """
         res = self._obj.copy()
-        seq = [Lineation(*row.values) for _, row in self._obj[columns].iterrows()]
+        seq = LineationSet.from_array(*self._obj[columns].to_numpy(dtype=float).T)
         res[name] = LinArray(seq)
         return res
 
@@ -5,6 +5,7 @@ import matplotlib.pyplot as plt
 from scipy.stats import vonmises, circmean
 
 from apsg.config import apsg_conf
+from apsg.helpers._helper import _random_state
 from apsg.plotting._plot_artists import RosePlotArtistFactory
 from apsg.feature import feature_from_json
 
@@ -229,6 +230,9 @@ class RosePlot(object):
             confidence_level (float): Confidence interval. Default 95
             n_resamples (int): Number of bootstrapped samples.
                 Default 9999
+            seed: None (global numpy random state), int,
+                ``np.random.SeedSequence`` or ``np.random.Generator`` used for
+                bootstrapping. Default None
 
         """
         try:
@@ -312,23 +316,27 @@ class RosePlot(object):
         ang = np.radians(np.concatenate([arg.direction for arg in args]))
         conflevel = kwargs.pop("confidence_level")
         n_resamples = kwargs.pop("n_resamples")
-        # calculate mean and CI
         if self._kwargs["axial"]:
             mu = circmean(2 * ang) / 2
-            ang_shift = ang + np.pi / 2 - mu
-            bsmu = [
-                circmean(np.random.choice(2 * ang_shift, size=len(ang_shift)))
-                for i in range(n_resamples)
-            ]
-            low = np.percentile(bsmu, 100 - conflevel) / 2 + mu - np.pi / 2
-            high = np.percentile(bsmu, conflevel) / 2 + mu - np.pi / 2
+            ang_shift = 2 * (ang + np.pi / 2 - mu)
         else:
             mu = circmean(ang)
             ang_shift = ang + np.pi - mu
-            bsmu = [
-                circmean(np.random.choice(ang_shift, size=len(ang_shift)))
-                for i in range(n_resamples)
-            ]
+        # bootstrap samples as rows of index matrix drawn in chunks, so index,
+        # gathered angles and temporaries stay within memory budget
+        rng = _random_state(kwargs.pop("seed"))
+        n = len(ang)
+        chunk = max(1, apsg_conf["max_memory"] // (32 * n))
+        bsmu = []
+        for start in range(0, n_resamples, chunk):
+            idx = rng.choice(n, size=(min(chunk, n_resamples - start), n))
+            bsmu.append(circmean(ang_shift[idx], axis=1))
+        bsmu = np.concatenate(bsmu)
+        # calculate CI
+        if self._kwargs["axial"]:
+            low = np.percentile(bsmu, 100 - conflevel) / 2 + mu - np.pi / 2
+            high = np.percentile(bsmu, conflevel) / 2 + mu - np.pi / 2
+        else:
             low = np.percentile(bsmu, (100 - conflevel) / 2) + mu - np.pi
             high = np.percentile(bsmu, 100 - (100 - conflevel) / 2) + mu - np.pi
         radii = []
@@ -6,6 +6,7 @@ import matplotlib.pyplot as plt
 from apsg.config import apsg_conf
 from apsg.feature._geodata import Lineation
 from apsg.feature._container import Vector3Set
+from apsg.feature._statistics import estimate_k
 from apsg.plotting._projection import EqualAreaProj, EqualAngleProj
 
 
@@ -93,8 +94,10 @@ class StereoGrid:
         The modified Kamb contouring technique with exponential smoothing is used.
 
         Args:
-            sigma (float): if none sigma is calculated automatically.
-              Default None
+            sigma (float): if none sigma is calculated automatically from
+              kernel concentration maximizing leave-one-out likelihood of data.
+              For more than ``apsg_conf["estimate_k_max_n"]`` features it is
+              estimated from subsample. See ``estimate_k``. Default None
             sigmanorm (bool): If True counting is normalized to sigma
               multiples. Default True
             trimzero: if True, zero contour is not drawn. Default True
@@ -105,10 +108,11 @@ class StereoGrid:
         self.features = np.atleast_2d(features)
         n = len(self.features)
         if sigma is None:
-            # k = estimate_k(features)
-            # sigma = np.sqrt(2 * n / (k - 2))
-            # Totally empirical as estimate_k is problematic
-            if n < 10:
+            k = estimate_k(self.features)
+            if k > 2:
+                sigma = np.sqrt(2 * n / (k - 2))
+            elif n < 10:
+                # Totally empirical for data without any preferred orientation
                 sigma = 3
             else:
                 sigma = np.sqrt(2 * n / (np.log(n) - 2)) / 3
@@ -168,6 +172,26 @@ class StereoGrid:
             self.values[i] = func(self.grid[i], *args, **kwargs)
         self.calculated = True
 
+    def apply_vectorized(self, func, *args, **kwargs):
+        """Calculate values of vectorized function on sphere in single call.
+
+        Function must accept ``Vector3Set`` of all grid points as first argument
+        and return array of values, e.g. ``Stress3.slip_tendency``.
+
+        Args:
+            func (function): function used to calculate values
+            *args: passed to function func as args
+            **kwargs: passed to function func as kwargs
+
+        Example:
+            >>> S = stress.from_comp(xx=-5, yy=-2, zz=10, xy=4)
+            >>> s = StereoGrid()
+            >>> s.apply_vectorized(S.slip_tendency, fp=1)
+
+        """
+        self.values[:] = func(self.grid, *args, **kwargs)
+        self.calculated = True
+
     def contourf(self, *args, **kwargs):
         """
         Draw filled contours of values using tricontourf.
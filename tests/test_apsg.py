@@ -15,13 +15,24 @@ Proper unit tests should fail for exactly one reason
 """
 
 
+from itertools import combinations
+from concurrent.futures import ProcessPoolExecutor
+
 import pytest
 import numpy as np
+from scipy.special import hyp1f1
 
 from apsg.config import apsg_conf
 from apsg import vec, fol, lin, fault, pair
-from apsg import vecset, linset, folset
+from apsg import vec2set, vecset, linset, folset, pairset, faultset
 from apsg import defgrad
+from apsg.math import compose_rotations
+from apsg.helpers import spawn_generators
+from apsg.feature import FisherAccumulator, kent_log_normalize
+from apsg.feature import watson_log_normalize, bingham_log_normalize
+from apsg.feature import rayleigh_test, bingham_test, gine_test, watson_two_sample
+from apsg.feature._statistics import estimate_k, _bingham_log_f_quad
+from apsg import StereoGrid
 
 atol = 1e-05  # safe tests
 
@@ -354,6 +365,38 @@ class TestVector:
 
         assert len(w) == 3
 
+    def test_that_construction_paths_give_same_coords(self):
+        expects = vec(np.array([0.5, -1.0, 2.0]))
+
+        assert vec(0.5, -1.0, 2.0)._coords == expects._coords
+        assert vec((0.5, -1.0, 2.0))._coords == expects._coords
+        assert vec([0.5, -1.0, 2.0])._coords == expects._coords
+        assert vec(expects)._coords == expects._coords
+        assert all(type(c) is float for c in vec(lin(120, 30))._coords)
+
+    def test_arithmetic_with_arrays_and_scalars(self):
+        w = vec(1, 2, 3)
+
+        assert w + np.array([1, 1, 1]) == vec(2, 3, 4)
+        assert 2 * w == w * 2.0 == vec(2, 4, 6)
+        assert w / 2 == vec(0.5, 1, 1.5)
+        assert type(lin(w) + w) is type(lin(w))
+
+    def test_rotation_matches_rotation_matrix(self):
+        v, axis = vec(1, 2, -1), vec(-2, 1, 3)
+        R = defgrad.from_axisangle(axis, 37)
+
+        assert np.allclose(v.rotate(axis, 37), np.dot(R, v))
+
+    def test_composed_rotations_match_sequential_rotations(self):
+        v = vec(1, 2, -1)
+        steps = [(lin(120, 30), 45), (vec("z"), -90), (fol(30, 40), 17)]
+        expects = v
+        for axis, theta in steps:
+            expects = expects.rotate(axis, theta)
+
+        assert np.allclose(np.dot(compose_rotations(*steps), v), expects)
+
 
 # ############################################################################
 # lineation
@@ -553,6 +596,291 @@ class TestVector3Set:
         el = gc.ortensor().eigenlins
         assert el[0] == vec("x") and el[1] == vec("y") and el[2] == vec("z")
 
+    def test_random_fisher_seed(self):
+        g = vecset.random_fisher(n=20, seed=42)
+        assert np.allclose(g, vecset.random_fisher(n=20, seed=42))
+        rng = np.random.default_rng(42)
+        assert np.allclose(g, vecset.random_fisher(n=20, seed=rng))
+
+    def test_random_fisher_concentration(self):
+        g = vecset.random_fisher(n=20000, position=lin(40, 50), kappa=50, seed=1)
+        assert np.allclose(np.linalg.norm(g, axis=1), 1)
+        assert np.isclose(g.fisher_statistics()["k"], 50, rtol=0.05)
+        assert g.R().angle(lin(40, 50)) < 1
+
+    def test_random_kent_high_concentration(self):
+        p = pair(150, 40, 150, 40)
+        g = vecset.random_kent(p, n=20000, kappa=1000, beta=300, seed=1)
+        assert np.allclose(g, vecset.random_kent(p, 20000, 1000, 300, seed=1))
+        assert g.R().angle(p.lvec) < 0.1
+        # variances of tangent components for concentrated Kent distribution
+        x = np.asarray(g) @ np.asarray(p.fvec.cross(p.lvec))
+        y = np.asarray(g) @ np.asarray(p.fvec)
+        assert np.isclose(np.var(x) * 1000, 1 / (1 - 2 * 300 / 1000), rtol=0.05)
+        assert np.isclose(np.var(y) * 1000, 1 / (1 + 2 * 300 / 1000), rtol=0.05)
+
+    def test_fit_kent(self):
+        p = pair(150, 40, 150, 40)
+        g = vecset.random_kent(p, n=2000, kappa=30, beta=10, seed=3)
+        kd = g.fit_kent()
+        assert np.isclose(kd.kappa, 30, rtol=0.1)
+        assert np.isclose(kd.beta, 10, rtol=0.2)
+        assert vec(kd.gamma1).angle(p.lvec) < 2
+        # gradient of log likelihood vanishes at estimate
+        assert np.allclose(
+            kd.log_likelihood_prime(np.asarray(g)) / len(g), 0, atol=1e-4
+        )
+        moment = g.fit_kent(method="moment")
+        assert kd.log_likelihood(np.asarray(g)) >= moment.log_likelihood(np.asarray(g))
+
+    def test_kent_log_normalize(self):
+        kappa, beta = np.array([1, 10, 50, 1e5]), np.array([0.3, 4.9, 20, 4e4])
+        logc, dlogc = kent_log_normalize(kappa, beta, return_prime=True)
+        # large kappa asymptotic (Kent, 1982)
+        expects = np.log(2 * np.pi) + 1e5 - np.log(1e10 - 64e8) / 2
+        assert np.isclose(logc[-1], expects)
+        h = 1e-6
+        dk = kent_log_normalize(kappa + h, beta) - kent_log_normalize(kappa - h, beta)
+        assert np.allclose(dlogc[0][:3], dk[:3] / (2 * h), rtol=1e-5)
+
+    def test_fit_watson_girdle(self):
+        g = folset.random_watson(position=lin(120, 40), kappa=-30, n=2000, seed=5)
+        wd = g.fit_watson()
+        assert np.isclose(wd.kappa, -30, rtol=0.1)
+        assert lin(wd.mu).angle(lin(120, 40)) < 2
+
+    def test_watson_log_normalize(self):
+        kappa = np.array([-500, -10, -1e-6, 0, 1e-6, 10, 500])
+        logc, dlogc = watson_log_normalize(kappa, return_prime=True)
+        assert np.allclose(logc, np.log(4 * np.pi * hyp1f1(0.5, 1.5, kappa)))
+        h = 1e-5
+        dk = watson_log_normalize(kappa + h) - watson_log_normalize(kappa - h)
+        assert np.allclose(dlogc, dk / (2 * h), rtol=1e-5)
+
+    def test_fit_bingham(self):
+        p = pair(150, 40, 150, 40)
+        g = folset.random_bingham(p, n=3000, kappa2=5, kappa3=50, seed=7)
+        bd = g.fit_bingham()
+        assert np.isclose(bd.kappa2, 5, rtol=0.15)
+        assert np.isclose(bd.kappa3, 50, rtol=0.1)
+        assert lin(bd.gamma1).angle(lin(p.lvec)) < 5
+
+    def test_bingham_log_normalize_table(self):
+        rng = np.random.default_rng(11)
+        a, b = np.expm1(rng.uniform(0, np.log(1e4), (2, 20)))
+        expects = np.log(4 * np.pi) + [_bingham_log_f_quad(*ab) for ab in zip(a, b)]
+        assert np.allclose(bingham_log_normalize(a, b), expects, rtol=0, atol=1e-6)
+        # Watson distributions are special cases and concentrations above
+        # table are extended by asymptotic expansion
+        k = np.array([0.5, 50, 5e3, 5e4])
+        assert np.allclose(bingham_log_normalize(0, k), watson_log_normalize(-k))
+        assert np.allclose(bingham_log_normalize(k, k), watson_log_normalize(k) - k)
+
+    def test_bingham_pdf_normalized(self):
+        p = pair(150, 40, 150, 40)
+        bd = folset.random_bingham(p, n=500, seed=1).fit_bingham()
+        grid = np.asarray(vecset.uniform_gss(n=50000))
+        assert np.isclose(bd.pdf(grid).mean() * 4 * np.pi, 1, rtol=1e-3)
+
+    def test_array_is_not_copied(self):
+        g = vecset.random_fisher(n=10)
+        assert np.shares_memory(np.asarray(g), np.asarray(g))
+
+    def test_array_is_read_only(self):
+        g = vecset.random_fisher(n=10)
+        with pytest.raises(ValueError):
+            np.asarray(g)[0, 0] = 1
+
+    def test_from_array_does_not_freeze_caller_array(self):
+        arr = np.array([[1.0, 0, 0], [0, 1, 0]])
+        g = vecset._from_array(arr)
+        assert arr.flags.writeable
+        arr[0, 0] = 5
+        assert np.asarray(g)[0, 0] == 1
+
+    def test_indexing_returns_features(self):
+        g = folset.from_array([120, 130, 140], [10, 20, 30])
+        assert isinstance(g[1], fol) and g[1] == fol(130, 20)
+        assert isinstance(g[1:], folset) and len(g[1:]) == 2
+        assert isinstance(g[np.array([0, 2])], folset)
+        assert g[np.array([False, True, False])][0] == fol(130, 20)
+
+    def test_iteration_returns_features(self):
+        g = linset.from_array([120, 130, 140], [10, 20, 30])
+        assert all(isinstance(e, lin) for e in g)
+
+    def test_vectorized_methods_match_features(self):
+        g = vecset.random_fisher(n=20, kappa=3)
+        v = lin(30, 20)
+        assert np.allclose(g.dot(v), [e.dot(v) for e in g])
+        assert np.allclose(g.angle(v), [e.angle(v) for e in g])
+        assert np.allclose(g.rotate(v, 33), [np.asarray(e.rotate(v, 33)) for e in g])
+        assert np.allclose(g.reject(v), [np.asarray(e.reject(v)) for e in g])
+
+    def test_axial_vectorized_methods_match_features(self):
+        g = folset.random_fisher(n=20, kappa=3)
+        v = lin(30, 20)
+        F = defgrad.from_comp(xx=2, xy=1, zz=0.5)
+        assert np.allclose(g.dot(v), [e.dot(v) for e in g])
+        assert np.allclose(g.project(v), [np.asarray(e.project(v)) for e in g])
+        assert np.allclose(g.angle(), [e.angle(f) for e, f in combinations(g, 2)])
+        assert np.allclose(g.transform(F), [np.asarray(e.transform(F)) for e in g])
+
+    def test_axial_cross_type(self):
+        assert isinstance(linset.random_fisher(n=5).cross(lin(0, 0)), folset)
+        assert isinstance(folset.random_fisher(n=5).cross(), linset)
+
+    def test_from_array_matches_features(self):
+        azi, inc = np.array([120, 215, 330]), np.array([10, 55, 80])
+        g = folset.from_array(azi, inc)
+        expects = [np.asarray(fol(a, i)) for a, i in zip(azi, inc)]
+        assert np.allclose(g, expects)
+        assert np.allclose(g.geo, (azi, inc))
+
+    def test_from_array_rhr_notation(self):
+        apsg_conf["notation"] = "rhr"
+        g = folset.from_array([30, 125], [10, 55])
+        current = [e.geo for e in g]
+        azi, inc = g.geo
+        apsg_conf["notation"] = "dd"
+        assert np.allclose(np.transpose(current), [azi, inc])
+
+    def test_add_keeps_type(self):
+        g = linset.from_array([120, 130], [10, 20])
+        h = linset.from_array([140], [30])
+        assert isinstance(g + h, linset) and len(g + h) == 3
+
+    @pytest.mark.parametrize("cls", [vecset, linset, folset])
+    def test_pairwise_angles_match_features(self, cls):
+        g = cls.random_fisher(n=30, kappa=1)
+        expects = [e.angle(f) for e, f in combinations(g, 2)]
+        assert np.allclose(g.angle(max_memory=1000), expects)
+
+    def test_pairwise_angles_dtype(self):
+        g = linset.random_fisher(n=30)
+        current = g.angle(dtype=np.float32)
+        assert current.dtype == np.float32 and np.allclose(current, g.angle())
+
+    @pytest.mark.parametrize("cls", [vecset, linset, folset])
+    def test_halfspace(self, cls):
+        g = cls.random_fisher(n=100, kappa=0.5)
+        h = g.halfspace()
+        r = np.asarray(h).sum(axis=0)
+        assert type(h) is cls and np.all(np.asarray(h) @ r >= 0)
+
+    @pytest.mark.parametrize("cls", [vecset, linset])
+    def test_bootstrap_statistics_match_samples(self, cls):
+        g = cls.random_fisher(n=50, position=lin(120, 40), kappa=5)
+        np.random.seed(42)
+        current = g.bootstrap_statistics(n=20, max_memory=10000)
+        np.random.seed(42)
+        samples = list(g.bootstrap(n=20))
+        expects_R = [s.R() for s in samples]
+        expects_a95 = [s.fisher_statistics()["a95"] for s in samples]
+        expects_E = [s.ortensor().eigenvalues() for s in samples]
+        assert (
+            np.allclose(current["R"], expects_R)
+            and np.allclose(current["a95"], expects_a95)
+            and np.allclose(current["eigenvalues"], expects_E)
+        )
+
+    def test_centered_with_max_vertical(self):
+        g = linset.random_fisher(n=50, position=lin(120, 40), kappa=5)
+        current = g.centered(max_vertical=True)
+        expects = g.centered().rotate(vec(0, -1, 0), 90)
+        assert type(current) is linset and np.allclose(current, expects)
+
+    def test_internal_paths_do_not_create_features(self, monkeypatch):
+        F = defgrad.from_axisangle(lin(0, 90), 20)
+        axis = lin(45, 45)
+        calls = []
+        original = vec.__init__
+
+        def counting_init(self, *args):
+            calls.append(args)
+            original(self, *args)
+
+        def chain(g):
+            r = g.rotate(axis, 30).transform(F)
+            r = r[::2][np.array([0, 2, 4])].normalized().to_fol().halfspace()
+            return (r + r).copy()
+
+        small, large = linset.random_fisher(n=50), linset.random_fisher(n=500)
+        monkeypatch.setattr(vec, "__init__", counting_init)
+        chain(small)
+        n_small = len(calls)
+        chain(large)
+        assert len(calls) == 2 * n_small
+
+    @pytest.mark.parametrize(
+        "create",
+        [
+            lambda seed: vec2set.random(10, seed=seed),
+            lambda seed: vec2set.random_vonmises(10, seed=seed),
+            lambda seed: vecset.random_normal(10, seed=seed),
+            lambda seed: vecset.random_fisher2(10, seed=seed),
+            lambda seed: pairset.random(10, seed=seed),
+            lambda seed: faultset.random(10, seed=seed),
+            lambda seed: list(linset.uniform_gss(n=20).bootstrap(3, seed=seed))[-1],
+        ],
+    )
+    def test_random_constructors_accept_seed(self, create):
+        a = np.asarray(create(np.random.SeedSequence(4)))
+        assert np.array_equal(a, np.asarray(create(4)))
+        assert np.array_equal(a, np.asarray(create(np.random.default_rng(4))))
+        assert not np.array_equal(a, np.asarray(create(5)))
+
+    def test_sharded_simulation_is_reproducible(self):
+        seeds = spawn_generators(42, 6)
+        serial = [_simulation(s) for s in spawn_generators(42, 6)]
+        with ProcessPoolExecutor(2) as pool:
+            pooled = list(pool.map(_simulation, seeds))
+        assert np.array_equal(serial, pooled)
+        assert len(np.unique(serial)) == 6
+
+    def test_spawn_generators_from_generator(self):
+        rng = np.random.default_rng(42)
+        children = spawn_generators(rng, 3)
+        assert all(isinstance(g, np.random.Generator) for g in children)
+        expects = [_simulation(s) for s in spawn_generators(42, 3)]
+        assert np.array_equal([_simulation(g) for g in children], expects)
+        # next spawn gives new streams
+        assert not np.array_equal(
+            [_simulation(g) for g in spawn_generators(rng, 3)], expects
+        )
+
+    def test_uniformity_tests_reject_fabric(self):
+        g = folset.random_watson(n=100, position=lin(120, 40), kappa=-10, seed=2)
+        assert bingham_test(g)["pvalue"] < 0.001
+        assert gine_test(g, n_resamples=199, seed=1)["pvalue"] == 0.005
+        assert rayleigh_test(vecset.random_fisher(n=50, seed=2))["pvalue"] < 0.001
+
+    @pytest.mark.parametrize("test", [rayleigh_test, bingham_test, gine_test])
+    def test_uniformity_tests_monte_carlo(self, test):
+        g = vecset.random_fisher(n=40, kappa=1e-9, seed=4)
+        res = test(g, n_resamples=500, seed=3)
+        # null distribution does not depend on chunking of samples
+        chunked = test(g, n_resamples=500, seed=3, max_memory=50000)
+        assert np.isclose(res["statistic"], chunked["statistic"])
+        assert res["pvalue"] == chunked["pvalue"]
+        if test is not gine_test:
+            # Monte Carlo and asymptotic p-values agree
+            assert np.isclose(res["pvalue"], test(g)["pvalue"], atol=0.05)
+
+    def test_watson_two_sample(self):
+        g1 = vecset.random_fisher(n=30, position=lin(120, 40), seed=1)
+        g2 = vecset.random_fisher(n=30, position=lin(135, 50), seed=2)
+        res = watson_two_sample(g1, g2, seed=1)
+        assert res["pvalue"] < 0.01
+        assert res == watson_two_sample(g1, g2, seed=1, max_memory=1000)
+        assert np.isclose(
+            watson_two_sample(g1, g2, n_resamples=None)["pvalue"],
+            res["pvalue"],
+            atol=0.01,
+        )
+        g3 = linset.random_fisher(n=30, position=lin(120, 40), seed=3)
+        assert watson_two_sample(g1.to_lin(), g3, seed=1)["pvalue"] > 0.05
+
 
 class TestLineationSet:
     def test_rdegree_under_rotation(self):
@@ -582,6 +910,80 @@ class TestLineationSet:
         el = gc.ortensor().eigenlins
         assert el[0] == vec("x") and el[1] == vec("y") and el[2] == vec("z")
 
+    def test_resultant_matches_sum_of_features(self):
+        g = linset.random_fisher(position=lin(40, 50), kappa=1)
+        assert np.allclose(g.R(), sum(g))
+
+    def test_derived_statistics_are_cached(self):
+        g = linset.random_fisher(position=lin(40, 50))
+        g.fisher_statistics(), g.var(), g.rdegree(), g.fisher_cone_a95()
+        misses = g.cache_info()["misses"]
+        g.fisher_statistics(), g.var(), g.rdegree(), g.fisher_cone_csd()
+        info = g.cache_info()
+        assert info["misses"] == misses and info["hits"] > 0
+
+    def test_cached_fisher_statistics_are_not_shared(self):
+        g = linset.random_fisher(position=lin(40, 50))
+        g.fisher_statistics()["k"] = 0
+        assert g.fisher_statistics()["k"] > 0
+
+    def test_estimate_k_maximizes_leave_one_out_likelihood(self):
+        g = linset.random_fisher(n=200, position=lin(40, 50), kappa=20, seed=1)
+        c = np.abs(np.asarray(g) @ np.asarray(g).T)
+        np.fill_diagonal(c, -np.inf)
+
+        def loglik(k):
+            W = np.exp(k * (c - 1)) * k / (2 * np.pi * (1 - np.exp(-2 * k)))
+            return np.log(W.sum(axis=1)).sum()
+
+        k = estimate_k(g)
+        assert loglik(k) > max(loglik(0.99 * k), loglik(1.01 * k))
+        # memory-bounded blocks give same result
+        assert np.isclose(estimate_k(g, max_memory=24 * 200 * 7), k)
+
+    def test_density_sigma_from_estimate_k(self):
+        g = linset.random_fisher(n=100, position=lin(40, 50), kappa=20, seed=1)
+        s = StereoGrid(grid_n=200)
+        s.calculate_density(g)
+        k = estimate_k(g)
+        assert np.isclose(s.density_params[2], np.sqrt(2 * 100 / (k - 2)))
+
+    def test_estimate_k_from_subsample(self):
+        g = linset.random_fisher(n=800, position=lin(40, 50), kappa=20, seed=1)
+        k = estimate_k(g)
+        current = estimate_k(g, max_n=400)
+        # subsample is reproducible and rescaled estimate is close to full one
+        assert current == estimate_k(g, max_n=400)
+        assert 0.7 < current / k < 1.4
+
+    def test_fisher_accumulator_match_batch_statistics(self):
+        g = linset.random_fisher(n=300, position=lin(40, 50), kappa=5)
+        acc = FisherAccumulator(axial=True)
+        for i in range(0, len(g), 70):
+            acc.update(g[i : i + 70])
+        assert acc.n == len(g)
+        expects = g.fisher_statistics()
+        current = acc.fisher_statistics()
+        assert all(np.isclose(current[key], expects[key]) for key in expects)
+        assert np.isclose(acc.var(), g.var())
+        assert np.isclose(acc.delta(), g.delta())
+        assert np.isclose(acc.rdegree(), g.rdegree())
+
+    def test_fisher_accumulator_merge(self):
+        g = vecset.random_fisher(n=300, position=lin(40, 50), kappa=5)
+        acc = FisherAccumulator(g[:100]).merge(FisherAccumulator(g[100:]))
+        assert np.isclose(acc.fisher_statistics()["k"], g.fisher_statistics()["k"])
+        assert all(type(v) is float for v in acc.fisher_statistics().values())
+
+    def test_fisher_accumulator_merge_axial(self):
+        g = linset.random_fisher(n=200, position=lin(40, 50), kappa=5)
+        acc = FisherAccumulator(axial=True).merge(FisherAccumulator(g, axial=True))
+        expects = g.fisher_statistics()
+        current = acc.fisher_statistics()
+        assert all(np.isclose(current[key], expects[key]) for key in expects)
+        with pytest.raises(ValueError):
+            acc.merge(FisherAccumulator(g[:10], axial=True))
+
 
 # ############################################################################
 # pair
@@ -599,6 +1001,22 @@ class Testpair:
         assert np.allclose([p.fvec.angle(p.lvec), pr.fvec.angle(pr.lvec)], [90, 90])
 
 
+class TestPairSet:
+    def test_from_array_matches_pairs(self):
+        p = pairset.from_array([120, 250], [30, 60], [110, 200], [26, 50])
+        expects = [pair(120, 30, 110, 26), pair(250, 60, 200, 50)]
+        assert p[0] == expects[0] and p[1] == expects[1]
+
+    def test_misfit_array(self):
+        p = pairset([pair(120, 30, 110, 26), pair(250, 60, 200, 50)])
+        assert np.allclose(p.misfit, [e.misfit for e in p])
+
+    def test_rotate_matches_pairs(self):
+        p = pairset.random(10)
+        pr = p.rotate(lin(45, 45), 120)
+        assert all(a == b.rotate(lin(45, 45), 120) for a, b in zip(pr, p))
+
+
 # ############################################################################
 # fault
 # ############################################################################
@@ -621,3 +1039,34 @@ class Testfault:
     def test_fault_p_axis(self):
         f = fault(150, 30, 150, 30, -1)
         assert f.p == lin(330, 15)
+
+
+class TestFaultSet:
+    @pytest.fixture
+    def faults(self):
+        return faultset.from_array(
+            [90, 150, 150, 240],
+            [30, 60, 30, 80],
+            [110, 150, 150, 290],
+            [28, 60, 30, 60],
+            [-1, 1, -1, 1],
+        )
+
+    def test_sense_array(self, faults):
+        assert faults.sense.dtype == np.int8 and list(faults.sense) == [
+            f.sense for f in faults
+        ]
+
+    @pytest.mark.parametrize("axis", ["p", "t", "m", "d"])
+    def test_kinematic_axes_match_faults(self, faults, axis):
+        expects = [getattr(f, axis) for f in faults]
+        assert all(a == b for a, b in zip(getattr(faults, axis), expects))
+
+    def test_rotation_sense(self, faults):
+        fr = faults.rotate(lin(220, 10), 60)
+        assert repr(fr[0]) == "F:343/37-301/29 +"
+
+
+def _simulation(seed):
+    g = linset.random_fisher(n=20, position=lin(120, 40), kappa=10, seed=seed)
+    return g.bootstrap_statistics(n=10, seed=seed)["k"].mean()
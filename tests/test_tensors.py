@@ -8,9 +8,12 @@ import numpy as np
 
 from apsg.math import Matrix3
 from apsg import vec
-from apsg import lin, fol, vecset
-from apsg import defgrad, velgrad, stress, ortensor
-from apsg import defgrad2, velgrad2
+from apsg import lin, fol, vecset, linset
+from apsg import defgrad, velgrad, stress, ortensor, ellipsoid
+from apsg import defgrad2, velgrad2, ellipse
+from apsg import ellipsoidset, ortensorset, ellipseset, matrixset, defgradset, stressset
+from apsg import folset, StereoGrid
+from apsg.feature import OrientationTensor3Accumulator
 
 # Matrix3 type is value object => structural equality
 
@@ -102,3 +105,155 @@ def test_stress_invariants_under_rotation():
     R = defgrad.from_axisangle(k, a)
     Sr = S.transform(R)
     assert np.allclose([S.I1, S.I2, S.I3], [Sr.I1, Sr.I2, Sr.I3])
+
+
+# Tensor sets
+
+
+def test_ellipsoidset_shape_parameters_match_ellipsoids():
+    es = [ellipsoid.from_defgrad(defgrad.from_comp(xy=a, zy=0.5)) for a in (-1, 1, 2)]
+    E = ellipsoidset(es)
+    for p in ["strength", "shape", "k", "lode", "goct", "MAD", "Intensity"]:
+        assert np.allclose(getattr(E, p), [getattr(e, p) for e in es])
+
+
+def test_ortensorset_eigenvalues_match_ortensors():
+    ots = [linset.random_fisher(kappa=k).ortensor() for k in (5, 10, 20)]
+    O = ortensorset(ots)
+    assert np.allclose(O.eigenvalues(), [ot.eigenvalues() for ot in ots])
+
+
+def test_ellipseset_orientation_match_ellipses():
+    es = [ellipse.from_defgrad(defgrad2.from_comp(xy=a)) for a in (-1, 0.5, 2)]
+    assert np.allclose(ellipseset(es).orientation, [e.orientation for e in es])
+
+
+def test_defgradset_algebra_match_defgrads():
+    Fs = [
+        defgrad.from_comp(xx=2, xy=a, zz=0.5) @ defgrad.from_axisangle(lin(120, 30), a)
+        for a in (-1, 1, 2)
+    ]
+    F = defgradset(Fs)
+    for p in ["R", "U", "V", "I", "T"]:
+        assert np.allclose(getattr(F, p), [getattr(f, p) for f in Fs])
+    assert np.allclose(F.det, [f.det for f in Fs])
+
+
+def test_matrixset_broadcast_against_vectors():
+    Fs = [defgrad.from_axisangle(lin(120, 30), a) for a in (10, 45, 90)]
+    F = defgradset(Fs)
+    v = vecset([vec(1, 0, 0), vec(0, 1, 0), vec(1, 1, 1)])
+    assert np.allclose(F @ v, [f @ u for f, u in zip(Fs, v)])
+    assert np.allclose(F @ vec(0, 0, 1), [f @ vec(0, 0, 1) for f in Fs])
+    assert np.allclose(v.transform(F), [u.transform(f) for f, u in zip(Fs, v)])
+
+
+def test_foliationset_transform_by_matrixset():
+    Fs = [defgrad.from_comp(xx=2, zz=0.5, xy=1), defgrad.from_comp(yy=3, xz=-1)]
+    f = folset([fol(120, 30), fol(250, 70)])
+    r = f.transform(defgradset(Fs), norm=True)
+    assert type(r) is folset and len(r) == 2
+    expects = np.array([u.transform(F) for F, u in zip(Fs, f)])
+    assert np.allclose(f.transform(defgradset(Fs)), expects)
+    assert np.allclose(r, expects / np.linalg.norm(expects, axis=1)[:, None])
+
+
+def test_matrixset_products_with_single_matrix():
+    R = defgrad.from_axisangle(lin(45, 45), 30)
+    M = matrixset(np.array([np.eye(3), np.diag([2.0, 1.0, 0.5])]))
+    assert isinstance(R @ M, type(M))
+    assert np.allclose(R @ M, [R @ m for m in M])
+    assert np.allclose(M.transform(R), [m.transform(R) for m in M])
+
+
+def test_velgrad_path_match_matrix_exponential():
+    from scipy.linalg import expm
+
+    L = velgrad(np.array([[0.1, 1, 0], [0, 0, 0.2], [0, 0, -0.1]]))
+    F = L.defgrad(time=3, steps=101)
+    expects = [expm(np.asarray(L) * t) for t in np.linspace(0, 3, 101)]
+    assert isinstance(F, defgradset)
+    assert np.allclose(F, expects)
+
+
+def test_velgrad_lazy_path_match_full_path():
+    L = velgrad(np.array([[0.1, 1, 0], [0, 0, 0.2], [0, 0, -0.1]]))
+    chunks = list(L.defgrad_path(time=3, steps=101, chunksize=30))
+    assert [len(c) for c in chunks] == [30, 30, 30, 11]
+    assert np.allclose(np.concatenate(chunks), L.defgrad(time=3, steps=101))
+
+
+def test_kinematic_vorticity():
+    assert np.isclose(velgrad(np.diag([0.1, 0, -0.1])).kinematic_vorticity, 0)
+    simple_shear = velgrad(np.array([[0, 1, 0], [0, 0, 0], [0, 0, 0]]))
+    assert np.isclose(simple_shear.kinematic_vorticity, 1)
+
+
+def test_deformation_path_derived_quantities():
+    L = velgrad(np.array([[0, 1, 0], [0, 0, 0], [0, 0, 0]]))
+    F = L.defgrad(time=2, steps=5)
+    E = ellipsoidset.from_defgrad(F[1:])
+    assert np.allclose(E.lode, [ellipsoid.from_defgrad(f).lode for f in F[1:]])
+    markers = linset([lin(120, 30), lin(200, 10)])
+    for f, m in zip(F, F.transform_features(markers)):
+        assert np.allclose(m, markers.transform(f))
+    planes = folset([fol(120, 30), fol(200, 60)])
+    for f, m in zip(F, F.transform_features(planes, norm=True)):
+        assert type(m) is folset
+        assert np.allclose(m, planes.transform(f, norm=True))
+    for f, m in zip(F, F.transform_features(np.asarray(markers))):
+        assert type(m) is vecset and np.allclose(m, markers.transform(f))
+
+
+def test_stress_methods_accept_folset():
+    S = stress.from_comp(xx=-5, yy=-2, zz=10, xy=8, yz=-1)
+    F = folset([fol(160, 30), fol(20, 75), fol(250, 10)])
+    for m in ["normal_stress", "shear_stress", "slip_tendency", "dilation_tendency"]:
+        assert np.allclose(getattr(S, m)(F), [getattr(S, m)(f) for f in F])
+    assert np.allclose(S.cauchy(F), [S.cauchy(f) for f in F])
+    assert np.allclose(S.fault(np.asarray(F)), [S.fault(f) for f in F])
+
+
+def test_stressset_batches_over_stresses():
+    Ss = [stress.from_comp(xx=-5, yy=-2, zz=10, xy=a, xz=-a / 2) for a in range(4)]
+    F = folset([fol(160, 30), fol(20, 75), fol(250, 10)])
+    S = stressset(Ss)
+    current = S.slip_tendency(F, fp=0.5)
+    assert current.shape == (4, 3)
+    assert np.allclose(current, [s.slip_tendency(F, fp=0.5) for s in Ss])
+    assert np.allclose(
+        S.dilation_tendency(fol(160, 30)),
+        [s.dilation_tendency(fol(160, 30)) for s in Ss],
+    )
+
+
+def test_stereogrid_apply_vectorized():
+    S = stress.from_comp(xx=-5, yy=-2, zz=10, xy=4)
+    current, expects = StereoGrid(grid_n=200), StereoGrid(grid_n=200)
+    current.apply_vectorized(S.slip_tendency, fp=1)
+    expects.apply_func(S.slip_tendency, fp=1)
+    assert np.allclose(current.values, expects.values)
+
+
+def test_stress_inversion_recovers_stress():
+    S = stress.from_comp(xx=-5, yy=-2, zz=-1, xy=1, yz=0.5)
+    f = S.fault(folset.uniform_gss(n=60)[::2])
+    res = f.stress_inversion(n_axes=200, n_spin=12)
+    assert np.isclose(res["R"], S.shape_ratio, atol=0.02)
+    assert lin(res["stress"].sigma1dir).angle(lin(S.sigma1dir)) < 2
+    assert lin(res["stress"].sigma3dir).angle(lin(S.sigma3dir)) < 2
+    assert res["misfit"] < 2
+    assert len(res["region"]) == len(res["region_misfit"])
+    pooled = f.stress_inversion(n_axes=200, n_spin=12, processes=2)
+    assert np.isclose(pooled["misfit"], res["misfit"])
+
+
+def test_ortensor_accumulator_match_batch():
+    g = linset.random_fisher(n=500, position=lin(120, 50))
+    a = np.asarray(g)
+    first = OrientationTensor3Accumulator(g[:200])
+    rest = OrientationTensor3Accumulator()
+    rest.update((row for row in a[200:].tolist()), chunksize=64)
+    current = first.merge(rest).ortensor()
+    assert first.n == len(g)
+    assert np.allclose(current, ortensor.from_features(g))